@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+asyncio FIFO queue on top of `LinkedList`, with optional backpressure,
+batched draining and close() semantics.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any, List, Optional
+
+from linkedlist import LinkedList
+
+
+class QueueClosed(Exception):
+    """Raised by `put` after `close`, and by `get` once closed and drained."""
+
+
+class AsyncLinkedQueue:
+    """
+    FIFO queue for coroutines, storing items in a `LinkedList`.
+
+    Mirrors `asyncio.Queue` (`put`, `get` and their ``_nowait`` forms;
+    ``maxsize > 0`` makes `put` wait while full) and adds:
+
+    * `get_batch`, which takes up to `n` items per wakeup, so a consumer
+      under heavy fan-in is scheduled once per batch rather than per item;
+    * `close`, after which `put` raises `QueueClosed` and getters drain
+      the remaining items, then raise `QueueClosed` too.
+
+    Not thread-safe: use it from one event loop.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize = maxsize
+        self._items = LinkedList()
+        self._getters: deque[asyncio.Future] = deque()
+        self._putters: deque[asyncio.Future] = deque()
+        self._closed = False
+
+    # -----------------------------------------------------------------
+    # State
+    # -----------------------------------------------------------------
+    def qsize(self) -> int:
+        return len(self._items)
+
+    __len__ = qsize
+
+    def empty(self) -> bool:
+        return self._items.head is None
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._items)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def __repr__(self) -> str:
+        state = "closed" if self._closed else "open"
+        return f"<AsyncLinkedQueue {state} maxsize={self.maxsize} qsize={self.qsize()}>"
+
+    # -----------------------------------------------------------------
+    # Producers
+    # -----------------------------------------------------------------
+    def put_nowait(self, item: Any) -> None:
+        """Append `item`; raise `asyncio.QueueFull` if there is no room."""
+        if self._closed:
+            raise QueueClosed
+        if 0 < self.maxsize <= len(self._items):
+            raise asyncio.QueueFull
+        self._items.push_back(item)
+        if self._getters:
+            self._wakeup_next(self._getters)
+
+    async def put(self, item: Any) -> None:
+        """Append `item`, waiting while the queue is full."""
+        while 0 < self.maxsize <= len(self._items) and not self._closed:
+            await self._wait(self._putters)
+        self.put_nowait(item)
+
+    # -----------------------------------------------------------------
+    # Consumers
+    # -----------------------------------------------------------------
+    def get_nowait(self) -> Any:
+        """Pop the oldest item; raise `asyncio.QueueEmpty` if there is none."""
+        if self._items.head is None:
+            if self._closed:
+                raise QueueClosed
+            raise asyncio.QueueEmpty
+        item = self._items.pop_front()
+        if self._putters:
+            self._wakeup_next(self._putters)
+        return item
+
+    async def get(self) -> Any:
+        """Pop the oldest item, waiting until one is available."""
+        while self._items.head is None and not self._closed:
+            await self._wait(self._getters)
+        return self.get_nowait()
+
+    async def get_batch(self, n: int, timeout: Optional[float] = None) -> List[Any]:
+        """Wait for at least one item, then pop up to `n` without waiting again.
+
+        Returns ``[]`` if `timeout` seconds pass with the queue still
+        empty; raises `QueueClosed` once the queue is closed and drained.
+        """
+        if n < 1:
+            raise ValueError("n must be positive")
+        if self._items.head is None and not self._closed:
+            try:
+                async with asyncio.timeout(timeout):
+                    while self._items.head is None and not self._closed:
+                        await self._wait(self._getters)
+            except TimeoutError:
+                return []
+
+        if self._items.head is None:
+            raise QueueClosed
+
+        items = self._items
+        pop = items.pop_front
+        batch = [pop() for _ in range(min(n, len(items)))]
+        for _ in batch:
+            if not (self._putters and self._wakeup_next(self._putters)):
+                break
+        return batch
+
+    # -----------------------------------------------------------------
+    # Shutdown
+    # -----------------------------------------------------------------
+    def close(self) -> None:
+        """Refuse new items and wake every waiter.
+
+        Waiting putters raise `QueueClosed`; getters receive the items
+        still queued, then raise `QueueClosed`.
+        """
+        self._closed = True
+        for waiters in (self._getters, self._putters):
+            while waiters:
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    # -----------------------------------------------------------------
+    # Helper methods (private)
+    # -----------------------------------------------------------------
+    @staticmethod
+    def _wakeup_next(waiters: deque) -> bool:
+        """Wake the first still-pending waiter; return whether there was one."""
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return True
+        return False
+
+    async def _wait(self, waiters: deque) -> None:
+        """Park on a new future in `waiters` until woken.
+
+        If cancelled after being woken, pass the wakeup on to the next
+        waiter of the same kind so it isn't lost.
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            if not waiter.cancelled():
+                self._wakeup_next(waiters)
+            raise
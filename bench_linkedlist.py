@@ -0,0 +1,1102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Micro-benchmarks for the LinkedList implementation.
+
+Run every benchmark, or only the named ones:
+
+    python bench_linkedlist.py
+    python bench_linkedlist.py stack_safe
+
+`scaling` times every LinkedList operation from n=10^2 up to 10^6 and
+fits its complexity. Store its numbers and fail later runs that regress:
+
+    python bench_linkedlist.py scaling --save-baseline baseline.json
+    python bench_linkedlist.py scaling --baseline baseline.json
+
+`concurrent` reports whether the GIL is on; run it under a free-threaded
+build (e.g. python3.13t) to measure the locks without the GIL.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import bisect
+import gc
+import json
+import math
+import os
+import pickle
+import random
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # optional: the ufunc rows are skipped
+    np = None
+
+from asynclinkedqueue import AsyncLinkedQueue
+from compactlinkedlist import CompactLinkedList
+from concurrentlinkedlist import ConcurrentLinkedList
+from instrumentation import instrument, instrumented, uninstrument
+from linkedlist import LinkedList, Node, NodePool
+from persistentlinkedlist import PersistentLinkedList
+from sortedlinkedlist import SortedLinkedList
+from unrolledlinkedlist import UnrolledLinkedList
+
+# Benchmarks print their own tables; those returning a dict also feed
+# --save-baseline / --baseline.
+BENCHMARKS: Dict[str, Callable[[], Optional[dict]]] = {}
+
+
+def benchmark(func: Callable[[], Optional[dict]]) -> Callable[[], Optional[dict]]:
+    """Register `func` under its name minus the ``bench_`` prefix."""
+    BENCHMARKS[func.__name__.removeprefix("bench_")] = func
+    return func
+
+
+# ----------------------------------------------------------------------
+# Helpers
+# ----------------------------------------------------------------------
+def best_of(func: Callable[[], object], repeat: int = 5) -> float:
+    """Return the fastest of `repeat` wall-clock runs of `func`, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def print_table(title: str, headers: Sequence[str], rows: List[Sequence[object]]) -> None:
+    """Print `rows` as a right-aligned plain-text table."""
+    cells = [[str(h) for h in headers]] + [[str(c) for c in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+
+    print(f"\n{title}")
+    for i, row in enumerate(cells):
+        print("  ".join(c.rjust(w) for c, w in zip(row, widths)))
+        if i == 0:
+            print("  ".join("-" * w for w in widths))
+
+
+def ns_per(seconds: float, n: int) -> str:
+    return f"{seconds / max(n, 1) * 1e9:.0f}"
+
+
+def traced_peak(func: Callable[[], object]) -> tuple[object, int]:
+    """Run `func` under tracemalloc; return its result and peak bytes allocated."""
+    tracemalloc.start()
+    try:
+        result = func()
+        return result, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+# ----------------------------------------------------------------------
+# Benchmarks
+# ----------------------------------------------------------------------
+@benchmark
+def bench_stack_safe() -> None:
+    """Per-node cost of native recursion and the trampoline vs iteration."""
+    ops = [
+        # (label, iterative call, recursive call)
+        ("length", lambda ll: sum(1 for _ in ll), lambda ll: ll.length_recursive()),
+        ("find", lambda ll: ll.find(-1), lambda ll: ll.find_recursive(-1)),
+        ("delete", lambda ll: ll.delete(-1), lambda ll: ll.delete_recursive(-1)),
+        ("reverse", lambda ll: ll.reverse(), lambda ll: ll.reverse_recursive()),
+        ("apply", lambda ll: ll.apply(abs), lambda ll: ll.apply_recursive(abs)),
+    ]
+    native_limit = sys.getrecursionlimit() - 100
+
+    rows = []
+    for n in (500, 10_000, 100_000):
+        native = LinkedList(range(n))
+        safe = LinkedList(range(n), stack_safe=True)
+        for label, iterative, recursive in ops:
+            t_iter = best_of(lambda: iterative(native))
+            t_native = best_of(lambda: recursive(native)) if n < native_limit else None
+            t_safe = best_of(lambda: recursive(safe))
+            rows.append(
+                [
+                    n,
+                    label,
+                    ns_per(t_iter, n),
+                    "-" if t_native is None else ns_per(t_native, n),
+                    ns_per(t_safe, n),
+                    f"{t_safe / t_iter:.1f}x",
+                ]
+            )
+
+    print_table(
+        "Recursive variants: ns per node",
+        ["n", "op", "iterative", "native rec", "stack-safe", "safe/iter"],
+        rows,
+    )
+
+
+@benchmark
+def bench_compact() -> None:
+    """Memory and traversal speed of CompactLinkedList vs the Node chain."""
+    n = 1_000_000
+    variants = [
+        ("LinkedList", lambda: LinkedList(range(n))),
+        ("Compact (objects)", lambda: CompactLinkedList(range(n))),
+        ("Compact (typed q)", lambda: CompactLinkedList(range(n), typecode="q")),
+    ]
+
+    rows = []
+    baseline = None
+    for label, build in variants:
+        ll, peak = traced_peak(build)
+        fragmented = build()
+        fragmented.reverse()  # defeats Compact's contiguous fast path
+        t_iter = best_of(lambda: sum(ll), repeat=3)
+        t_chase = best_of(lambda: sum(fragmented), repeat=3)
+        t_find = best_of(lambda: ll.find(-1), repeat=3)
+        baseline = baseline or (peak, t_iter, t_find)
+        rows.append(
+            [
+                label,
+                f"{peak / n:.1f}",
+                f"{baseline[0] / peak:.2f}x",
+                ns_per(t_iter, n),
+                ns_per(t_chase, n),
+                ns_per(t_find, n),
+            ]
+        )
+        del ll, fragmented
+
+    print_table(
+        f"Compact storage, n={n:,}",
+        ["variant", "bytes/elem", "mem gain", "iter ns", "iter ns (relinked)", "find ns"],
+        rows,
+    )
+
+
+@benchmark
+def bench_index() -> None:
+    """find / in / delete+re-append with and without the value index."""
+    rows = []
+    for n in (1_000, 100_000):
+        for indexed in (False, True):
+            ll = LinkedList(range(n), indexed=indexed)
+            probes = range(0, n, max(n // 50, 1))
+            t_find = best_of(lambda: [ll.find(v) for v in probes], repeat=3)
+            t_in = best_of(lambda: [v in ll for v in probes], repeat=3)
+
+            def churn():
+                for v in probes:
+                    ll.delete(v)
+                    ll.push_back(v)
+
+            t_churn = best_of(churn, repeat=3)
+            k = len(probes)
+            rows.append(
+                [n, "yes" if indexed else "no", ns_per(t_find, k), ns_per(t_in, k), ns_per(t_churn, k)]
+            )
+
+    print_table(
+        "Value index: ns per operation",
+        ["n", "indexed", "find", "in", "delete+push_back"],
+        rows,
+    )
+
+
+@benchmark
+def bench_sort() -> None:
+    """In-place merge sort vs copying to a list, sorting and rebuilding."""
+    methods = [
+        ("sort()", lambda ll: ll.sort()),
+        ("LinkedList(sorted(ll))", lambda ll: LinkedList(sorted(ll))),
+    ]
+
+    rows = []
+    for n in (10_000, 100_000, 1_000_000):
+        values = [random.random() for _ in range(n)]
+        for label, method in methods:
+            # Build a fresh unsorted list outside the measured region each time.
+            best = float("inf")
+            for _ in range(3):
+                ll = LinkedList(values)
+                start = time.perf_counter()
+                method(ll)
+                best = min(best, time.perf_counter() - start)
+
+            ll = LinkedList(values)
+            tracemalloc.start()
+            method(ll)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            del ll
+            rows.append([n, label, f"{best * 1e3:.1f}", ns_per(best, n), f"{peak / n:.1f}"])
+
+    print_table(
+        "Sorting a LinkedList of floats",
+        ["n", "method", "ms", "ns/elem", "peak extra bytes/elem"],
+        rows,
+    )
+
+
+@benchmark
+def bench_view() -> None:
+    """Lazy view pipelines vs materialising Python lists at each step."""
+    n = 1_000_000
+    ll = LinkedList(range(n))
+    double = lambda x: 2 * x  # noqa: E731
+    odd_third = lambda x: x % 3 == 1  # noqa: E731
+
+    cases = [
+        (
+            "map+filter -> LinkedList",
+            lambda: LinkedList([y for y in [double(x) for x in ll] if odd_third(y)]),
+            lambda: ll.view().map(double).filter(odd_third).collect_into(),
+        ),
+        (
+            "map+filter+take(10)",
+            lambda: [y for y in [double(x) for x in ll] if odd_third(y)][:10],
+            lambda: list(ll.view().map(double).filter(odd_third).take(10)),
+        ),
+    ]
+
+    rows = []
+    for label, eager, lazy in cases:
+        _, eager_peak = traced_peak(eager)
+        _, lazy_peak = traced_peak(lazy)
+        t_eager = best_of(eager, repeat=3)
+        t_lazy = best_of(lazy, repeat=3)
+        rows.append(
+            [
+                label,
+                f"{t_eager * 1e3:.3f}",
+                f"{t_lazy * 1e3:.3f}",
+                f"{eager_peak / 2**20:.1f}",
+                f"{lazy_peak / 2**20:.1f}",
+            ]
+        )
+
+    print_table(
+        f"Lazy views, n={n:,}",
+        ["pipeline", "eager ms", "view ms", "eager peak MiB", "view peak MiB"],
+        rows,
+    )
+
+
+def cpu_heavy(x: float) -> float:
+    """A pure CPU-bound per-element function (module-level, so picklable)."""
+    acc = 0.0
+    for k in range(1, 200):
+        acc += math.sin(x * k) / k
+    return acc
+
+
+@benchmark
+def bench_apply() -> None:
+    """apply vs apply_batched vs apply_parallel, for cheap and CPU-bound funcs."""
+    workers = os.cpu_count() or 1
+    # A single worker would run inline; use at least two to measure the pool.
+    pooled = max(workers, 2)
+    sqrt_list = lambda xs: [math.sqrt(x) for x in xs]  # noqa: E731
+    cases = [
+        (
+            "sqrt",
+            1_000_000,
+            [
+                ("apply", lambda ll: ll.apply(math.sqrt)),
+                ("apply_batched (list comp)", lambda ll: ll.apply_batched(sqrt_list)),
+                ("apply_batched (np.sqrt)", np and (lambda ll: ll.apply_batched(np.sqrt))),
+            ],
+        ),
+        (
+            "np.sqrt",
+            200_000,
+            [
+                ("apply (per element)", np and (lambda ll: ll.apply(np.sqrt))),
+                ("apply_batched", np and (lambda ll: ll.apply_batched(np.sqrt))),
+            ],
+        ),
+        (
+            "cpu_heavy",
+            20_000,
+            [
+                ("apply", lambda ll: ll.apply(cpu_heavy)),
+                (
+                    f"apply_parallel thread x{pooled}",
+                    lambda ll: ll.apply_parallel(cpu_heavy, pooled, batch_size=1000, pool="thread"),
+                ),
+                (
+                    f"apply_parallel process x{pooled}",
+                    lambda ll: ll.apply_parallel(cpu_heavy, pooled, batch_size=1000),
+                ),
+            ],
+        ),
+    ]
+
+    rows = []
+    for func_name, n, methods in cases:
+        base = None
+        for label, method in methods:
+            if method is None:
+                rows.append([func_name, n, label, "-", "-", "numpy missing"])
+                continue
+            t = float("inf")
+            for _ in range(3):
+                ll = LinkedList(float(i) for i in range(n))
+                start = time.perf_counter()
+                method(ll)
+                t = min(t, time.perf_counter() - start)
+            base = base or t
+            rows.append([func_name, n, label, f"{t * 1e3:.1f}", ns_per(t, n), f"{base / t:.2f}x"])
+
+    print_table(
+        f"Apply variants ({workers} CPU(s))",
+        ["func", "n", "method", "ms", "ns/elem", "speedup"],
+        rows,
+    )
+
+
+@benchmark
+def bench_dump() -> None:
+    """Binary dump / mmap load vs pickle, for a list of 10**6 floats."""
+    n = 1_000_000
+    ll = LinkedList(float(i) for i in range(n))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "list.llst")
+        pkl = os.path.join(tmp, "list.pkl")
+
+        def dump_pickle() -> None:
+            with open(pkl, "wb") as f:
+                pickle.dump(ll, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        def load_pickle() -> LinkedList:
+            with open(pkl, "rb") as f:
+                return pickle.load(f)
+
+        def open_mapped() -> None:
+            LinkedList.load(path).close()
+
+        def scan_mapped() -> None:
+            with LinkedList.load(path) as view:
+                sum(view)
+
+        t_dump = best_of(lambda: ll.dump(path), repeat=3)
+        t_pickle = best_of(dump_pickle, repeat=3)
+        rows = [
+            ["dump()", f"{t_dump * 1e3:.1f}", f"{os.path.getsize(path) / 2**20:.1f}"],
+            ["pickle.dump", f"{t_pickle * 1e3:.1f}", f"{os.path.getsize(pkl) / 2**20:.1f}"],
+            ["load(mmap=True), open only", f"{best_of(open_mapped) * 1e3:.3f}", "-"],
+            ["load(mmap=True) + sum()", f"{best_of(scan_mapped, repeat=3) * 1e3:.1f}", "-"],
+            ["load(mmap=False)", f"{best_of(lambda: LinkedList.load(path, mmap=False), repeat=3) * 1e3:.1f}", "-"],
+            ["pickle.load", f"{best_of(load_pickle, repeat=3) * 1e3:.1f}", "-"],
+        ]
+
+    print_table(f"Checkpointing, n={n:,} floats", ["operation", "ms", "file MiB"], rows)
+
+
+class LockedLinkedList(LinkedList):
+    """Baseline for `bench_concurrent`: one global lock around the queue ops."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        super().__init__()
+
+    def push_back(self, value: object) -> None:
+        with self._lock:
+            super().push_back(value)
+
+    def pop_front(self) -> object:
+        with self._lock:
+            return super().pop_front()
+
+
+@benchmark
+def bench_concurrent() -> None:
+    """Producer / consumer throughput: two-lock list vs a single global lock."""
+    per_thread = 50_000
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+    def run(queue: LinkedList, producers: int, consumers: int) -> float:
+        total = producers * per_thread
+        # Each consumer pops its share; spinning on empty is part of the cost.
+        shares = [total // consumers + (c < total % consumers) for c in range(consumers)]
+
+        def produce() -> None:
+            push = queue.push_back
+            for i in range(per_thread):
+                push(i)
+
+        def consume(share: int) -> None:
+            pop = queue.pop_front
+            while share:
+                try:
+                    pop()
+                except IndexError:
+                    continue
+                share -= 1
+
+        threads = [threading.Thread(target=produce) for _ in range(producers)]
+        threads += [threading.Thread(target=consume, args=(n,)) for n in shares]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return time.perf_counter() - start
+
+    rows = []
+    for producers, consumers in ((1, 1), (2, 2), (4, 4)):
+        ops = 2 * producers * per_thread
+        t_single = min(run(LockedLinkedList(), producers, consumers) for _ in range(3))
+        t_two = min(run(ConcurrentLinkedList(), producers, consumers) for _ in range(3))
+        rows.append(
+            [
+                f"{producers}P/{consumers}C",
+                f"{ops / t_single / 1e6:.2f}",
+                f"{ops / t_two / 1e6:.2f}",
+                f"{t_single / t_two:.2f}x",
+            ]
+        )
+
+    print_table(
+        f"Queue throughput, Mops/s (Python {sys.version.split()[0]}, "
+        f"GIL {'on' if gil else 'off'}, {os.cpu_count()} CPU(s))",
+        ["threads", "single lock", "two-lock", "speedup"],
+        rows,
+    )
+
+
+@benchmark
+def bench_async_queue() -> None:
+    """Fan-in throughput of AsyncLinkedQueue (single and batched) vs asyncio.Queue."""
+    producers, per_producer, batch = 100, 2_000, 256
+    total = producers * per_producer
+
+    async def run(queue, consume) -> tuple[float, int]:
+        async def produce() -> None:
+            for i in range(per_producer):
+                await queue.put(i)
+
+        start = time.perf_counter()
+        tasks = [asyncio.create_task(produce()) for _ in range(producers)]
+        wakeups = await consume(queue)
+        await asyncio.gather(*tasks)
+        return time.perf_counter() - start, wakeups
+
+    async def one_by_one(queue) -> int:
+        for _ in range(total):
+            await queue.get()
+        return total
+
+    async def batched(queue) -> int:
+        got = wakeups = 0
+        while got < total:
+            got += len(await queue.get_batch(batch))
+            wakeups += 1
+        return wakeups
+
+    cases = [
+        ("asyncio.Queue  get()", asyncio.Queue, one_by_one),
+        ("AsyncLinkedQueue  get()", AsyncLinkedQueue, one_by_one),
+        (f"AsyncLinkedQueue  get_batch({batch})", AsyncLinkedQueue, batched),
+    ]
+
+    rows = []
+    for maxsize in (0, 1_000):
+        for label, cls, consume in cases:
+            t, wakeups = min(asyncio.run(run(cls(maxsize), consume)) for _ in range(3))
+            rows.append([maxsize or "-", label, f"{total / t / 1e3:.0f}", f"{wakeups:,}"])
+
+    print_table(
+        f"asyncio fan-in, {producers} producers x {per_producer:,} items",
+        ["maxsize", "consumer", "k items/s", "consumer awaits"],
+        rows,
+    )
+
+
+@benchmark
+def bench_skiplist() -> None:
+    """SortedLinkedList vs a linear scan of the same chain vs bisect on a list."""
+    rng = random.Random(19)
+
+    def linear_find(node: Node | None, value: int) -> Node | None:
+        while node is not None and node.data < value:
+            node = node.next
+        return node if node is not None and node.data == value else None
+
+    rows = []
+    for n in (10**4, 10**5, 10**6, 10**7):
+        values = list(range(0, 2 * n, 2))  # even numbers; odd probes miss
+        start = time.perf_counter()
+        sll = SortedLinkedList(values, seed=19)
+        t_build = time.perf_counter() - start
+
+        probes = [rng.randrange(2 * n) for _ in range(2_000)]
+        few = probes[: max(2, 200_000 // n)]  # linear scan: keep the total bounded
+        t_skip = best_of(lambda: [sll.find(v) for v in probes], repeat=3)
+        t_bisect = best_of(lambda: [bisect.bisect_left(values, v) for v in probes], repeat=3)
+        t_linear = best_of(lambda: [linear_find(sll.head, v) for v in few], repeat=1)
+
+        def churn_skip() -> None:
+            for v in probes:
+                sll.insert(v | 1)
+            for v in probes:
+                sll.delete(v | 1)
+
+        def churn_list() -> None:
+            for v in probes:
+                bisect.insort(values, v | 1)
+            for v in probes:
+                del values[bisect.bisect_left(values, v | 1)]
+
+        t_churn_skip = best_of(churn_skip, repeat=3)
+        t_churn_list = best_of(churn_list, repeat=3)
+        k = len(probes)
+        rows.append(
+            [
+                f"{n:,}",
+                f"{t_build:.2f}",
+                sll.height,
+                ns_per(t_linear, len(few)),
+                ns_per(t_skip, k),
+                ns_per(t_bisect, k),
+                ns_per(t_churn_skip, 2 * k),
+                ns_per(t_churn_list, 2 * k),
+            ]
+        )
+        del sll, values
+
+    print_table(
+        "Sorted search: ns per operation",
+        ["n", "build s", "lanes", "linear find", "skip find", "bisect", "skip ins/del", "list ins/del"],
+        rows,
+    )
+
+
+@benchmark
+def bench_unrolled() -> None:
+    """Traversal and search of UnrolledLinkedList at several block sizes vs LinkedList."""
+    n = 1_000_000
+    variants = [("LinkedList", lambda: LinkedList(range(n)))] + [
+        (f"Unrolled B={b}", lambda b=b: UnrolledLinkedList(range(n), block_size=b))
+        for b in (4, 16, 64, 256)
+    ]
+
+    rows = []
+    baseline = None
+    for label, build in variants:
+        ll, peak = traced_peak(build)
+        t_iter = best_of(lambda: sum(ll), repeat=3)
+        t_find = best_of(lambda: ll.find(-1), repeat=3)
+        t_apply = best_of(lambda: ll.apply(abs), repeat=3)
+
+        def churn() -> None:
+            for v in range(n // 2, n // 2 + 100):
+                ll.delete(v)
+                ll.push_back(v)
+
+        t_churn = best_of(churn, repeat=3)
+        baseline = baseline or (t_iter, t_find, t_apply)
+        rows.append(
+            [
+                label,
+                f"{peak / n:.1f}",
+                f"{ns_per(t_iter, n)} ({baseline[0] / t_iter:.1f}x)",
+                f"{ns_per(t_find, n)} ({baseline[1] / t_find:.1f}x)",
+                f"{ns_per(t_apply, n)} ({baseline[2] / t_apply:.1f}x)",
+                f"{t_churn / 100 * 1e3:.2f}",
+            ]
+        )
+        del ll
+
+    print_table(
+        f"Unrolled blocks, n={n:,}",
+        ["variant", "bytes/elem", "iter ns/elem", "find ns/elem", "apply ns/elem", "mid delete+push ms"],
+        rows,
+    )
+
+
+@benchmark
+def bench_instrument() -> None:
+    """Cost of instrumentation: plain list vs instrumented (paused / recording) vs uninstrumented.
+
+    "swapped" lists were instrumented after construction (a class change);
+    "built" ones were created from `instrumented(LinkedList)`.
+    """
+    n = 1_000
+    ops = 10_000
+
+    def measure(ll: LinkedList) -> List[float]:
+        def pushes() -> None:
+            for v in range(ops):
+                ll.push_back(v)
+            for _ in range(ops):
+                ll.pop_front()
+
+        return [
+            best_of(pushes, repeat=3) / (2 * ops),
+            best_of(lambda: [ll.find(-1) for _ in range(100)], repeat=3) / 100,
+        ]
+
+    def paused(ll: LinkedList) -> None:
+        instrument(ll).enabled = False
+
+    def removed(ll: LinkedList) -> None:
+        instrument(ll)
+        uninstrument(ll)
+
+    built = instrumented(LinkedList)
+    variants = [
+        ("plain", LinkedList, lambda ll: None),
+        ("built, not instrumented", built, lambda ll: None),
+        ("built, paused", built, paused),
+        ("built, recording", built, instrument),
+        ("swapped, paused", LinkedList, paused),
+        ("swapped, recording", LinkedList, instrument),
+        ("swapped, uninstrumented", LinkedList, removed),
+    ]
+    rows = []
+    baseline = None
+    for label, cls, setup in variants:
+        ll = cls(range(n))
+        setup(ll)
+        t_push, t_find = measure(ll)
+        baseline = baseline or (t_push, t_find)
+        rows.append(
+            [
+                label,
+                f"{t_push * 1e9:.0f} ({t_push / baseline[0]:.1f}x)",
+                f"{t_find * 1e6:.1f} ({t_find / baseline[1]:.1f}x)",
+            ]
+        )
+
+    print_table(f"Instrumentation overhead, n={n:,}", ["variant", "push/pop ns/op", "find(miss) us/op"], rows)
+
+
+@benchmark
+def bench_persistent() -> None:
+    """Versioned store: copy a LinkedList per version vs PersistentLinkedList versions."""
+    n = 2_000
+    updates = 200
+    rng = random.Random(0)
+    indices = [rng.randrange(n) for _ in range(updates)]
+
+    def copied_set(ll: LinkedList, i: int) -> LinkedList:
+        new = LinkedList(ll)
+        node = new.head
+        for _ in range(i):
+            node = node.next
+        node.data = -i
+        return new
+
+    def copied_push(ll: LinkedList, i: int) -> LinkedList:
+        new = LinkedList(ll)
+        new.push_front(i)
+        return new
+
+    def copied_delete(ll: LinkedList, i: int) -> LinkedList:
+        new = LinkedList(ll)
+        new.delete(i)
+        return new
+
+    workloads = [
+        # (label, LinkedList update, PersistentLinkedList update)
+        ("push_front", copied_push, lambda pl, i: pl.push_front(i)),
+        ("set(random i)", copied_set, lambda pl, i: pl.set(i, -i)),
+        ("delete(random v)", copied_delete, lambda pl, i: pl.delete(i)),
+    ]
+
+    def run(first: object, update: Callable) -> list:
+        versions = [first]
+        for i in indices:
+            versions.append(update(versions[-1], i))
+        return versions
+
+    rows = []
+    for label, copied, persistent in workloads:
+        for variant, first, update in (
+            ("LinkedList copy", LinkedList(range(n)), copied),
+            ("Persistent", PersistentLinkedList(range(n)), persistent),
+        ):
+            t = best_of(lambda: run(first, update), repeat=3)
+            _, peak = traced_peak(lambda: run(first, update))
+            rows.append([label, variant, f"{t / updates * 1e6:.1f}", f"{peak / updates / 1024:.1f}"])
+
+    print_table(
+        f"Versioned updates, n={n:,}, {updates:,} versions kept",
+        ["update", "variant", "us/version", "KiB/version"],
+        rows,
+    )
+
+
+@benchmark
+def bench_structure() -> None:
+    """Cycle detection, middle / k-th from end, and the cost of checked mode."""
+    n = 1_000_000
+    plain = LinkedList(range(n))
+    checked = LinkedList(range(n), checked=True)
+    cyclic = LinkedList(range(n))
+    cyclic.tail.next = cyclic.head  # cycle covering the whole chain
+
+    def two_pointer_middle(ll: LinkedList) -> Node:
+        slow = fast = ll.head
+        while fast is not None and fast.next is not None:
+            slow, fast = slow.next, fast.next.next
+        return slow
+
+    rows = [
+        ("find_cycle brent, acyclic", lambda: plain.find_cycle("brent")),
+        ("find_cycle floyd, acyclic", lambda: plain.find_cycle("floyd")),
+        ("find_cycle brent, cyclic", lambda: cyclic.find_cycle("brent")),
+        ("find_cycle floyd, cyclic", lambda: cyclic.find_cycle("floyd")),
+        ("validate", plain.validate),
+        ("middle (cached size)", plain.middle),
+        ("middle (two pointers)", lambda: two_pointer_middle(plain)),
+        ("kth_from_end(10)", lambda: plain.kth_from_end(10)),
+        ("iterate", lambda: sum(plain)),
+        ("iterate, checked", lambda: sum(checked)),
+        ("find (miss)", lambda: plain.find(-1)),
+        ("find (miss), checked", lambda: checked.find(-1)),
+    ]
+    print_table(
+        f"Structure primitives, n={n:,}",
+        ["op", "ns/node"],
+        [[label, ns_per(best_of(func, repeat=3), n)] for label, func in rows],
+    )
+
+
+@benchmark
+def bench_churn() -> None:
+    """Queue churn with and without a NodePool: allocations, GC runs, latency."""
+    depth, ops, batch = 1_000, 300_000, 1_000
+    burst, bursts = 10_000, 30
+
+    def steady(ll: LinkedList) -> List[float]:
+        ll.extend(range(depth))
+        push, pop, clock = ll.push_back, ll.pop_front, time.perf_counter
+        times = []
+        for _ in range(ops // batch):
+            start = clock()
+            for v in range(batch):
+                push(v)
+                pop()
+            times.append(clock() - start)
+        return times
+
+    def bursty(ll: LinkedList) -> List[float]:
+        push, pop, clock = ll.push_back, ll.pop_front, time.perf_counter
+        times = []
+        for _ in range(bursts):
+            start = clock()
+            for v in range(burst):
+                push(v)
+            for _ in range(burst):
+                pop()
+            times.append(clock() - start)
+        return times
+
+    def run(workload: Callable[[LinkedList], List[float]], pool: Optional[NodePool], n_ops: int) -> list:
+        collections = [0]
+
+        def count(phase: str, info: dict) -> None:
+            if phase == "start":
+                collections[0] += 1
+
+        ll = LinkedList(pool=pool)
+        gc.collect()
+        gc.callbacks.append(count)
+        try:
+            times = workload(ll)
+        finally:
+            gc.callbacks.remove(count)
+        pushes = n_ops // 2
+        per_op = sorted(t / (n_ops / len(times)) for t in times)
+        mean = sum(per_op) / len(per_op)
+        stdev = math.sqrt(sum((t - mean) ** 2 for t in per_op) / len(per_op))
+        return [
+            ns_per(sum(times), n_ops),
+            ns_per(per_op[len(per_op) // 2], 1),
+            ns_per(per_op[int(len(per_op) * 0.99)], 1),
+            ns_per(per_op[-1], 1),
+            ns_per(stdev, 1),
+            f"{pushes if pool is None else pool.misses:,}",
+            f"{collections[0]}",
+            "-" if pool is None else f"{pool.stats()['hit_rate']:.1%}",
+        ]
+
+    headers = ["list", "ns/op", "p50", "p99", "max", "stdev", "allocs", "GC runs", "hit rate"]
+    for title, workload, n_ops, caps in (
+        (f"steady, depth {depth:,}, {ops:,} push+pop, per {batch:,}-op batch", steady, 2 * ops, (1024,)),
+        (f"bursty, {bursts} x {burst:,} pushes then pops, per burst", bursty, 2 * burst * bursts, (1024, burst)),
+    ):
+        rows = [["plain"] + run(workload, None, n_ops)]
+        rows += [[f"pool cap={cap:,}"] + run(workload, NodePool(cap), n_ops) for cap in caps]
+        print_table(f"Node churn: {title}", headers, rows)
+
+
+SCALING_SIZES = [round(10 ** (e / 2)) for e in range(4, 13)]  # 10^2 .. 10^6, half decades
+# Native recursion only reaches ~10^3, so those ops use quarter decades.
+SCALING_NATIVE_SIZES = [round(10 ** (e / 4)) for e in range(8, 16)]
+SCALING_BUDGET = 1.0  # seconds; a size whose single run would exceed this is skipped
+SCALING_MEMORY_N = 100_000  # peak memory is traced at the largest measured n up to this
+# Fits within this mean squared log-error of the best one count as equally
+# good and the simplest wins: over 10^2..10^6, O(n) vs O(n log n) is a
+# slope of 1.0 vs ~1.1, no more than cache misses add to a long pointer chase.
+COMPLEXITY_SLACK = 0.1
+COMPLEXITY_MODELS = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": math.log,
+    "O(n)": float,
+    "O(n log n)": lambda n: n * math.log(n),
+    "O(n^2)": lambda n: float(n) ** 2,
+}
+
+
+def _pushes(method: str) -> Callable[[LinkedList, int], None]:
+    def run(ll: LinkedList, n: int) -> None:
+        push = getattr(ll, method)
+        for v in range(n):
+            push(v)
+
+    return run
+
+
+def _pops(ll: LinkedList, n: int) -> None:
+    for _ in range(n):
+        ll.pop_front()
+
+
+def _scaling_ops() -> List[tuple]:
+    """(label, setup(n) -> obj, run(obj, n), native recursion, rerunnable) per operation.
+
+    A rerunnable op leaves its object the same size and order, so fast
+    runs can be repeated on it instead of on fresh objects.
+    """
+
+    def filled(**kwargs: Any) -> Callable[[int], LinkedList]:
+        return lambda n: LinkedList(range(n), **kwargs)
+
+    def shuffled(n: int) -> LinkedList:
+        return LinkedList(random.Random(n).sample(range(n), n))
+
+    def halves(n: int) -> tuple:
+        return LinkedList(range(0, n, 2)), LinkedList(range(1, n, 2))
+
+    ops = [
+        ("build", lambda n: range(n), lambda r, n: LinkedList(r), False, True),
+        ("push_front x n", lambda n: LinkedList(), _pushes("push_front"), False, False),
+        ("push_back x n", lambda n: LinkedList(), _pushes("push_back"), False, False),
+        ("pop_front x n", filled(), _pops, False, False),
+        ("extend n", filled(), lambda ll, n: ll.extend(range(n)), False, False),
+        ("iterate", filled(), lambda ll, n: sum(ll), False, True),
+        ("len", filled(), lambda ll, n: len(ll), False, True),
+        ("find (miss)", filled(), lambda ll, n: ll.find(-1), False, True),
+        ("in (miss)", filled(), lambda ll, n: -1 in ll, False, True),
+        ("delete (miss)", filled(), lambda ll, n: ll.delete(-1), False, True),
+        ("reverse", filled(), lambda ll, n: ll.reverse(), False, True),
+        ("apply", filled(), lambda ll, n: ll.apply(abs), False, True),
+        ("sort (shuffled)", shuffled, lambda ll, n: ll.sort(), False, False),
+        ("merge halves", halves, lambda ab, n: ab[0].merge(ab[1]), False, False),
+    ]
+    recursive = [
+        # (label, run, starts empty)
+        ("push_back_recursive x n", _pushes("push_back_recursive"), True),
+        ("find_recursive (miss)", lambda ll, n: ll.find_recursive(-1), False),
+        ("delete_recursive (miss)", lambda ll, n: ll.delete_recursive(-1), False),
+        ("length_recursive", lambda ll, n: ll.length_recursive(), False),
+        ("reverse_recursive", lambda ll, n: ll.reverse_recursive(), False),
+        ("apply_recursive", lambda ll, n: ll.apply_recursive(abs), False),
+    ]
+    for label, run, starts_empty in recursive:
+        for safe in (False, True):
+            setup = (lambda n, s=safe: LinkedList(stack_safe=s)) if starts_empty else filled(stack_safe=safe)
+            ops.append((label + (" [safe]" if safe else ""), setup, run, not safe, not starts_empty))
+    return ops
+
+
+def _time_scaled(setup: Callable[[int], Any], run: Callable[[Any, int], Any], n: int, rerunnable: bool) -> float:
+    """Best-of-3 seconds for one `run` on a `setup(n)` object, GC off as in timeit.
+
+    Fast runs are repeated (on the same object when `rerunnable`, else on
+    a batch of fresh ones) so the clock resolution doesn't dominate; slow
+    runs are measured once.
+    """
+    loops = 1
+    if rerunnable:
+        obj = setup(n)
+        while loops < 1 << 20 and best_of(lambda: [run(obj, n) for _ in range(loops)], repeat=1) < 1e-3:
+            loops *= 2
+    best = float("inf")
+    for _ in range(3):
+        objs = [obj] * loops if rerunnable else [setup(n) for _ in range(max(1, 20_000 // n))]
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for obj in objs:
+                run(obj, n)
+            elapsed = (time.perf_counter() - start) / len(objs)
+        finally:
+            gc.enable()
+        best = min(best, elapsed)
+        if elapsed > SCALING_BUDGET / 4:
+            break
+    return best
+
+
+def fit_complexity(sizes: Sequence[int], seconds: Sequence[float]) -> tuple[float, str]:
+    """Return the log-log slope of `seconds` over `sizes` and the simplest
+    model in COMPLEXITY_MODELS that fits about as well as any ("?" for
+    fewer than three sizes)."""
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(t) for t in seconds]
+    if len(xs) < 3:
+        return float("nan"), "?"
+
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    slope = sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sum((x - mx) ** 2 for x in xs)
+
+    def misfit(model: Callable[[int], float]) -> float:
+        # residuals of log t = log c + log f(n), with the best constant c
+        resid = [y - math.log(model(n)) for n, y in zip(sizes, ys)]
+        mean = sum(resid) / len(resid)
+        return sum((r - mean) ** 2 for r in resid) / len(resid)
+
+    errors = {name: misfit(model) for name, model in COMPLEXITY_MODELS.items()}
+    best = min(errors.values())
+    return slope, next(name for name, err in errors.items() if err <= best + COMPLEXITY_SLACK)
+
+
+def _si(x: float) -> str:
+    for scale, suffix in ((1e9, "G"), (1e6, "M"), (1e3, "k")):
+        if x >= scale:
+            return f"{x / scale:.1f}{suffix}"
+    return f"{x:.1f}" if x < 10 else f"{x:.0f}"
+
+
+@benchmark
+def bench_scaling() -> dict:
+    """Ops/sec, peak memory and fitted complexity of every LinkedList operation, n=10^2..10^6.
+
+    "x n" rows time a loop of n calls, so an O(1) op fits O(n) and an
+    O(n) op (push_back_recursive walks to the tail) fits O(n^2). Native
+    recursive rows stop below the recursion limit; "[safe]" rows use
+    stack_safe=True. A size is skipped once a run is predicted to take
+    longer than SCALING_BUDGET. Peak memory is what one run allocates
+    (tracemalloc), per element.
+    """
+    native_limit = sys.getrecursionlimit() - 100
+    results: Dict[str, Any] = {}
+    rows = []
+    for label, setup, run, native, rerunnable in _scaling_ops():
+        sizes, seconds = [], []
+        for n in SCALING_NATIVE_SIZES if native else SCALING_SIZES:
+            if native and n >= native_limit:
+                break
+            if len(seconds) >= 2:
+                growth = max(1.0, math.log(seconds[-1] / seconds[-2]) / math.log(sizes[-1] / sizes[-2]))
+                if seconds[-1] * (n / sizes[-1]) ** growth > SCALING_BUDGET:
+                    break
+            sizes.append(n)
+            seconds.append(_time_scaled(setup, run, n, rerunnable))
+
+        slope, model = fit_complexity(sizes, seconds)
+        mem_n = max((n for n in sizes if n <= SCALING_MEMORY_N), default=sizes[0])
+        obj = setup(mem_n)
+        _, peak = traced_peak(lambda: run(obj, mem_n))
+        del obj
+
+        results[label] = {"sizes": sizes, "seconds": seconds, "slope": slope, "complexity": model}
+        by_size = dict(zip(sizes, seconds))
+        rows.append(
+            [label]
+            + [_si(1 / by_size[n]) if n in by_size else "-" for n in SCALING_SIZES[::2]]
+            + [f"{slope:.2f}", model, f"{peak / mem_n:.0f} (n={mem_n:,})"]
+        )
+
+    print_table(
+        "Scaling: ops/sec per call (fit over half-decade sizes)",
+        ["op"] + [f"n=1e{e}" for e in range(2, 7)] + ["slope", "fit", "peak B/n"],
+        rows,
+    )
+    return results
+
+
+def compare_scaling(baseline: dict, current: dict, tolerance: float) -> List[str]:
+    """Describe ops that got slower than `baseline` by more than `tolerance`.
+
+    An op regresses if its median slowdown over the sizes both runs
+    measured exceeds the tolerance, or it fits a worse complexity class
+    with a slope more than 0.25 higher (e.g. O(n) turning into O(n^2)).
+    """
+    order = {name: i for i, name in enumerate(COMPLEXITY_MODELS)}
+    problems = []
+    for label, base in baseline.items():
+        cur = current.get(label)
+        if cur is None:
+            continue
+        before = dict(zip(base["sizes"], base["seconds"]))
+        ratios = sorted(t / before[n] for n, t in zip(cur["sizes"], cur["seconds"]) if n in before)
+        if ratios and ratios[len(ratios) // 2] > 1 + tolerance:
+            problems.append(f"{label}: {ratios[len(ratios) // 2]:.2f}x slower (median over {len(ratios)} sizes)")
+        grew = order.get(cur["complexity"], 0) > order.get(base["complexity"], len(order))
+        if grew and cur["slope"] > base["slope"] + 0.25:
+            problems.append(
+                f"{label}: complexity {base['complexity']} -> {cur['complexity']}"
+                f" (slope {base['slope']:.2f} -> {cur['slope']:.2f})"
+            )
+    return problems
+
+
+# ----------------------------------------------------------------------
+# Entry point
+# ----------------------------------------------------------------------
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("names", nargs="*", metavar="name", help="benchmarks to run")
+    parser.add_argument("--save-baseline", metavar="PATH", help="write the scaling results to PATH")
+    parser.add_argument("--baseline", metavar="PATH", help="exit non-zero if scaling regressed from PATH")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.0,
+        help="allowed fractional slowdown vs the baseline (default: %(default)s, i.e. 2x; timings are noisy)",
+    )
+    args = parser.parse_args(argv)
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+
+    results = {}
+    for name in args.names or BENCHMARKS:
+        result = BENCHMARKS[name]()
+        if result is not None:
+            results[name] = result
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=1)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        problems = [
+            f"{name}/{problem}"
+            for name, result in results.items()
+            if name in baseline
+            for problem in compare_scaling(baseline[name], result, args.tolerance)
+        ]
+        if problems:
+            print("\nRegressions against " + args.baseline + ":\n  " + "\n  ".join(problems))
+            sys.exit(1)
+        print(f"\nNo regressions against {args.baseline}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Array-backed singly-linked list.
+
+Instead of one `Node` object per element, values and next-indices live
+in two parallel buffers and nodes are referred to by slot number.
+Freed slots are threaded onto a free list (through the next buffer)
+and reused by later insertions.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Callable, Generator, Iterable, Iterator, Optional, Sequence
+
+from linkedlist import _trampoline
+
+NIL = -1  # "null pointer" slot index
+
+
+class SlotRef:
+    """A lightweight handle to one slot, mirroring `Node`'s data/next."""
+
+    __slots__ = ("_owner", "slot")
+
+    def __init__(self, owner: CompactLinkedList, slot: int) -> None:
+        self._owner = owner
+        self.slot = slot
+
+    @property
+    def data(self) -> Any:
+        return self._owner._values[self.slot]
+
+    @data.setter
+    def data(self, value: Any) -> None:
+        self._owner._values[self.slot] = value
+
+    @property
+    def next(self) -> Optional[SlotRef]:
+        return self._owner._ref(self._owner._next[self.slot])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SlotRef):
+            return NotImplemented
+        return self._owner is other._owner and self.slot == other.slot
+
+    def __hash__(self) -> int:
+        return hash((id(self._owner), self.slot))
+
+    def __repr__(self) -> str:
+        return f"SlotRef({self.data!r})"
+
+
+class CompactLinkedList:
+    """
+    Singly-linked list with the same public API as `LinkedList`, stored
+    in parallel `array` buffers.
+
+    Pass an `array` typecode (e.g. ``"q"`` or ``"d"``) to keep numeric
+    payloads unboxed; by default values are held in a plain list.
+    `find`, `head` and `tail` return `SlotRef` handles instead of nodes.
+    """
+
+    stack_safe: bool = False
+
+    # -----------------------------------------------------------------
+    # Construction / basic protocol
+    # -----------------------------------------------------------------
+    def __init__(
+        self,
+        iterable: Optional[Iterable[Any]] = None,
+        *,
+        typecode: Optional[str] = None,
+        stack_safe: bool = False,
+    ) -> None:
+        """Create an empty list (or initialise from an iterable)."""
+        self.typecode = typecode
+        self._values: Any = array(typecode) if typecode else []
+        self._next = array("q")
+        self._head = NIL
+        self._tail = NIL
+        self._free = NIL
+        self._size = 0
+        # True while the list occupies slots 0..n-1 in order, so
+        # iteration can read the value buffer directly.
+        self._contiguous = True
+        if stack_safe:
+            self.stack_safe = True
+        if iterable is not None:
+            self.extend(iterable)
+
+    @classmethod
+    def from_sequence(
+        cls, seq: Sequence[Any], *, typecode: Optional[str] = None
+    ) -> CompactLinkedList:
+        """Build a list from a sequence in one pass."""
+        return cls(seq, typecode=typecode)
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """Append every value of `iterable` as one block of fresh slots."""
+        values, nxt = self._values, self._next
+        start = len(values)
+        try:
+            values.extend(iterable)
+        except BaseException:
+            del values[start:]  # keep the buffers parallel
+            raise
+        count = len(values) - start
+        if count == 0:
+            return
+
+        nxt.extend(range(start + 1, start + count))
+        nxt.append(NIL)
+
+        if self._tail == NIL:
+            self._contiguous = self._contiguous and start == 0
+            self._head = start
+        else:
+            self._contiguous = self._contiguous and self._tail == start - 1
+            nxt[self._tail] = start
+
+        self._tail = start + count - 1
+        self._size += count
+
+    @property
+    def head(self) -> Optional[SlotRef]:
+        return self._ref(self._head)
+
+    @property
+    def tail(self) -> Optional[SlotRef]:
+        return self._ref(self._tail)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the stored values (iterative traversal)."""
+        if self._contiguous:
+            yield from self._values
+            return
+
+        values, nxt = self._values, self._next
+        cur = self._head
+        while cur != NIL:
+            yield values[cur]
+            cur = nxt[cur]
+
+    def __repr__(self) -> str:
+        values = ", ".join(repr(v) for v in self)
+        return f"CompactLinkedList([{values}])"
+
+    # -----------------------------------------------------------------
+    # Insertion
+    # -----------------------------------------------------------------
+    def push_front(self, value: Any) -> None:
+        """Insert `value` at the head (iterative)."""
+        slot = self._alloc(value, self._head)
+        self._contiguous = False
+        self._head = slot
+        if self._tail == NIL:
+            self._tail = slot
+        self._size += 1
+
+    def push_back(self, value: Any) -> None:
+        """Append `value` to the tail (iterative)."""
+        slot = self._alloc(value, NIL)
+        if self._tail == NIL:
+            self._head = slot
+        else:
+            self._next[self._tail] = slot
+        self._contiguous = self._contiguous and slot == self._size
+        self._tail = slot
+        self._size += 1
+
+    def push_back_recursive(self, value: Any) -> None:
+        """Append `value` to the tail (recursive)."""
+        nxt = self._next
+
+        def _push_back_rec(cur):
+            if cur == NIL:
+                self._tail = self._alloc(value, NIL)
+                return self._tail
+
+            nxt[cur] = _push_back_rec(nxt[cur])
+
+            return cur
+
+        if self.stack_safe:
+            self._head = _trampoline(
+                self._push_back_rec(self._head, value), pause_gc=True
+            )
+        else:
+            self._head = _push_back_rec(self._head)
+        self._contiguous = self._contiguous and self._tail == self._size
+        self._size += 1
+
+    # -----------------------------------------------------------------
+    # Deletion
+    # -----------------------------------------------------------------
+    def pop_front(self) -> Any:
+        """Remove and return the head element (iterative)."""
+        if self._head == NIL:
+            raise IndexError
+
+        slot = self._head
+        val = self._values[slot]
+        self._head = self._next[slot]
+        if self._head == NIL:
+            self._tail = NIL
+        self._release(slot)
+        self._size -= 1
+
+        return val
+
+    def delete(self, value: Any) -> bool:
+        """Delete first node equal to `value` (iterative). Return True if removed."""
+        values, nxt = self._values, self._next
+        prev = NIL
+        cur = self._head
+
+        while cur != NIL:
+            if values[cur] == value:
+                self._unlink(prev, cur)
+                return True
+            prev = cur
+            cur = nxt[cur]
+
+        return False
+
+    def delete_recursive(self, value: Any) -> bool:
+        """Delete first node equal to `value` (recursive). Return True if removed."""
+        values, nxt = self._values, self._next
+
+        def _delete_rec(prev, cur):
+            if cur == NIL:
+                return False
+
+            if values[cur] == value:
+                self._unlink(prev, cur)
+                return True
+
+            return _delete_rec(cur, nxt[cur])
+
+        if self.stack_safe:
+            return _trampoline(self._delete_rec(NIL, self._head, value))
+        return _delete_rec(NIL, self._head)
+
+    # -----------------------------------------------------------------
+    # Search
+    # -----------------------------------------------------------------
+    def find(self, value: Any) -> Optional[SlotRef]:
+        """Return a handle to the first slot containing `value` (iterative)."""
+        values, nxt = self._values, self._next
+        cur = self._head
+        while cur != NIL:
+            if values[cur] == value:
+                return SlotRef(self, cur)
+            cur = nxt[cur]
+
+        return None
+
+    def find_recursive(self, value: Any) -> Optional[SlotRef]:
+        """Return a handle to the first slot containing `value` (recursive)."""
+        values, nxt = self._values, self._next
+
+        def _find_rec(cur):
+            if cur == NIL:
+                return NIL
+
+            if values[cur] == value:
+                return cur
+
+            return _find_rec(nxt[cur])
+
+        if self.stack_safe:
+            return self._ref(_trampoline(self._find_rec(self._head, value)))
+        return self._ref(_find_rec(self._head))
+
+    # -----------------------------------------------------------------
+    # Size / Length
+    # -----------------------------------------------------------------
+    def __len__(self) -> int:
+        """Return the number of elements (O(1), cached)."""
+        return self._size
+
+    def length_recursive(self) -> int:
+        """Return the number of elements (recursive)."""
+        nxt = self._next
+
+        def _len_rec(cur):
+            if cur == NIL:
+                return 0
+
+            return 1 + _len_rec(nxt[cur])
+
+        if self.stack_safe:
+            return _trampoline(self._len_rec(self._head), pause_gc=True)
+        return _len_rec(self._head)
+
+    # -----------------------------------------------------------------
+    # Reverse
+    # -----------------------------------------------------------------
+    def reverse(self) -> None:
+        """Reverse the list in-place by rewriting next-indices (iterative)."""
+        nxt = self._next
+        cur = self._head
+        prev = NIL
+        self._tail = cur
+
+        while cur != NIL:
+            cur_next = nxt[cur]
+            nxt[cur] = prev
+            prev = cur
+            cur = cur_next
+
+        self._head = prev
+        self._contiguous = self._contiguous and self._size <= 1
+
+    def reverse_recursive(self) -> None:
+        """Reverse the list in-place (recursive)."""
+        nxt = self._next
+
+        def _reverse_rec(cur, prev):
+            if cur == NIL:
+                return prev
+
+            cur_next = nxt[cur]
+            nxt[cur] = prev
+
+            return _reverse_rec(cur_next, cur)
+
+        self._tail = self._head
+        if self.stack_safe:
+            self._head = _trampoline(self._reverse_rec(self._head, NIL))
+        else:
+            self._head = _reverse_rec(self._head, NIL)
+        self._contiguous = self._contiguous and self._size <= 1
+
+    # -----------------------------------------------------------------
+    # Apply a function to each element
+    # -----------------------------------------------------------------
+    def apply(self, func: Callable[[Any], Any]) -> None:
+        """Apply `func` to every stored value (iterative)."""
+        values, nxt = self._values, self._next
+        cur = self._head
+        while cur != NIL:
+            values[cur] = func(values[cur])
+            cur = nxt[cur]
+
+    def apply_recursive(self, func: Callable[[Any], Any]) -> None:
+        """Apply `func` to every stored value (recursive)."""
+        values, nxt = self._values, self._next
+
+        def _apply_rec(cur):
+            if cur == NIL:
+                return
+
+            values[cur] = func(values[cur])
+
+            _apply_rec(nxt[cur])
+
+        if self.stack_safe:
+            _trampoline(self._apply_rec(self._head, func))
+        else:
+            _apply_rec(self._head)
+
+    # -----------------------------------------------------------------
+    # Storage management
+    # -----------------------------------------------------------------
+    def compact(self) -> None:
+        """Rewrite the buffers in list order, dropping all free slots."""
+        values = [*self] if self.typecode is None else array(self.typecode, self)
+        self._values = values
+        self._next = array("q", range(1, len(values)))
+        if values:
+            self._next.append(NIL)
+        self._head = 0 if values else NIL
+        self._tail = len(values) - 1 if values else NIL
+        self._free = NIL
+        self._contiguous = True
+
+    def capacity(self) -> int:
+        """Return the number of allocated slots (live + free)."""
+        return len(self._next)
+
+    # -----------------------------------------------------------------
+    # Helper methods (private)
+    # -----------------------------------------------------------------
+    def _ref(self, slot: int) -> Optional[SlotRef]:
+        return None if slot == NIL else SlotRef(self, slot)
+
+    def _alloc(self, value: Any, nxt: int) -> int:
+        """Take a slot from the free list (or grow the buffers) and fill it."""
+        slot = self._free
+        if slot != NIL:
+            self._values[slot] = value  # first: a rejected value leaves the slot free
+            self._free = self._next[slot]
+            self._next[slot] = nxt
+            return slot
+
+        self._values.append(value)
+        self._next.append(nxt)
+        return len(self._next) - 1
+
+    def _release(self, slot: int) -> None:
+        """Push `slot` onto the free list."""
+        if self.typecode is None:
+            self._values[slot] = None  # drop the reference
+        self._next[slot] = self._free
+        self._free = slot
+        self._contiguous = False
+
+    def _unlink(self, prev: int, cur: int) -> None:
+        """Remove slot `cur`, whose predecessor is `prev` (NIL for the head)."""
+        nxt = self._next[cur]
+        if prev == NIL:
+            self._head = nxt
+        else:
+            self._next[prev] = nxt
+        if nxt == NIL:
+            self._tail = prev
+        self._release(cur)
+        self._size -= 1
+
+    # Generator forms of the recursive definitions, driven by
+    # `_trampoline` in stack-safe mode (see `LinkedList` for the protocol).
+    def _push_back_rec(self, cur: int, value: Any) -> Generator:
+        if cur == NIL:
+            self._tail = self._alloc(value, NIL)
+            return self._tail
+
+        self._next[cur] = yield self._push_back_rec(self._next[cur], value)
+
+        return cur
+
+    def _delete_rec(self, prev: int, cur: int, value: Any) -> Generator:
+        if cur == NIL:
+            return False
+
+        if self._values[cur] == value:
+            self._unlink(prev, cur)
+            return True
+
+        return self._delete_rec(cur, self._next[cur], value)
+        yield
+
+    def _find_rec(self, cur: int, value: Any) -> Generator:
+        if cur == NIL:
+            return NIL
+
+        if self._values[cur] == value:
+            return cur
+
+        return self._find_rec(self._next[cur], value)
+        yield
+
+    def _len_rec(self, cur: int) -> Generator:
+        if cur == NIL:
+            return 0
+
+        return 1 + (yield self._len_rec(self._next[cur]))
+
+    def _reverse_rec(self, cur: int, prev: int) -> Generator:
+        if cur == NIL:
+            return prev
+
+        cur_next = self._next[cur]
+        self._next[cur] = prev
+
+        return self._reverse_rec(cur_next, cur)
+        yield
+
+    def _apply_rec(self, cur: int, func: Callable[[Any], Any]) -> Generator:
+        if cur == NIL:
+            return
+
+        self._values[cur] = func(self._values[cur])
+
+        return self._apply_rec(self._next[cur], func)
+        yield
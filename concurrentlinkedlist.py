@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Thread-safe `LinkedList` for use as a shared work queue, with separate
+head and tail locks so producers and consumers rarely contend.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from linkedlist import LinkedList, Node
+
+
+def _exclusive_method(method: Callable) -> Callable:
+    """Wrap a `LinkedList` method so it runs with both locks held."""
+
+    @wraps(method)
+    def locked(self: ConcurrentLinkedList, *args: Any, **kwargs: Any) -> Any:
+        with self._exclusive():
+            return method(self, *args, **kwargs)
+
+    return locked
+
+
+class ConcurrentLinkedList(LinkedList):
+    """
+    `LinkedList` whose operations are safe to call from several threads.
+
+    It uses the two-lock queue scheme: `push_back` takes only the tail
+    lock and `pop_front` only the head lock, so producers and consumers
+    run in parallel. They take both locks only when the list has at most
+    one node, where the two ends meet.
+
+    Every other operation takes both locks, in head-then-tail order, and
+    runs the plain `LinkedList` code. Iteration works on a snapshot taken
+    under the locks, so it never sees a half-applied mutation. Nodes
+    returned by `find` may be unlinked by other threads at any time.
+
+    The value index is not supported (``indexed=True`` raises ValueError).
+    """
+
+    def __init__(
+        self,
+        iterable: Optional[Iterable[Any]] = None,
+        *,
+        stack_safe: bool = False,
+        indexed: bool = False,
+        checked: bool = False,
+    ) -> None:
+        if indexed:
+            raise ValueError("ConcurrentLinkedList does not support the value index")
+        # Reentrant, since some LinkedList methods call other public ones
+        # (e.g. `__contains__` -> `find`), which take the locks again.
+        self._head_lock = threading.RLock()
+        self._tail_lock = threading.RLock()
+        # Element count is `_size + _pushed - _popped`: the lock-free ends
+        # each bump their own counter, and `_exclusive` folds both into `_size`.
+        self._pushed = 0
+        self._popped = 0
+        super().__init__(iterable, stack_safe=stack_safe, checked=checked)
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """Hold both locks, with `_size` brought up to date."""
+        with self._head_lock, self._tail_lock:
+            self._size += self._pushed - self._popped
+            self._pushed = self._popped = 0
+            yield
+
+    # -----------------------------------------------------------------
+    # Queue operations (one lock in the common case)
+    # -----------------------------------------------------------------
+    def push_back(self, value: Any) -> None:
+        """Append `value` to the tail."""
+        node = Node(value)
+        with self._tail_lock:
+            tail = self.tail
+            if tail is not None:
+                # pop_front never unlinks the last node without the tail lock
+                tail.next = node
+                self.tail = node
+                self._pushed += 1
+                return
+
+        # Empty: `head` changes too, so retake both locks in order.
+        with self._head_lock, self._tail_lock:
+            if self.tail is None:
+                self.head = node
+            else:
+                self.tail.next = node
+            self.tail = node
+            self._pushed += 1
+
+    def pop_front(self) -> Any:
+        """Remove and return the head element; IndexError if empty."""
+        with self._head_lock:
+            node = self.head
+            if node is None:
+                raise IndexError
+
+            if node.next is not None:
+                # Not the last node, so a concurrent push_back can't touch it.
+                self.head = node.next
+            else:
+                with self._tail_lock:
+                    # Re-read: a push_back may have linked a node meanwhile.
+                    self.head = node.next
+                    if self.head is None:
+                        self.tail = None
+
+            self._popped += 1
+
+        node.next = None
+        return node.data
+
+    # -----------------------------------------------------------------
+    # Everything else holds both locks
+    # -----------------------------------------------------------------
+    push_front = _exclusive_method(LinkedList.push_front)
+    push_back_recursive = _exclusive_method(LinkedList.push_back_recursive)
+    extend = _exclusive_method(LinkedList.extend)
+    delete = _exclusive_method(LinkedList.delete)
+    delete_recursive = _exclusive_method(LinkedList.delete_recursive)
+    find = _exclusive_method(LinkedList.find)
+    find_recursive = _exclusive_method(LinkedList.find_recursive)
+    __contains__ = _exclusive_method(LinkedList.__contains__)
+    length_recursive = _exclusive_method(LinkedList.length_recursive)
+    reverse = _exclusive_method(LinkedList.reverse)
+    reverse_recursive = _exclusive_method(LinkedList.reverse_recursive)
+    apply = _exclusive_method(LinkedList.apply)
+    apply_recursive = _exclusive_method(LinkedList.apply_recursive)
+    apply_batched = _exclusive_method(LinkedList.apply_batched)
+    apply_parallel = _exclusive_method(LinkedList.apply_parallel)
+    sort = _exclusive_method(LinkedList.sort)
+    dump = _exclusive_method(LinkedList.dump)
+    find_cycle = _exclusive_method(LinkedList.find_cycle)
+    validate = _exclusive_method(LinkedList.validate)
+    middle = _exclusive_method(LinkedList.middle)
+    kth_from_end = _exclusive_method(LinkedList.kth_from_end)
+    split_at = _exclusive_method(LinkedList.split_at)
+    split_half = _exclusive_method(LinkedList.split_half)
+
+    def __len__(self) -> int:
+        """Return the number of elements."""
+        with self._exclusive():
+            return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the values of a snapshot taken under the locks."""
+        with self._exclusive():
+            values = list(LinkedList.__iter__(self))
+        return iter(values)
+
+    def merge(
+        self,
+        other: LinkedList,
+        key: Optional[Callable[[Any], Any]] = None,
+        reverse: bool = False,
+    ) -> None:
+        """Merge the sorted list `other` into this one (see `LinkedList.merge`)."""
+        if not isinstance(other, ConcurrentLinkedList) or other is self:
+            with self._exclusive():
+                LinkedList.merge(self, other, key, reverse)
+            return
+
+        # Lock the two lists in a fixed order so a.merge(b) racing
+        # b.merge(a) can't deadlock.
+        first, second = sorted((self, other), key=id)
+        with first._exclusive(), second._exclusive():
+            LinkedList.merge(self, other, key, reverse)
+
+    def enable_index(self) -> None:
+        raise ValueError("ConcurrentLinkedList does not support the value index")
+
+    def __repr__(self) -> str:
+        values = ", ".join(repr(v) for v in self)
+        return f"ConcurrentLinkedList([{values}])"
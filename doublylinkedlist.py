@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Doubly-linked list with deque-style operations at both ends and O(1)
+removal / insertion around a node the caller already holds.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Generator, Iterable, Iterator, Optional
+
+from linkedlist import _trampoline
+
+
+class DNode:
+    """A single element of the doubly-linked list."""
+
+    __slots__ = ("data", "prev", "next")
+
+    def __init__(
+        self, data: Any, prev: Optional[DNode] = None, nxt: Optional[DNode] = None
+    ) -> None:
+        self.data: Any = data
+        self.prev: Optional[DNode] = prev
+        self.next: Optional[DNode] = nxt
+
+    def __repr__(self) -> str:
+        return f"DNode({self.data!r})"
+
+
+class DoublyLinkedList:
+    """
+    Doubly-linked list exposing both iterative and recursive variants
+    of the classic operations, like `LinkedList`.
+
+    Methods that take a `DNode` (`remove_node`, `insert_after`,
+    `insert_before`, `move_to_front`) expect a node of *this* list;
+    ownership is not checked, to keep them O(1).
+    """
+
+    stack_safe: bool = False
+
+    # -----------------------------------------------------------------
+    # Construction / basic protocol
+    # -----------------------------------------------------------------
+    def __init__(
+        self, iterable: Optional[Iterable[Any]] = None, *, stack_safe: bool = False
+    ) -> None:
+        """Create an empty list (or initialise from an iterable)."""
+        self.head: Optional[DNode] = None
+        self.tail: Optional[DNode] = None
+        self._size: int = 0
+        if stack_safe:
+            self.stack_safe = True
+        if iterable is not None:
+            self.extend(iterable)
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """Append every value of `iterable`."""
+        tail = self.tail
+        count = 0
+        for value in iterable:
+            node = DNode(value, tail)
+            if tail is None:
+                self.head = node
+            else:
+                tail.next = node
+            tail = node
+            count += 1
+
+        self.tail = tail
+        self._size += count
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the stored values head to tail."""
+        cur = self.head
+        while cur:
+            yield cur.data
+            cur = cur.next
+
+    def __reversed__(self) -> Iterator[Any]:
+        """Yield the stored values tail to head."""
+        cur = self.tail
+        while cur:
+            yield cur.data
+            cur = cur.prev
+
+    def __repr__(self) -> str:
+        values = ", ".join(repr(v) for v in self)
+        return f"DoublyLinkedList([{values}])"
+
+    # -----------------------------------------------------------------
+    # Insertion
+    # -----------------------------------------------------------------
+    def push_front(self, value: Any) -> DNode:
+        """Insert `value` at the head and return its node."""
+        node = DNode(value, None, self.head)
+        if self.head is None:
+            self.tail = node
+        else:
+            self.head.prev = node
+        self.head = node
+        self._size += 1
+        return node
+
+    def push_back(self, value: Any) -> DNode:
+        """Append `value` at the tail and return its node."""
+        node = DNode(value, self.tail)
+        if self.tail is None:
+            self.head = node
+        else:
+            self.tail.next = node
+        self.tail = node
+        self._size += 1
+        return node
+
+    def push_back_recursive(self, value: Any) -> None:
+        """Append `value` to the tail (recursive)."""
+
+        def _push_back_rec(node, prev):
+            if not node:
+                self.tail = DNode(value, prev)
+                return self.tail
+
+            node.next = _push_back_rec(node.next, node)
+
+            return node
+
+        if self.stack_safe:
+            self.head = _trampoline(
+                self._push_back_rec(self.head, None, value), pause_gc=True
+            )
+        else:
+            self.head = _push_back_rec(self.head, None)
+        self._size += 1
+
+    def insert_after(self, node: DNode, value: Any) -> DNode:
+        """Insert `value` right after `node` and return the new node."""
+        new = DNode(value, node, node.next)
+        if node.next is None:
+            self.tail = new
+        else:
+            node.next.prev = new
+        node.next = new
+        self._size += 1
+        return new
+
+    def insert_before(self, node: DNode, value: Any) -> DNode:
+        """Insert `value` right before `node` and return the new node."""
+        new = DNode(value, node.prev, node)
+        if node.prev is None:
+            self.head = new
+        else:
+            node.prev.next = new
+        node.prev = new
+        self._size += 1
+        return new
+
+    # -----------------------------------------------------------------
+    # Deletion
+    # -----------------------------------------------------------------
+    def pop_front(self) -> Any:
+        """Remove and return the head element."""
+        if not self.head:
+            raise IndexError
+        return self.remove_node(self.head)
+
+    def pop_back(self) -> Any:
+        """Remove and return the tail element."""
+        if not self.tail:
+            raise IndexError
+        return self.remove_node(self.tail)
+
+    def remove_node(self, node: DNode) -> Any:
+        """Unlink `node` from the list and return its data."""
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+
+        node.prev = node.next = None
+        self._size -= 1
+        return node.data
+
+    def delete(self, value: Any) -> bool:
+        """Delete first node equal to `value` (iterative). Return True if removed."""
+        node = self.find(value)
+        if node is None:
+            return False
+
+        self.remove_node(node)
+        return True
+
+    def delete_recursive(self, value: Any) -> bool:
+        """Delete first node equal to `value` (recursive). Return True if removed."""
+        node = self.find_recursive(value)
+        if node is None:
+            return False
+
+        self.remove_node(node)
+        return True
+
+    # -----------------------------------------------------------------
+    # Reordering
+    # -----------------------------------------------------------------
+    def move_to_front(self, node: DNode) -> None:
+        """Relink `node` as the new head."""
+        if node is self.head:
+            return
+
+        # `node` has a predecessor, since it is not the head
+        node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+
+        node.prev = None
+        node.next = self.head
+        self.head.prev = node
+        self.head = node
+
+    def move_to_back(self, node: DNode) -> None:
+        """Relink `node` as the new tail."""
+        if node is self.tail:
+            return
+
+        # `node` has a successor, since it is not the tail
+        node.next.prev = node.prev
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+
+        node.next = None
+        node.prev = self.tail
+        self.tail.next = node
+        self.tail = node
+
+    # -----------------------------------------------------------------
+    # Search
+    # -----------------------------------------------------------------
+    def find(self, value: Any) -> Optional[DNode]:
+        """Return the first node containing `value` (iterative)."""
+        curr = self.head
+        while curr:
+            if curr.data == value:
+                return curr
+            curr = curr.next
+
+        return None
+
+    def find_recursive(self, value: Any) -> Optional[DNode]:
+        """Return the first node containing `value` (recursive)."""
+
+        def _find_rec(node):
+            if not node:
+                return node
+
+            if node.data == value:
+                return node
+
+            return _find_rec(node.next)
+
+        if self.stack_safe:
+            return _trampoline(self._find_rec(self.head, value))
+        return _find_rec(self.head)
+
+    # -----------------------------------------------------------------
+    # Size / Length
+    # -----------------------------------------------------------------
+    def __len__(self) -> int:
+        """Return the number of elements (O(1), cached)."""
+        return self._size
+
+    def length_recursive(self) -> int:
+        """Return the number of elements (recursive)."""
+
+        def _len_rec(node):
+            if not node:
+                return 0
+
+            return 1 + _len_rec(node.next)
+
+        if self.stack_safe:
+            return _trampoline(self._len_rec(self.head), pause_gc=True)
+        return _len_rec(self.head)
+
+    # -----------------------------------------------------------------
+    # Reverse
+    # -----------------------------------------------------------------
+    def reverse(self) -> None:
+        """Reverse the list in-place by swapping each node's links (iterative)."""
+        curr = self.head
+        while curr:
+            curr.prev, curr.next = curr.next, curr.prev
+            curr = curr.prev
+
+        self.head, self.tail = self.tail, self.head
+
+    def reverse_recursive(self) -> None:
+        """Reverse the list in-place (recursive)."""
+
+        def _reverse_rec(node):
+            if not node:
+                return
+
+            node.prev, node.next = node.next, node.prev
+
+            _reverse_rec(node.prev)
+
+        if self.stack_safe:
+            _trampoline(self._reverse_rec(self.head))
+        else:
+            _reverse_rec(self.head)
+        self.head, self.tail = self.tail, self.head
+
+    # -----------------------------------------------------------------
+    # Apply a function to each element
+    # -----------------------------------------------------------------
+    def apply(self, func: Callable[[Any], Any]) -> None:
+        """Apply `func` to every node's data (iterative)."""
+        curr = self.head
+        while curr:
+            curr.data = func(curr.data)
+            curr = curr.next
+
+    def apply_recursive(self, func: Callable[[Any], Any]) -> None:
+        """Apply `func` to every node's data (recursive)."""
+
+        def _apply_rec(node):
+            if not node:
+                return
+
+            node.data = func(node.data)
+
+            _apply_rec(node.next)
+
+        if self.stack_safe:
+            _trampoline(self._apply_rec(self.head, func))
+        else:
+            _apply_rec(self.head)
+
+    # -----------------------------------------------------------------
+    # Helper methods (private)
+    # -----------------------------------------------------------------
+    # Generator forms of the recursive definitions, driven by
+    # `_trampoline` in stack-safe mode (see `LinkedList` for the protocol).
+    def _push_back_rec(
+        self, node: Optional[DNode], prev: Optional[DNode], value: Any
+    ) -> Generator:
+        if not node:
+            self.tail = DNode(value, prev)
+            return self.tail
+
+        node.next = yield self._push_back_rec(node.next, node, value)
+
+        return node
+
+    def _find_rec(self, node: Optional[DNode], value: Any) -> Generator:
+        if not node:
+            return node
+
+        if node.data == value:
+            return node
+
+        return self._find_rec(node.next, value)
+        yield
+
+    def _len_rec(self, node: Optional[DNode]) -> Generator:
+        if not node:
+            return 0
+
+        return 1 + (yield self._len_rec(node.next))
+
+    def _reverse_rec(self, node: Optional[DNode]) -> Generator:
+        if not node:
+            return
+
+        node.prev, node.next = node.next, node.prev
+
+        return self._reverse_rec(node.prev)
+        yield
+
+    def _apply_rec(self, node: Optional[DNode], func: Callable[[Any], Any]) -> Generator:
+        if not node:
+            return
+
+        node.data = func(node.data)
+
+        return self._apply_rec(node.next, func)
+        yield
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Opt-in operation metrics for `LinkedList` (and the other list types).
+
+    metrics = instrument(ll)        # ll now records per-operation stats
+    ll.find(42)
+    metrics.snapshot()              # {"find": {"calls": 1, ...}, ...}
+    print(metrics.to_prometheus())
+    uninstrument(ll)                # back to the plain class
+
+`instrument` swaps the instance's class for a subclass whose public
+methods are wrapped, so lists that are never instrumented run the
+original code untouched and pay nothing. Nodes visited and recursion
+depth are measured with `sys.monitoring` (PEP 669) events, switched on
+only for the code of the operation being measured and only while it runs.
+
+Changing an object's class makes CPython 3.12 move its attributes into a
+real dict, which roughly doubles attribute access on that one list, even
+after `uninstrument`. To avoid that, build the list from the
+instrumented class from the start:
+
+    ll = instrumented(LinkedList)(range(10))
+    metrics = instrument(ll)        # no class change needed
+
+A wrapped method that is not recording (never instrumented, or paused
+with ``metrics.enabled = False``) still costs one extra call. Measured
+on push_back + pop_front, the cheapest operations, relative to a plain
+list: about 1.1-1.6x built from `instrumented`, and 1.7-2.5x after a
+class swap; recording costs roughly 10x. Traversals barely notice the
+wrapper. ``python bench_linkedlist.py instrument`` reproduces these.
+"""
+
+from __future__ import annotations
+
+import dis
+import inspect
+import sys
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+DEFAULT_OPS = (
+    "push_front",
+    "push_back",
+    "push_back_recursive",
+    "pop_front",
+    "delete",
+    "delete_recursive",
+    "find",
+    "find_recursive",
+    "__contains__",
+    "__len__",
+    "length_recursive",
+    "reverse",
+    "reverse_recursive",
+    "apply",
+    "apply_recursive",
+    "extend",
+    "sort",
+    "merge",
+)
+
+# Helpers whose loops don't walk the list (the trampoline's loop counts
+# generator steps, which the recursion events already count).
+_SKIP_HELPERS = frozenset({"_trampoline"})
+
+_events = sys.monitoring.events
+_JUMP = _events.JUMP
+_REC_EVENTS = _events.JUMP | _events.PY_START | _events.PY_RETURN
+
+
+class OpStats:
+    """Accumulated numbers for one operation."""
+
+    __slots__ = ("calls", "nodes_visited", "seconds", "max_recursion_depth")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.nodes_visited = 0
+        self.seconds = 0.0
+        self.max_recursion_depth = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class Metrics:
+    """Per-list operation statistics collected while instrumented.
+
+    `nodes_visited` counts steps along the chain: one per iteration of a
+    traversal loop and one per call of a recursive helper. It is exact
+    up to one per call (whether the final, failing step is counted).
+    `max_recursion_depth` is the deepest stack of recursive helper frames
+    alive at once; with ``stack_safe=True`` and tail calls it stays small,
+    which is the point. Set `enabled` to False to pause collection.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = True
+        self.ops: Dict[str, OpStats] = {}
+
+    def reset(self) -> None:
+        self.ops.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return a plain-dict copy of the counters, keyed by operation."""
+        return {op: stats.as_dict() for op, stats in sorted(self.ops.items())}
+
+    def to_prometheus(self, prefix: str = "linkedlist", labels: Optional[Dict[str, str]] = None) -> str:
+        """Render the counters in the Prometheus text exposition format."""
+        extra = "".join(f',{k}="{_escape(v)}"' for k, v in sorted((labels or {}).items()))
+        series = [
+            ("calls_total", "counter", "Operations called.", "calls"),
+            ("nodes_visited_total", "counter", "Chain steps taken by operations.", "nodes_visited"),
+            ("seconds_total", "counter", "Wall time spent in operations.", "seconds"),
+            ("recursion_depth_max", "gauge", "Deepest recursive helper stack seen.", "max_recursion_depth"),
+        ]
+        lines = []
+        for suffix, kind, help_text, attr in series:
+            name = f"{prefix}_{suffix}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for op, stats in sorted(self.ops.items()):
+                lines.append(f'{name}{{op="{_escape(op)}"{extra}}} {getattr(stats, attr)}')
+        return "\n".join(lines) + "\n"
+
+    def _record(self, op: str, seconds: float, nodes: int, depth: int) -> None:
+        stats = self.ops.get(op)
+        if stats is None:
+            stats = self.ops[op] = OpStats()
+        stats.calls += 1
+        stats.seconds += seconds
+        stats.nodes_visited += nodes
+        if depth > stats.max_recursion_depth:
+            stats.max_recursion_depth = depth
+
+
+def instrument(obj: Any, ops: Iterable[str] = DEFAULT_OPS) -> Metrics:
+    """Start recording `ops` on `obj` and return its `Metrics`.
+
+    Objects already of an instrumented class keep their set of ops, and
+    calling it again returns the existing metrics. Single-threaded use
+    only: the event counters are global.
+    """
+    if not isinstance(obj, _Instrumented):
+        obj.__class__ = instrumented(type(obj), ops)
+    if obj._metrics is None:
+        obj._metrics = Metrics()
+    return obj._metrics
+
+
+def uninstrument(obj: Any) -> None:
+    """Restore `obj`'s original class and drop its metrics."""
+    if isinstance(obj, _Instrumented):
+        obj.__class__ = obj._base_class
+        vars(obj).pop("_metrics", None)
+
+
+def instrumented(base: type, ops: Iterable[str] = DEFAULT_OPS) -> type:
+    """Return (and cache) the subclass of `base` with `ops` wrapped.
+
+    Its instances record nothing until passed to `instrument`.
+    """
+    ops = tuple(ops)
+    cls = _CLASSES.get((base, ops))
+    if cls is None:
+        namespace: Dict[str, Any] = {"_base_class": base}
+        for op in ops:
+            method = getattr(base, op, None)
+            if callable(method):
+                namespace[op] = _wrap(op, method, _traversal_codes(method, base))
+        cls = _CLASSES[base, ops] = type(f"Instrumented{base.__name__}", (base, _Instrumented), namespace)
+    return cls
+
+
+# ----------------------------------------------------------------------
+# Implementation
+# ----------------------------------------------------------------------
+class _Instrumented:
+    """Marker base of the generated instrumented subclasses."""
+
+    _base_class: type
+    _metrics: Optional[Metrics] = None
+
+
+_CLASSES: Dict[Tuple[type, Tuple[str, ...]], type] = {}
+
+
+def _traversal_codes(method: Callable, owner: type) -> list:
+    """Code objects `method` can run: its own, nested ones and the module's
+    helpers it names (functions or methods of `owner`), transitively."""
+    func = inspect.unwrap(method)
+    module = func.__module__
+    codes, stack, seen = [], [func.__code__], set()
+    while stack:
+        code = stack.pop()
+        if code in seen:
+            continue
+        seen.add(code)
+        codes.append(code)
+        stack.extend(c for c in code.co_consts if inspect.iscode(c))
+        for name in code.co_names:
+            if name in _SKIP_HELPERS:
+                continue
+            target = func.__globals__.get(name)
+            if not inspect.isfunction(target):
+                target = inspect.getattr_static(owner, name, None)
+            target = inspect.unwrap(target) if inspect.isfunction(target) else None
+            if target is not None and target.__module__ == module:
+                stack.append(target.__code__)
+    return codes
+
+
+class _Monitor:
+    """Shared `sys.monitoring` tool state; one measured call at a time.
+
+    The tool id is held only while a call is measured, and never one of
+    the reserved ids (0-2 are the debugger, coverage and profiler ids,
+    which cProfile uses; 5 is the optimizer's), so standard tools keep
+    working alongside instrumented lists.
+    """
+
+    TOOL_IDS = (3, 4)
+
+    tool: Optional[int] = None
+    active = False
+    nodes = 0
+    depth = 0
+    max_depth = 0
+
+    @classmethod
+    def acquire(cls) -> int:
+        mon = sys.monitoring
+        free = [t for t in cls.TOOL_IDS if mon.get_tool(t) is None]
+        if not free:
+            raise RuntimeError("no free sys.monitoring tool id")
+        cls.tool = free[0]
+        mon.use_tool_id(cls.tool, "linkedlist-instrumentation")
+        mon.register_callback(cls.tool, _events.JUMP, _on_jump)
+        mon.register_callback(cls.tool, _events.PY_START, _on_start)
+        mon.register_callback(cls.tool, _events.PY_RETURN, _on_return)
+        return cls.tool
+
+    @classmethod
+    def release(cls) -> None:
+        mon = sys.monitoring
+        for event in (_events.JUMP, _events.PY_START, _events.PY_RETURN):
+            mon.register_callback(cls.tool, event, None)
+        mon.free_tool_id(cls.tool)
+        cls.tool = None
+
+
+def _on_jump(code: Any, offset: int, dest: int) -> None:
+    if dest < offset:  # a loop's back-edge: one more iteration
+        _Monitor.nodes += 1
+
+
+def _on_start(code: Any, offset: int) -> None:
+    _Monitor.nodes += 1
+    _Monitor.depth += 1
+    if _Monitor.depth > _Monitor.max_depth:
+        _Monitor.max_depth = _Monitor.depth
+
+
+def _on_return(code: Any, offset: int, retval: Any) -> None:
+    _Monitor.depth -= 1
+
+
+def _wrap(op: str, method: Callable, codes: list) -> Callable:
+    masks = [
+        (code, _REC_EVENTS if code.co_name.endswith("_rec") else _JUMP)
+        for code in codes
+        if code.co_name.endswith("_rec") or _has_loop(code)
+    ]
+    set_events = sys.monitoring.set_local_events
+    clock = time.perf_counter
+
+    def measure(metrics: Metrics, self: Any, *args: Any, **kwargs: Any) -> Any:
+        tool = _Monitor.acquire()
+        _Monitor.active = True
+        _Monitor.nodes = _Monitor.depth = _Monitor.max_depth = 0
+        for code, mask in masks:
+            set_events(tool, code, mask)
+        start = clock()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            elapsed = clock() - start
+            for code, _ in masks:
+                set_events(tool, code, 0)
+            _Monitor.release()
+            _Monitor.active = False
+            metrics._record(op, elapsed, _Monitor.nodes, _Monitor.max_depth)
+
+    return wraps(method)(_forwarder(method, measure))
+
+
+# The wrapper is generated with the wrapped method's own parameter list:
+# forwarding through ``*args, **kwargs`` would double the cost of a cheap
+# call like push_back even when nothing is being recorded.
+_FORWARDER = """
+def measured({params}):
+    metrics = {self}._metrics
+    if metrics is None or not metrics.enabled or _Monitor.active:
+        # off, paused, or nested inside another measured call (which counts it)
+        return _method({args})
+    return _measure(metrics, {args})
+"""
+
+
+def _forwarder(method: Callable, measure: Callable) -> Callable:
+    """Return ``measured(...)`` with `method`'s signature, calling `method`
+    directly when not recording and `measure` otherwise."""
+    try:
+        params = list(inspect.signature(method).parameters.values())
+    except (TypeError, ValueError):
+        params = []
+    reserved = {"metrics", "_method", "_measure", "_Monitor"}
+    if not params or any(p.name in reserved for p in params):
+        def measured(self: Any, *args: Any, **kwargs: Any) -> Any:
+            metrics = self._metrics
+            if metrics is None or not metrics.enabled or _Monitor.active:
+                return method(self, *args, **kwargs)
+            return measure(metrics, self, *args, **kwargs)
+
+        return measured
+
+    decl, call, defaults, kwdefaults = [], [], [], {}
+    positional_only = False
+    for p in params:
+        if positional_only and p.kind is not p.POSITIONAL_ONLY:
+            decl.append("/")
+        positional_only = p.kind is p.POSITIONAL_ONLY
+        if p.kind is p.VAR_POSITIONAL:
+            decl.append(f"*{p.name}")
+            call.append(f"*{p.name}")
+        elif p.kind is p.VAR_KEYWORD:
+            decl.append(f"**{p.name}")
+            call.append(f"**{p.name}")
+        elif p.kind is p.KEYWORD_ONLY:
+            if not any(d.startswith("*") for d in decl):
+                decl.append("*")
+            decl.append(p.name)
+            call.append(f"{p.name}={p.name}")
+            if p.default is not p.empty:
+                kwdefaults[p.name] = p.default
+        else:
+            decl.append(p.name)
+            call.append(p.name)
+            if p.default is not p.empty:
+                defaults.append(p.default)
+    if positional_only:
+        decl.append("/")
+
+    namespace = {"_method": method, "_measure": measure, "_Monitor": _Monitor}
+    source = _FORWARDER.format(params=", ".join(decl), self=params[0].name, args=", ".join(call))
+    exec(source, namespace)
+    measured = namespace["measured"]
+    measured.__defaults__ = tuple(defaults) or None
+    measured.__kwdefaults__ = kwdefaults or None
+    return measured
+
+
+def _has_loop(code: Any) -> bool:
+    return any(ins.opname.startswith("JUMP_BACKWARD") for ins in dis.get_instructions(code))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
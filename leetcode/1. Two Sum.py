@@ -1,5 +1,12 @@
+from __future__ import annotations
+
 from typing import List
 
+try:
+    import numpy as np
+except ImportError:  # optional: only needed for twoSumBatch's fast path
+    np = None
+
 
 class Solution:
     def twoSum_brute(self, nums: List[int], target: int) -> List[int]:
@@ -37,3 +44,104 @@ class Solution:
             mp[n] = i
 
         return [-1, -1]
+
+    def twoSumBatch(self, nums: List[int], targets: List[int]) -> List[List[int]]:
+        """Run `twoSum_optimal` for every target, vectorised when NumPy is available."""
+        if np is None:
+            return [self.twoSum_optimal(nums, t) for t in targets]
+        return TwoSumIndex(nums).query(targets)
+
+
+class TwoSumIndex:
+    """
+    Answer many Two Sum targets against one fixed `nums`.
+
+    The index is built once: the stable sort of `nums`, plus, for integer
+    input with a compact value range, a direct-address table of each
+    value's first index. Each query then scans the candidate second
+    index ``j`` in blocks, for a chunk of targets at a time, with
+    vectorised NumPy lookups. Every target gets the pair
+    `Solution.twoSum_optimal` would return: the smallest ``j`` that
+    completes a pair, with the *last* earlier index holding the complement.
+    """
+
+    J_BLOCK = 1024  # second-index candidates examined per step
+    T_CHUNK = 1024  # targets handled together (T_CHUNK x J_BLOCK work arrays)
+    TABLE_SLACK = 100  # direct table allowed up to TABLE_SLACK * n slots ...
+    TABLE_MAX = 1 << 24  # ... but never more than this many (64 MiB)
+
+    def __init__(self, nums: List[int]) -> None:
+        self.nums = np.asarray(nums)
+        self.order = np.argsort(self.nums, kind="stable")
+        self.sorted = self.nums[self.order]
+
+        self.first = None
+        n = len(self.nums)
+        if n and self.nums.dtype.kind in "iu":
+            self.low = int(self.sorted[0])
+            span = int(self.sorted[-1]) - self.low + 1
+            if span <= min(self.TABLE_SLACK * n, self.TABLE_MAX):
+                values, first_idx = np.unique(self.nums, return_index=True)
+                self.first = np.full(span, n, dtype=np.int32)  # n: "absent"
+                self.first[values - self.low] = first_idx
+
+    def query(self, targets: List[int]) -> List[List[int]]:
+        targets = np.asarray(targets)
+        out = np.full((len(targets), 2), -1, dtype=np.int64)
+        for start in range(0, len(targets), self.T_CHUNK):
+            chunk = slice(start, start + self.T_CHUNK)
+            out[chunk] = self._query_chunk(targets[chunk])
+        return out.tolist()
+
+    def _first_index(self, comp: np.ndarray) -> np.ndarray:
+        """Index of each complement's first occurrence (n when absent)."""
+        n = len(self.nums)
+        # Non-integer complements (a float target) can't index the table.
+        if self.first is not None and comp.dtype.kind in "iu":
+            slot = comp - self.low
+            inside = (slot >= 0) & (slot < len(self.first))
+            return np.where(inside, self.first[np.where(inside, slot, 0)], n)
+
+        lo = np.searchsorted(self.sorted, comp, side="left")
+        found = self.sorted[np.minimum(lo, n - 1)] == comp
+        # Equal values keep index order, so order[lo] is the first occurrence.
+        return np.where(found, self.order[np.minimum(lo, n - 1)], n)
+
+    def _query_chunk(self, targets: np.ndarray) -> np.ndarray:
+        nums = self.nums
+        n = len(nums)
+        out = np.full((len(targets), 2), -1, dtype=np.int64)
+        pending = np.arange(len(targets))
+
+        for j0 in range(1, n, self.J_BLOCK):
+            if len(pending) == 0:
+                break
+            js = np.arange(j0, min(j0 + self.J_BLOCK, n))
+            comp = targets[pending, None] - nums[js][None, :]
+            hit = self._first_index(comp) < js[None, :]
+
+            rows = np.flatnonzero(hit.any(axis=1))
+            if len(rows) == 0:
+                continue
+            cols = hit[rows].argmax(axis=1)  # first j in this block
+            j = js[cols]
+            out[pending[rows], 0] = self._last_before(comp[rows, cols], j)
+            out[pending[rows], 1] = j
+            pending = np.delete(pending, rows)
+
+        return out
+
+    def _last_before(self, comp: np.ndarray, j: np.ndarray) -> np.ndarray:
+        """Largest index < j holding each complement (vectorised bisect)."""
+        order = self.order
+        lo = np.searchsorted(self.sorted, comp, side="left")
+        hi = np.searchsorted(self.sorted, comp, side="right")
+        while True:
+            active = lo < hi
+            if not active.any():
+                break
+            mid = (lo + hi) // 2
+            below = active & (order[np.minimum(mid, len(order) - 1)] < j)
+            lo = np.where(below, mid + 1, lo)
+            hi = np.where(active & ~below, mid, hi)
+        return order[lo - 1]
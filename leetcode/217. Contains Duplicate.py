@@ -1,4 +1,5 @@
-from typing import List
+import math
+from typing import Callable, Hashable, Iterable, List, Union
 
 
 class Solution:
@@ -14,3 +15,129 @@ class Solution:
             if nums[i] == nums[i + 1]:
                 return True
         return False
+
+    def containsDuplicate_optimal(self, nums: List[int]) -> bool:
+        return len(set(nums)) != len(nums)
+
+    def containsDuplicate_stream(self, nums: Iterable[Hashable]) -> bool:
+        # Works on any iterable (e.g. a generator over a file) and stops
+        # consuming it at the first repeat.
+        seen = set()
+        for n in nums:
+            if n in seen:
+                return True
+            seen.add(n)
+        return False
+
+    def containsDuplicate_bloom(
+        self,
+        nums: Union[Iterable[Hashable], Callable[[], Iterable[Hashable]]],
+        capacity: int = 1 << 20,
+        error_rate: float = 0.01,
+    ) -> bool:
+        # Memory-bounded two-pass check for streams too large for a set.
+        # Pass 1 runs the values through a scalable Bloom filter that
+        # starts sized for `capacity` items and adds larger stages as it
+        # fills, so it never saturates however long the stream is; only
+        # values that look seen become suspects.
+        # A suspect that shows up again is a certain duplicate. Pass 2
+        # counts the remaining suspects exactly, which rules out Bloom
+        # false positives. Memory is the bit arrays (O(n) bits) plus the
+        # suspects (about error_rate * n + number of duplicated values).
+        #
+        # `nums` must be re-iterable (a list, or a zero-argument callable
+        # returning a fresh iterator, e.g. ``lambda: open(path)``).
+        source = nums if callable(nums) else lambda: nums
+        if not callable(nums) and iter(nums) is nums:
+            raise TypeError("containsDuplicate_bloom needs a re-iterable source")
+
+        bloom = ScalableBloomFilter(capacity, error_rate)
+        suspects = set()
+        for n in source():
+            if n in suspects:
+                return True
+            if not bloom.add(n):
+                suspects.add(n)
+
+        if not suspects:
+            return False
+
+        counted = set()
+        for n in source():
+            if n in suspects:
+                if n in counted:
+                    return True
+                counted.add(n)
+        return False
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over hashable values, backed by a bytearray."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value: Hashable) -> range:
+        # Spread hash() (the identity for small ints) with a 64-bit
+        # multiplicative mix, then derive k positions by double hashing:
+        # position i is (h1 + i * h2) % size, taken from this range.
+        h = (hash(value) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        h1, h2 = h >> 32, (h & 0xFFFFFFFF) | 1
+        return range(h1, h1 + self.hashes * h2, h2)
+
+    def add(self, value: Hashable) -> bool:
+        """Insert `value`; return True if it was definitely not present before."""
+        new = False
+        bits, size = self.bits, self.size
+        for pos in self._positions(value):
+            pos %= size
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                new = True
+        return new
+
+    def __contains__(self, value: Hashable) -> bool:
+        bits, size = self.bits, self.size
+        for pos in self._positions(value):
+            pos %= size
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+
+class ScalableBloomFilter:
+    """Bloom filter that grows in stages instead of saturating.
+
+    Each stage holds twice as many items as the one before at half its
+    error rate, so the combined false-positive rate stays below
+    `error_rate` (1/2 + 1/4 + ... < 1) for any number of items.
+    """
+
+    GROWTH = 2
+    TIGHTENING = 0.5
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        self.stages = [BloomFilter(self.capacity, error_rate * self.TIGHTENING)]
+        self.count = 0  # items added to the newest stage
+
+    def add(self, value: Hashable) -> bool:
+        """Insert `value`; return True if it was definitely not present before."""
+        if value in self:
+            return False
+        if self.count >= self.capacity:
+            self.capacity *= self.GROWTH
+            rate = self.error_rate * self.TIGHTENING ** (len(self.stages) + 1)
+            self.stages.append(BloomFilter(self.capacity, rate))
+            self.count = 0
+        self.stages[-1].add(value)
+        self.count += 1
+        return True
+
+    def __contains__(self, value: Hashable) -> bool:
+        return any(value in stage for stage in self.stages)
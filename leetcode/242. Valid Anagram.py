@@ -1,5 +1,17 @@
-from collections import defaultdict
+from __future__ import annotations
+
+from collections import Counter, defaultdict
 from itertools import permutations
+from typing import Union
+
+try:
+    import numpy as np
+except ImportError:  # optional: only used by isAnagram_fast's byte histogram
+    np = None
+
+# Strings with at most this many distinct characters are compared with
+# one C-level str.count scan per character instead of a dict counter.
+SMALL_ALPHABET = 64
 
 
 class Solution:
@@ -36,3 +48,36 @@ class Solution:
             diff[ord(t[i]) - 97] += 1
 
         return all(v == 0 for v in diff)
+
+    def isAnagram_fast(self, s: Union[str, bytes], t: Union[str, bytes]) -> bool:
+        # Picks a strategy by alphabet; correct for any str or bytes input.
+        #   ASCII / bytes + NumPy -> 256-bin byte histogram (np.bincount)
+        #   small alphabet        -> str.count / bytes.count per symbol
+        #   general Unicode       -> dict counter (collections.Counter)
+        # Mixed str / bytes is rejected up front, whichever path would run.
+        if isinstance(s, str) != isinstance(t, str):
+            raise TypeError(f"cannot compare {type(s).__name__} with {type(t).__name__}")
+        if len(s) != len(t):
+            return False
+
+        bs, bt = _ascii_bytes(s), _ascii_bytes(t)
+        if np is not None and bs is not None and bt is not None:
+            return np.array_equal(
+                np.bincount(np.frombuffer(bs, np.uint8), minlength=256),
+                np.bincount(np.frombuffer(bt, np.uint8), minlength=256),
+            )
+
+        alphabet = set(s)
+        if len(alphabet) <= SMALL_ALPHABET:
+            # Equal lengths + equal counts for every symbol of s leaves no
+            # room for t to contain anything else.
+            return all(s.count(c) == t.count(c) for c in alphabet)
+
+        return Counter(s) == Counter(t)
+
+
+def _ascii_bytes(x: Union[str, bytes]) -> Union[bytes, None]:
+    """Return `x` as one byte per symbol, or None for non-ASCII text."""
+    if isinstance(x, str):
+        return x.encode("ascii") if x.isascii() else None
+    return x
@@ -1,5 +1,14 @@
+import math
+import multiprocessing
+import os
+import pickle
+import sys
+import tempfile
 from collections import defaultdict
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import BinaryIO, Dict, Hashable, Iterable, Iterator, List, Optional, Union
 
 
 class Solution:
@@ -19,3 +28,230 @@ class Solution:
                 count[ord(c) - 97] += 1
             mp[tuple(count)].append(s)
         return list(mp.values())
+
+    def groupAnagrams_parallel(
+        self, strs: List[str], workers: Optional[int] = None, min_shard: int = 50_000
+    ) -> List[List[str]]:
+        # Keys are computed for contiguous shards on a process pool, then
+        # grouped here shard by shard. Merging in shard order reproduces
+        # the sequential first-occurrence order of groups and of words
+        # within each group, so the output equals groupAnagrams_optimal's.
+        # This file's name is not importable, so spawned or forkserver
+        # workers could not load `anagram_keys`: the pool is only used
+        # with the fork start method, else keys are computed in-process.
+        workers = workers or os.cpu_count() or 1
+        shards = max(1, min(workers, len(strs) // min_shard))
+        context = _fork_context() if shards > 1 else None
+        keys = None
+        if context is not None:
+            size = -(-len(strs) // shards)
+            chunks = [strs[i : i + size] for i in range(0, len(strs), size)]
+            try:
+                with ProcessPoolExecutor(max_workers=shards, mp_context=context) as pool:
+                    keys = [k for shard in pool.map(anagram_keys, chunks) for k in shard]
+            except BrokenProcessPool:
+                keys = None
+        if keys is None:
+            keys = anagram_keys(strs)
+
+        mp = defaultdict(list)
+        for k, s in zip(keys, strs):
+            mp[k].append(s)
+        return list(mp.values())
+
+    def groupAnagrams_stream(
+        self,
+        strs: Union[Iterable[str], str, os.PathLike],
+        chunk_size: int = 10_000,
+        memory_budget: int = 64 << 20,
+        partitions: int = 16,
+        tmpdir: Optional[str] = None,
+    ) -> Iterator[List[str]]:
+        # Generator pipeline for inputs larger than RAM. `strs` is an
+        # iterable of words or a path to a file with one word per line.
+        # Words are keyed in chunks; when the estimated size of the group
+        # table passes `memory_budget` bytes, the table is spilled to
+        # `partitions` temp files by key hash. At the end each partition
+        # is merged and its groups yielded, so peak memory stays around
+        # the budget. Words keep their input order within each group.
+        # Groups come out in first-occurrence order unless something was
+        # spilled, in which case that order only holds per partition.
+        grouper = _SpillingGrouper(memory_budget, partitions, tmpdir)
+        with grouper:
+            if isinstance(strs, (str, os.PathLike)):
+                strs = _read_words(strs)
+            words = iter(strs)
+            while chunk := list(islice(words, chunk_size)):
+                grouper.add(chunk, anagram_keys(chunk))
+            yield from grouper.groups()
+
+
+# One prime per lowercase letter: a word's product of primes is unique to
+# its letter multiset (unique factorisation), and Python ints never
+# overflow, so the key is exact with no collision checks needed.
+LETTER_PRIMES = dict(
+    zip(
+        "abcdefghijklmnopqrstuvwxyz",
+        [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41,
+         43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97, 101],
+    )
+)
+
+
+def anagram_keys(strs: List[str]) -> List[Hashable]:
+    """Compact anagram key per word: prime product, or sorted text off a-z."""
+    primes = LETTER_PRIMES.__getitem__
+    keys = []
+    for s in strs:
+        try:
+            keys.append(math.prod(map(primes, s)))
+        except KeyError:  # not plain a-z: an int key can never equal a str key
+            keys.append("".join(sorted(s)))
+    return keys
+
+
+def _fork_context() -> Optional[multiprocessing.context.BaseContext]:
+    """The fork context, if available and `anagram_keys` pickles by name.
+
+    Forked workers inherit this module, so the worker only has to be
+    found under its registered name (e.g. via `sys.modules`).
+    """
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return None
+    try:
+        pickle.dumps(anagram_keys)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return None
+    return multiprocessing.get_context("fork")
+
+
+def _read_words(path: Union[str, os.PathLike]) -> Iterator[str]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            word = line.rstrip("\r\n")
+            if word:
+                yield word
+
+
+class _SpillingGrouper:
+    """Group table that spills to hash-partitioned temp files over budget."""
+
+    GROUP_OVERHEAD = 150  # rough bytes per group: dict slot, list, key
+    MAX_DEPTH = 3  # re-partitioning rounds for oversized partitions
+
+    def __init__(
+        self, memory_budget: int, partitions: int, tmpdir: Optional[str]
+    ) -> None:
+        self.memory_budget = memory_budget
+        self.partitions = partitions
+        self.tmpdir = tmpdir
+        # key -> [first sequence number, words]
+        self.table: Dict[Hashable, list] = {}
+        self.estimate = 0
+        self.seq = 0
+        self.spill_dir: Optional[tempfile.TemporaryDirectory] = None
+
+    def __enter__(self) -> "_SpillingGrouper":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self.spill_dir is not None:
+            self.spill_dir.cleanup()
+
+    def add(self, words: List[str], keys: List[Hashable]) -> None:
+        table = self.table
+        for key, word in zip(keys, words):
+            entry = table.get(key)
+            if entry is None:
+                table[key] = entry = [self.seq, []]
+                self.estimate += self.GROUP_OVERHEAD + sys.getsizeof(key)
+            entry[1].append(word)
+            self.estimate += sys.getsizeof(word) + 8
+            self.seq += 1
+
+        if self.estimate > self.memory_budget:
+            self._spill()
+
+    def groups(self) -> Iterator[List[str]]:
+        if self.spill_dir is None:
+            for _, words in self.table.values():
+                yield words
+            return
+
+        self._spill()
+        for part in range(self.partitions):
+            yield from self._merge(self._path(0, part), 0)
+
+    # --------------------------------------------------------------
+    def _path(self, depth: int, part: int, parent: str = "") -> str:
+        return os.path.join(self.spill_dir.name, f"{parent}d{depth}p{part}.pkl")
+
+    def _part(self, key: Hashable, depth: int) -> int:
+        return hash((depth, key)) % self.partitions
+
+    def _spill(self) -> None:
+        if self.spill_dir is None:
+            self.spill_dir = tempfile.TemporaryDirectory(dir=self.tmpdir)
+
+        files: Dict[int, BinaryIO] = {}
+        try:
+            for key, (first, words) in self.table.items():
+                part = self._part(key, 0)
+                f = files.get(part)
+                if f is None:
+                    f = files[part] = open(self._path(0, part), "ab")
+                pickle.dump((first, key, words), f, pickle.HIGHEST_PROTOCOL)
+        finally:
+            for f in files.values():
+                f.close()
+
+        self.table = {}
+        self.estimate = 0
+
+    def _merge(self, path: str, depth: int) -> Iterator[List[str]]:
+        if not os.path.exists(path):
+            return
+
+        if os.path.getsize(path) > self.memory_budget and depth < self.MAX_DEPTH:
+            # Too big to merge in memory: split it again with a new salt.
+            prefix = os.path.basename(path)[:-4] + "-"
+            files = [
+                open(self._path(depth + 1, p, prefix), "wb")
+                for p in range(self.partitions)
+            ]
+            try:
+                for first, key, words in _load_records(path):
+                    pickle.dump(
+                        (first, key, words),
+                        files[self._part(key, depth + 1)],
+                        pickle.HIGHEST_PROTOCOL,
+                    )
+            finally:
+                for f in files:
+                    f.close()
+            os.remove(path)
+            for p in range(self.partitions):
+                yield from self._merge(self._path(depth + 1, p, prefix), depth + 1)
+            return
+
+        merged: Dict[Hashable, list] = {}
+        # Spills are appended in input order, so extending keeps word order.
+        for first, key, words in _load_records(path):
+            entry = merged.get(key)
+            if entry is None:
+                merged[key] = [first, words]
+            else:
+                entry[1].extend(words)
+        os.remove(path)
+
+        for _, words in sorted(merged.values(), key=lambda entry: entry[0]):
+            yield words
+
+
+def _load_records(path: str) -> Iterator[tuple]:
+    with open(path, "rb") as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark harness for the `Solution` variants in leetcode/*.py.
+
+Every method named ``<problem>_<variant>`` (e.g. ``twoSum_brute``,
+``twoSum_optimal``) is treated as one strategy for ``<problem>``.
+For each problem with an input generator below, the harness
+
+  1. builds seeded inputs at each requested size,
+  2. checks that all variants return the same (normalised) answer,
+  3. times every variant and records its peak traced memory.
+
+Variants whose extrapolated run time exceeds the budget are dropped
+at larger sizes, so exponential/quadratic strategies do not stall the run.
+
+    python leetcode/bench.py
+    python leetcode/bench.py --problems twoSum --sizes 10,1000 --json out.json
+
+Head-to-head throughput comparisons for APIs that do not fit the
+one-call-per-input shape (e.g. batch queries) are run with ``--compare``:
+
+    python leetcode/bench.py --compare two_sum_batch
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections.abc
+import importlib.util
+import inspect
+import json
+import math
+import os
+import platform
+import random
+import string
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+HERE = Path(__file__).resolve().parent
+
+DEFAULT_SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+# Variants that cannot run beyond a tiny size (isAnagram_brute tries n! orders).
+SIZE_LIMITS: Dict[str, int] = {"isAnagram_brute": 8}
+
+
+class VariantMismatch(Exception):
+    """Raised when two variants of one problem disagree on the same input."""
+
+
+# ----------------------------------------------------------------------
+# Seeded input generators: (size, rng) -> positional arguments
+# ----------------------------------------------------------------------
+def gen_two_sum(n: int, rng: random.Random) -> Tuple[List[int], int]:
+    # Everything is a multiple of 4 except one pair of values = 1 (mod 4),
+    # so the pair is the only one whose sum is 2 (mod 4): a unique answer.
+    n = max(n, 2)
+    nums = [4 * v for v in rng.sample(range(-10 * n, 10 * n), n)]
+    i, j = rng.sample(range(n), 2)
+    nums[i] += 1
+    nums[j] += 1
+    return nums, nums[i] + nums[j]
+
+
+def gen_contains_duplicate(n: int, rng: random.Random) -> Tuple[List[int]]:
+    # Distinct values except for one duplicate planted near the end.
+    nums = rng.sample(range(-10 * n, 10 * n), n)
+    if n >= 2:
+        nums[rng.randrange(n - max(n // 10, 1), n)] = nums[rng.randrange(n // 2)]
+    return (nums,)
+
+
+def gen_is_anagram(n: int, rng: random.Random) -> Tuple[str, str]:
+    s = "".join(rng.choices(string.ascii_lowercase, k=n))
+    t = list(s)
+    rng.shuffle(t)
+    return s, "".join(t)
+
+
+def gen_group_anagrams(n: int, rng: random.Random) -> Tuple[List[str]]:
+    bases = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8)))
+        for _ in range(max(n // 4, 1))
+    ]
+    words = []
+    for _ in range(n):
+        chars = list(rng.choice(bases))
+        rng.shuffle(chars)
+        words.append("".join(chars))
+    return (words,)
+
+
+GENERATORS: Dict[str, Callable[[int, random.Random], Tuple[Any, ...]]] = {
+    "twoSum": gen_two_sum,
+    "containsDuplicate": gen_contains_duplicate,
+    "isAnagram": gen_is_anagram,
+    "groupAnagrams": gen_group_anagrams,
+}
+
+# Map each answer to a canonical form before comparing variants.
+NORMALISERS: Dict[str, Callable[[Any], Any]] = {
+    "twoSum": sorted,
+    "groupAnagrams": lambda groups: sorted(sorted(g) for g in groups),
+}
+
+
+# ----------------------------------------------------------------------
+# Discovery
+# ----------------------------------------------------------------------
+def load_module(path: Path) -> Any:
+    """Import a leetcode file by path (their names contain spaces and dots)."""
+    name = "leetcode_" + "".join(c if c.isalnum() else "_" for c in path.stem)
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    # Registered so functions defined there pickle by name for forked workers
+    # (spawned ones could not import the module under this name anyway).
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def discover(directory: Path = HERE) -> Dict[str, Dict[str, Callable[..., Any]]]:
+    """Return ``{problem: {variant: bound method}}`` for every `Solution`."""
+    problems: Dict[str, Dict[str, Callable[..., Any]]] = {}
+    for path in sorted(directory.glob("*.py")):
+        if path.resolve() == Path(__file__).resolve():
+            continue
+        solution_cls = getattr(load_module(path), "Solution", None)
+        if solution_cls is None:
+            continue
+
+        solution = solution_cls()
+        for name, _ in inspect.getmembers(solution_cls, inspect.isfunction):
+            problem, sep, variant = name.partition("_")
+            if name.startswith("_") or not sep:
+                continue
+            problems.setdefault(problem, {})[variant] = getattr(solution, name)
+
+    return problems
+
+
+# ----------------------------------------------------------------------
+# Measurement
+# ----------------------------------------------------------------------
+def fresh(args: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """Copy list arguments so in-place variants cannot affect each other."""
+    return tuple(list(a) if isinstance(a, list) else a for a in args)
+
+
+def invoke(method: Callable[..., Any], args: Tuple[Any, ...]) -> Any:
+    """Call `method`; drain lazy results (generators) so their work is counted."""
+    result = method(*args)
+    if isinstance(result, collections.abc.Iterator):
+        result = list(result)
+    return result
+
+
+def check_agreement(
+    problem: str, variants: Dict[str, Callable[..., Any]], args: Tuple[Any, ...]
+) -> None:
+    """Raise `VariantMismatch` unless every variant gives the same answer."""
+    normalise = NORMALISERS.get(problem, lambda r: r)
+    expected: Optional[Tuple[str, Any]] = None
+    for variant, method in variants.items():
+        result = normalise(invoke(method, fresh(args)))
+        if expected is None:
+            expected = (variant, result)
+        elif result != expected[1]:
+            raise VariantMismatch(
+                f"{problem}: {variant} returned {result!r:.80} "
+                f"but {expected[0]} returned {expected[1]!r:.80}"
+            )
+
+
+def time_call(method: Callable[..., Any], args: Tuple[Any, ...], repeat: int) -> float:
+    """Best wall-clock time over `repeat` calls, each on a fresh copy of `args`."""
+    best = float("inf")
+    for _ in range(repeat):
+        call_args = fresh(args)
+        start = time.perf_counter()
+        invoke(method, call_args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(method: Callable[..., Any], args: Tuple[Any, ...]) -> int:
+    """Peak bytes allocated by one call, as seen by tracemalloc."""
+    call_args = fresh(args)
+    tracemalloc.start()
+    try:
+        invoke(method, call_args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def predicted_seconds(history: List[Tuple[int, float]], n: int) -> float:
+    """Extrapolate the next run time from the last two (size, seconds) points."""
+    (n1, t1), (n2, t2) = history[-2:] if len(history) > 1 else (history[0],) * 2
+    exponent = 1.0
+    if n2 > n1 and t1 > 0 and t2 > 0:
+        exponent = max(1.0, math.log(t2 / t1) / math.log(n2 / n1))
+    return t2 * (n / n2) ** exponent
+
+
+def run(
+    problems: Dict[str, Dict[str, Callable[..., Any]]],
+    sizes: Sequence[int],
+    *,
+    seed: int = 0,
+    repeat: int = 3,
+    budget: float = 2.0,
+    check_size: int = 8,
+) -> List[Dict[str, Any]]:
+    """Benchmark every problem that has a generator; return one record per run."""
+    records: List[Dict[str, Any]] = []
+    for problem, variants in problems.items():
+        generate = GENERATORS.get(problem)
+        if generate is None:
+            print(f"skipping {problem}: no input generator", file=sys.stderr)
+            continue
+
+        # Every variant, even the exponential ones, is checked at least once.
+        check_agreement(problem, variants, generate(check_size, random.Random(seed)))
+
+        history: Dict[str, List[Tuple[int, float]]] = {v: [] for v in variants}
+        for n in sizes:
+            active = {
+                v: m
+                for v, m in variants.items()
+                if n <= SIZE_LIMITS.get(f"{problem}_{v}", n)
+                and (not history[v] or predicted_seconds(history[v], n) <= budget)
+            }
+            if not active:
+                break
+
+            args = generate(n, random.Random(seed))
+            check_agreement(problem, active, args)
+            for variant, method in active.items():
+                seconds = time_call(method, args, repeat)
+                history[variant].append((n, seconds))
+                records.append(
+                    {
+                        "problem": problem,
+                        "variant": variant,
+                        "size": n,
+                        "seconds": seconds,
+                        "peak_bytes": peak_memory(method, args),
+                    }
+                )
+
+    return records
+
+
+# ----------------------------------------------------------------------
+# Throughput comparisons
+# ----------------------------------------------------------------------
+COMPARISONS: Dict[str, Callable[[int], List[Dict[str, Any]]]] = {}
+
+
+def comparison(func: Callable[[int], List[Dict[str, Any]]]) -> Callable[..., Any]:
+    """Register `func` for ``--compare`` under its name minus ``compare_``."""
+    COMPARISONS[func.__name__.removeprefix("compare_")] = func
+    return func
+
+
+def load_problem(filename: str) -> Any:
+    return load_module(HERE / filename)
+
+
+@comparison
+def compare_two_sum_batch(seed: int) -> List[Dict[str, Any]]:
+    """twoSumBatch vs twoSum_optimal called once per target."""
+    module = load_problem("1. Two Sum.py")
+    solution = module.Solution()
+    rng = random.Random(seed)
+    records = []
+    for n, m in ((10_000, 1_000), (100_000, 1_000)):
+        nums, _ = gen_two_sum(n, rng)
+        # Half the targets have a pair, half (odd sums) cannot.
+        targets = [rng.choice(nums) + rng.choice(nums) for _ in range(m // 2)]
+        targets += [2 * rng.randrange(-10 * n, 10 * n) + 1 for _ in range(m - m // 2)]
+
+        start = time.perf_counter()
+        expected = [solution.twoSum_optimal(nums, t) for t in targets]
+        loop = time.perf_counter() - start
+
+        start = time.perf_counter()
+        got = solution.twoSumBatch(nums, targets)
+        batch = time.perf_counter() - start
+        if got != expected:
+            raise VariantMismatch("twoSumBatch disagrees with twoSum_optimal")
+
+        for label, seconds in (("optimal loop", loop), ("twoSumBatch", batch)):
+            records.append(
+                {
+                    "problem": "twoSum",
+                    "variant": label,
+                    "size": n,
+                    "queries": m,
+                    "seconds": seconds,
+                    "queries_per_sec": m / seconds,
+                }
+            )
+
+    return records
+
+
+@comparison
+def compare_anagram_alphabets(seed: int) -> List[Dict[str, Any]]:
+    """isAnagram_fast vs isAnagram_map on long strings over several alphabets."""
+    solution = load_problem("242. Valid Anagram.py").Solution()
+    rng = random.Random(seed)
+    alphabets = {
+        "lowercase": string.ascii_lowercase,
+        "printable": string.printable,
+        "latin-1": "".join(map(chr, range(0xC0, 0x100))),
+        "cjk": "".join(map(chr, range(0x4E00, 0x4E00 + 2000))),
+    }
+    n = 1_000_000
+    records = []
+    for name, alphabet in alphabets.items():
+        s = "".join(rng.choices(alphabet, k=n))
+        chars = list(s)
+        rng.shuffle(chars)
+        t = "".join(chars)
+        for variant in ("map", "fast"):
+            method = getattr(solution, f"isAnagram_{variant}")
+            if not method(s, t) or method(s, t[1:] + "!"):
+                raise VariantMismatch(f"isAnagram_{variant} wrong on {name} input")
+            records.append(
+                {
+                    "problem": f"isAnagram[{name}]",
+                    "variant": variant,
+                    "size": n,
+                    "seconds": time_call(method, (s, t), repeat=3),
+                }
+            )
+
+    return records
+
+
+@comparison
+def compare_group_anagrams_scaling(seed: int) -> List[Dict[str, Any]]:
+    """groupAnagrams_parallel across worker counts vs groupAnagrams_optimal."""
+    solution = load_problem("49. Group Anagrams.py").Solution()
+    (words,) = gen_group_anagrams(1_000_000, random.Random(seed))
+    expected = solution.groupAnagrams_optimal(words)
+
+    counts = sorted({1, 2, 4, 8, os.cpu_count() or 1})
+    runs: List[Tuple[str, Callable[[], Any]]] = [
+        ("optimal", lambda: solution.groupAnagrams_optimal(words))
+    ]
+    runs += [
+        (f"parallel x{w}", lambda w=w: solution.groupAnagrams_parallel(words, workers=w))
+        for w in counts
+    ]
+
+    records = []
+    for label, call in runs:
+        if call() != expected:
+            raise VariantMismatch(f"groupAnagrams {label} disagrees with optimal")
+        records.append(
+            {
+                "problem": "groupAnagrams",
+                "variant": label,
+                "size": len(words),
+                "seconds": time_call(call, (), repeat=1),
+            }
+        )
+
+    return records
+
+
+@comparison
+def compare_group_anagrams_spill(seed: int) -> List[Dict[str, Any]]:
+    """Time and peak memory of groupAnagrams_stream from a file at several budgets."""
+    import tempfile
+
+    solution = load_problem("49. Group Anagrams.py").Solution()
+    (words,) = gen_group_anagrams(500_000, random.Random(seed))
+    normalise = NORMALISERS["groupAnagrams"]
+    expected = normalise(solution.groupAnagrams_optimal(words))
+
+    records = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "words.txt"
+        path.write_text("\n".join(words) + "\n")
+
+        runs: List[Tuple[str, Callable[[], Iterable[List[str]]]]] = [
+            (
+                "optimal (loads file)",
+                lambda: solution.groupAnagrams_optimal(path.read_text().split()),
+            )
+        ]
+        for budget in (64 << 20, 8 << 20, 1 << 20):
+            runs.append(
+                (
+                    f"stream {budget >> 20} MiB",
+                    lambda b=budget: solution.groupAnagrams_stream(
+                        path, memory_budget=b, tmpdir=tmp
+                    ),
+                )
+            )
+
+        for label, call in runs:
+            if normalise(call()) != expected:
+                raise VariantMismatch(f"groupAnagrams {label} disagrees with optimal")
+
+            # Consume groups one at a time, as a streaming caller would.
+            def drain() -> int:
+                return sum(1 for _ in call())
+
+            records.append(
+                {
+                    "problem": "groupAnagrams",
+                    "variant": label,
+                    "size": len(words),
+                    "seconds": time_call(drain, (), repeat=1),
+                    "peak_bytes": peak_memory(drain, ()),
+                }
+            )
+
+    return records
+
+
+# ----------------------------------------------------------------------
+# Reporting
+# ----------------------------------------------------------------------
+def format_table(records: List[Dict[str, Any]]) -> str:
+    headers = ["problem", "variant", "size", "time (ms)"]
+    # Extra numeric columns (peak memory, throughput, ...) appear when present.
+    extras = [
+        k for k in ("peak_bytes", "queries", "queries_per_sec") if records and k in records[0]
+    ]
+    headers += extras
+    rows = [
+        [
+            r["problem"],
+            r["variant"],
+            f"{r['size']:,}",
+            f"{r['seconds'] * 1e3:.3f}",
+            *(f"{r[k]:,.0f}" for k in extras),
+        ]
+        for r in records
+    ]
+    widths = [max(len(str(c)) for c in col) for col in zip(headers, *rows)]
+    lines = ["  ".join(h.rjust(w) for h, w in zip(headers, widths))]
+    lines.append("  ".join("-" * w for w in widths))
+    lines += ["  ".join(c.rjust(w) for c, w in zip(row, widths)) for row in rows]
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--problems", help="comma-separated problem names (default: all)")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(map(str, DEFAULT_SIZES)),
+        help="comma-separated input sizes",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per point")
+    parser.add_argument(
+        "--budget", type=float, default=2.0, help="max predicted seconds per call"
+    )
+    parser.add_argument("--json", type=Path, help="also write the records here")
+    parser.add_argument(
+        "--compare",
+        choices=sorted(COMPARISONS),
+        help="run one throughput comparison instead of the size sweep",
+    )
+    args = parser.parse_args(argv)
+
+    problems = discover()
+    if args.problems:
+        wanted = args.problems.split(",")
+        unknown = set(wanted) - set(problems)
+        if unknown:
+            parser.error(f"unknown problem(s): {', '.join(sorted(unknown))}")
+        problems = {p: problems[p] for p in wanted}
+
+    sizes = sorted(int(s) for s in args.sizes.split(","))
+    try:
+        if args.compare:
+            records = COMPARISONS[args.compare](args.seed)
+        else:
+            records = run(
+                problems, sizes, seed=args.seed, repeat=args.repeat, budget=args.budget
+            )
+    except VariantMismatch as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+
+    print(format_table(records))
+    if args.json:
+        payload = {
+            "seed": args.seed,
+            "python": platform.python_version(),
+            "records": records,
+        }
+        args.json.write_text(json.dumps(payload, indent=2) + "\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
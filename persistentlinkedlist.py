@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Immutable singly-linked list whose operations return new versions that
+share unchanged suffixes with the old ones.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from linkedlist import Node, _build_chain
+
+
+def _copy_prefix(head: Optional[Node], count: int, suffix: Optional[Node]) -> Optional[Node]:
+    """Copy the first `count` nodes from `head` in one pass and link the
+    copy onto the shared `suffix`. Returns the new head."""
+    snt = Node(None)
+    tail = snt
+    cur = head
+    for _ in range(count):
+        tail.next = tail = Node(cur.data)
+        cur = cur.next
+    tail.next = suffix
+    return snt.next
+
+
+class PersistentLinkedList:
+    """
+    Persistent (immutable, structurally shared) linked list.
+
+    Every "modifying" method leaves the list untouched and returns a new
+    version. Versions share nodes: `push_front` and `pop_front` are O(1)
+    and copy nothing, while `insert`, `set` and `delete` copy only the
+    nodes in front of the change and reuse the rest. Old versions stay
+    valid and unchanged, so they make free snapshots and can be read
+    from any number of threads without locking.
+
+    The shared `Node` objects (`head`, `find`) must be treated as
+    read-only: assigning to their `data` or `next` would change every
+    version that shares them.
+    """
+
+    __slots__ = ("_head", "_size", "_hash")
+
+    def __init__(self, iterable: Optional[Iterable[Any]] = None) -> None:
+        """Create an empty list (or one holding the values of `iterable`)."""
+        head, _, count = _build_chain(iterable if iterable is not None else ())
+        self._head: Optional[Node] = head
+        self._size: int = count
+        self._hash: Optional[int] = None
+
+    @classmethod
+    def _make(cls, head: Optional[Node], size: int) -> PersistentLinkedList:
+        pl = cls.__new__(cls)
+        pl._head = head
+        pl._size = size
+        pl._hash = None
+        return pl
+
+    @property
+    def head(self) -> Optional[Node]:
+        return self._head
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        cur = self._head
+        while cur:
+            yield cur.data
+            cur = cur.next
+
+    def __repr__(self) -> str:
+        values = ", ".join(repr(v) for v in self)
+        return f"PersistentLinkedList([{values}])"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PersistentLinkedList):
+            return NotImplemented
+        if self._size != other._size:
+            return False
+        a, b = self._head, other._head
+        while a is not b:  # a shared suffix is equal by construction
+            if a.data != b.data:
+                return False
+            a, b = a.next, b.next
+        return True
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(tuple(self))
+        return self._hash
+
+    def __reduce__(self) -> tuple:
+        # The default would pickle the chain recursively, one level per node.
+        return type(self), (list(self),)
+
+    # -----------------------------------------------------------------
+    # O(1) versions
+    # -----------------------------------------------------------------
+    def push_front(self, value: Any) -> PersistentLinkedList:
+        """Return a version with `value` in front, sharing every node of this one."""
+        return self._make(Node(value, self._head), self._size + 1)
+
+    cons = push_front
+
+    def pop_front(self) -> tuple[Any, PersistentLinkedList]:
+        """Return ``(first value, version without it)``; the rest is shared."""
+        if self._head is None:
+            raise IndexError("pop from empty list")
+        return self._head.data, self._make(self._head.next, self._size - 1)
+
+    # -----------------------------------------------------------------
+    # Versions copying a prefix
+    # -----------------------------------------------------------------
+    def insert(self, index: int, value: Any) -> PersistentLinkedList:
+        """Return a version with `value` inserted before position `index`.
+
+        Indices follow `list.insert`. Copies the `index` nodes in front.
+        """
+        if index < 0:
+            index = max(0, index + self._size)
+        index = min(index, self._size)
+        rest = self._node_at(index)
+        return self._make(_copy_prefix(self._head, index, Node(value, rest)), self._size + 1)
+
+    def set(self, index: int, value: Any) -> PersistentLinkedList:
+        """Return a version with position `index` holding `value`.
+
+        Copies the nodes up to and including `index`.
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("list index out of range")
+        node = self._node_at(index)
+        return self._make(_copy_prefix(self._head, index, Node(value, node.next)), self._size)
+
+    def delete(self, value: Any) -> PersistentLinkedList:
+        """Return a version without the first node equal to `value`.
+
+        Copies the nodes in front of it; returns this very list (``is``)
+        when `value` is absent.
+        """
+        index = 0
+        cur = self._head
+        while cur is not None and cur.data != value:
+            index += 1
+            cur = cur.next
+        if cur is None:
+            return self
+        return self._make(_copy_prefix(self._head, index, cur.next), self._size - 1)
+
+    # -----------------------------------------------------------------
+    # Versions copying everything
+    # -----------------------------------------------------------------
+    def push_back(self, value: Any) -> PersistentLinkedList:
+        """Return a version with `value` appended (copies all n nodes)."""
+        return self.extend((value,))
+
+    def extend(self, iterable: Iterable[Any]) -> PersistentLinkedList:
+        """Return a version with the values of `iterable` appended.
+
+        Copies this list's nodes, since its last node gains a successor.
+        """
+        head, _, count = _build_chain(iterable)
+        if head is None:
+            return self
+        return self._make(_copy_prefix(self._head, self._size, head), self._size + count)
+
+    def reverse(self) -> PersistentLinkedList:
+        """Return the reversed version (new nodes; nothing can be shared)."""
+        node = None
+        for value in self:
+            node = Node(value, node)
+        return self._make(node, self._size)
+
+    def apply(self, func: Callable[[Any], Any]) -> PersistentLinkedList:
+        """Return a version holding ``func(v)`` for every value ``v``."""
+        head, _, count = _build_chain(map(func, self))
+        return self._make(head, count)
+
+    # -----------------------------------------------------------------
+    # Search
+    # -----------------------------------------------------------------
+    def find(self, value: Any) -> Optional[Node]:
+        """Return the first node equal to `value`, or None (read-only)."""
+        cur = self._head
+        while cur:
+            if cur.data == value:
+                return cur
+            cur = cur.next
+        return None
+
+    def __contains__(self, value: Any) -> bool:
+        return self.find(value) is not None
+
+    # -----------------------------------------------------------------
+    # Helper methods (private)
+    # -----------------------------------------------------------------
+    def _node_at(self, index: int) -> Optional[Node]:
+        """Return the node at position `index` (None at ``len(self)``)."""
+        cur = self._head
+        for _ in range(index):
+            cur = cur.next
+        return cur
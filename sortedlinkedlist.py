@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Sorted singly-linked list with skip-list express lanes for expected
+O(log n) search, insertion and deletion.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Iterable, Iterator, Optional
+
+from linkedlist import Node
+
+# Chance that a node reaching one lane is promoted to the next one up;
+# 1/4 keeps ~1/3 lane entry per node and ~4 hops per level (as in Redis).
+PROMOTE_P = 0.25
+MAX_LEVELS = 32
+
+
+class _Lane:
+    """An express-lane entry standing above the base `node`."""
+
+    __slots__ = ("node", "next", "down")
+
+    def __init__(self, node: Node, nxt: Optional[_Lane] = None, down: Optional[_Lane] = None) -> None:
+        self.node: Node = node
+        self.next: Optional[_Lane] = nxt
+        # Entry for the same node one lane lower (None on the lowest lane).
+        self.down: Optional[_Lane] = down
+
+
+class SortedLinkedList:
+    """
+    Linked list kept in ascending order, with probabilistic skip-list
+    lanes over the plain `Node` chain.
+
+    The values live in an ordinary `Node` chain starting at `head`; each
+    node is also entered on the lowest express lane with probability
+    1/4, on the next with 1/16, and so on. Searches run along the top
+    lane, drop down when the next entry would overshoot, and finish with
+    a short walk on the chain: expected O(log n) steps for `find`,
+    `insert`, `delete` and the start of `range`.
+
+    Equal values keep insertion order. Pass `seed` for reproducible lane
+    heights (and therefore reproducible performance) in tests.
+    """
+
+    def __init__(self, iterable: Optional[Iterable[Any]] = None, *, seed: Any = None) -> None:
+        """Create an empty list (or initialise from an iterable, sorting it)."""
+        self._rng = random.Random(seed)
+        self._base = Node(None)  # sentinel before `head`
+        # _lanes[i] is the sentinel of lane i (0 = lowest express lane).
+        self._lanes: list[_Lane] = []
+        self.tail: Optional[Node] = None
+        self._size = 0
+        if iterable is not None:
+            self._build(sorted(iterable))
+
+    @property
+    def head(self) -> Optional[Node]:
+        return self._base.next
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        cur = self._base.next
+        while cur:
+            yield cur.data
+            cur = cur.next
+
+    def __repr__(self) -> str:
+        values = ", ".join(repr(v) for v in self)
+        return f"SortedLinkedList([{values}])"
+
+    @property
+    def height(self) -> int:
+        """Number of express lanes currently in use."""
+        return len(self._lanes)
+
+    # -----------------------------------------------------------------
+    # Search
+    # -----------------------------------------------------------------
+    def find(self, value: Any) -> Optional[Node]:
+        """Return the first node equal to `value`, or None (expected O(log n))."""
+        node = self._base_pred(value).next
+        if node is not None and node.data == value:
+            return node
+        return None
+
+    def __contains__(self, value: Any) -> bool:
+        return self.find(value) is not None
+
+    def range(self, lo: Any = None, hi: Any = None) -> Iterator[Any]:
+        """Yield the values ``v`` with ``lo <= v < hi`` in order.
+
+        Either bound may be None for an open end. Finding the start costs
+        expected O(log n); after that each value costs O(1).
+        """
+        cur = self._base.next if lo is None else self._base_pred(lo).next
+        while cur is not None and (hi is None or cur.data < hi):
+            yield cur.data
+            cur = cur.next
+
+    # -----------------------------------------------------------------
+    # Insertion / deletion
+    # -----------------------------------------------------------------
+    def insert(self, value: Any) -> Node:
+        """Insert `value` after any equal values and return its node."""
+        preds = self._lane_preds(value, after_equal=True)
+        pred = preds[0].node if preds else self._base
+        while pred.next is not None and not value < pred.next.data:
+            pred = pred.next
+
+        node = Node(value, pred.next)
+        pred.next = node
+        if node.next is None:
+            self.tail = node
+        self._size += 1
+
+        down = None
+        for level in range(self._random_level()):
+            if level == len(self._lanes):
+                lane_pred = self._add_lane()
+            else:
+                lane_pred = preds[level]
+            down = lane_pred.next = _Lane(node, lane_pred.next, down)
+        return node
+
+    def delete(self, value: Any) -> bool:
+        """Delete the first node equal to `value`. Return True if removed."""
+        preds = self._lane_preds(value, after_equal=False)
+        pred = preds[0].node if preds else self._base
+        while pred.next is not None and pred.next.data < value:
+            pred = pred.next
+
+        node = pred.next
+        if node is None or node.data != value:
+            return False
+
+        # `node` is the first equal value, so its lane entries (if any)
+        # directly follow the strict predecessors found above.
+        for lane_pred in preds:
+            if lane_pred.next is None or lane_pred.next.node is not node:
+                break
+            lane_pred.next = lane_pred.next.next
+        while self._lanes and self._lanes[-1].next is None:
+            self._lanes.pop()
+
+        pred.next = node.next
+        if node is self.tail:
+            self.tail = pred if pred is not self._base else None
+        node.next = None
+        self._size -= 1
+        return True
+
+    def pop_front(self) -> Any:
+        """Remove and return the smallest element."""
+        if self._base.next is None:
+            raise IndexError
+        value = self._base.next.data
+        self.delete(value)
+        return value
+
+    # -----------------------------------------------------------------
+    # Helper methods (private)
+    # -----------------------------------------------------------------
+    def _random_level(self) -> int:
+        """Number of express lanes a new node joins (geometric, capped)."""
+        rnd = self._rng.random
+        level = 0
+        while level < MAX_LEVELS and rnd() < PROMOTE_P:
+            level += 1
+        return level
+
+    def _add_lane(self) -> _Lane:
+        down = self._lanes[-1] if self._lanes else None
+        sentinel = _Lane(self._base, None, down)
+        self._lanes.append(sentinel)
+        return sentinel
+
+    def _lane_preds(self, value: Any, after_equal: bool) -> list[_Lane]:
+        """Return, per lane (lowest first), the last entry before `value`.
+
+        With `after_equal`, entries equal to `value` count as "before".
+        """
+        preds: list[_Lane] = [None] * len(self._lanes)  # type: ignore[list-item]
+        if not preds:
+            return preds
+
+        x = self._lanes[-1]
+        for level in range(len(preds) - 1, -1, -1):
+            nxt = x.next
+            if after_equal:
+                while nxt is not None and not value < nxt.node.data:
+                    x, nxt = nxt, nxt.next
+            else:
+                while nxt is not None and nxt.node.data < value:
+                    x, nxt = nxt, nxt.next
+            preds[level] = x
+            if x.down is not None:
+                x = x.down
+        return preds
+
+    def _base_pred(self, value: Any) -> Node:
+        """Return the last chain node with data < `value` (or the sentinel)."""
+        x = self._lanes[-1] if self._lanes else None
+        while x is not None:
+            nxt = x.next
+            while nxt is not None and nxt.node.data < value:
+                x, nxt = nxt, nxt.next
+            if x.down is None:
+                break
+            x = x.down
+
+        pred = x.node if x is not None else self._base
+        nxt = pred.next
+        while nxt is not None and nxt.data < value:
+            pred, nxt = nxt, nxt.next
+        return pred
+
+    def _build(self, values: list) -> None:
+        """Link sorted `values` onto an empty list in one pass."""
+        tails: list[_Lane] = []
+        prev = self._base
+        for value in values:
+            node = prev.next = Node(value)
+            prev = node
+            down = None
+            for level in range(self._random_level()):
+                if level == len(tails):
+                    tails.append(self._add_lane())
+                down = tails[level].next = tails[level] = _Lane(node, None, down)
+
+        self.tail = prev if values else None
+        self._size = len(values)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unittest suite for AsyncLinkedQueue.
+"""
+
+import asyncio
+import unittest
+
+from asynclinkedqueue import AsyncLinkedQueue, QueueClosed
+
+
+class TestAsyncLinkedQueue(unittest.IsolatedAsyncioTestCase):
+    async def test_fifo_put_get(self):
+        q = AsyncLinkedQueue()
+        for i in range(5):
+            await q.put(i)
+        self.assertEqual(q.qsize(), 5)
+        self.assertEqual([await q.get() for _ in range(5)], [0, 1, 2, 3, 4])
+        self.assertTrue(q.empty())
+
+    async def test_nowait_errors(self):
+        q = AsyncLinkedQueue(maxsize=1)
+        with self.assertRaises(asyncio.QueueEmpty):
+            q.get_nowait()
+        q.put_nowait("a")
+        self.assertTrue(q.full())
+        with self.assertRaises(asyncio.QueueFull):
+            q.put_nowait("b")
+
+    async def test_get_waits_for_put(self):
+        q = AsyncLinkedQueue()
+        getter = asyncio.create_task(q.get())
+        await asyncio.sleep(0)
+        self.assertFalse(getter.done())
+        await q.put("x")
+        self.assertEqual(await getter, "x")
+
+    async def test_maxsize_backpressure(self):
+        q = AsyncLinkedQueue(maxsize=2)
+        await q.put(1)
+        await q.put(2)
+        putter = asyncio.create_task(q.put(3))
+        await asyncio.sleep(0)
+        self.assertFalse(putter.done())
+
+        self.assertEqual(await q.get(), 1)
+        await putter
+        self.assertEqual(await q.get_batch(10), [2, 3])
+
+    async def test_get_batch(self):
+        q = AsyncLinkedQueue()
+        for i in range(10):
+            q.put_nowait(i)
+        self.assertEqual(await q.get_batch(4), [0, 1, 2, 3])
+        self.assertEqual(await q.get_batch(100), [4, 5, 6, 7, 8, 9])
+        with self.assertRaises(ValueError):
+            await q.get_batch(0)
+
+    async def test_get_batch_waits_then_drains(self):
+        q = AsyncLinkedQueue()
+        batch = asyncio.create_task(q.get_batch(100))
+        await asyncio.sleep(0)
+        for i in range(3):
+            q.put_nowait(i)
+        # the consumer is woken once and takes everything queued by then
+        self.assertEqual(await batch, [0, 1, 2])
+
+    async def test_get_batch_timeout(self):
+        q = AsyncLinkedQueue()
+        self.assertEqual(await q.get_batch(5, timeout=0.01), [])
+        self.assertEqual(len(q._getters), 0)
+        q.put_nowait(1)
+        self.assertEqual(await q.get_batch(5, timeout=0.01), [1])
+
+    async def test_get_batch_frees_putters(self):
+        q = AsyncLinkedQueue(maxsize=2)
+        q.put_nowait(1)
+        q.put_nowait(2)
+        putters = [asyncio.create_task(q.put(i)) for i in (3, 4)]
+        await asyncio.sleep(0)
+        self.assertEqual(await q.get_batch(2), [1, 2])
+        await asyncio.gather(*putters)
+        self.assertEqual(await q.get_batch(2), [3, 4])
+
+    async def test_close_drains_then_raises(self):
+        q = AsyncLinkedQueue()
+        q.put_nowait(1)
+        q.put_nowait(2)
+        q.close()
+        self.assertTrue(q.closed)
+        with self.assertRaises(QueueClosed):
+            await q.put(3)
+        self.assertEqual(await q.get(), 1)
+        self.assertEqual(await q.get_batch(5), [2])
+        with self.assertRaises(QueueClosed):
+            await q.get()
+        with self.assertRaises(QueueClosed):
+            await q.get_batch(5)
+        with self.assertRaises(QueueClosed):
+            q.get_nowait()
+
+    async def test_close_wakes_waiters(self):
+        q = AsyncLinkedQueue(maxsize=1)
+        getter = asyncio.create_task(q.get())
+        await asyncio.sleep(0)
+        q.close()
+        with self.assertRaises(QueueClosed):
+            await getter
+
+        full = AsyncLinkedQueue(maxsize=1)
+        full.put_nowait(0)
+        putter = asyncio.create_task(full.put(1))
+        await asyncio.sleep(0)
+        full.close()
+        with self.assertRaises(QueueClosed):
+            await putter
+        self.assertEqual(await full.get(), 0)
+
+    async def test_cancelled_getter_passes_wakeup_on(self):
+        q = AsyncLinkedQueue()
+        first = asyncio.create_task(q.get())
+        second = asyncio.create_task(q.get())
+        await asyncio.sleep(0)
+        q.put_nowait("x")  # wakes `first` ...
+        first.cancel()  # ... which is cancelled before it runs
+        self.assertEqual(await second, "x")
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+
+    async def test_many_producers_one_batch_consumer(self):
+        q = AsyncLinkedQueue(maxsize=64)
+        producers, per = 8, 500
+
+        async def produce(p):
+            for i in range(per):
+                await q.put((p, i))
+
+        async def consume():
+            seen = []
+            while len(seen) < producers * per:
+                seen.extend(await q.get_batch(32))
+            return seen
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.gather(*(produce(p) for p in range(producers)))
+        seen = await consumer
+        self.assertEqual(len(seen), producers * per)
+        for p in range(producers):
+            self.assertEqual([i for src, i in seen if src == p], list(range(per)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unittest suite for CompactLinkedList, the array-backed LinkedList variant.
+"""
+
+import unittest
+from typing import List
+
+from compactlinkedlist import CompactLinkedList
+
+
+def assert_contents(testcase: unittest.TestCase, ll: CompactLinkedList, expected: List):
+    """Assert that `ll` holds exactly the items in `expected`."""
+    testcase.assertEqual(list(ll), expected)
+    testcase.assertEqual(len(ll), len(expected))
+    testcase.assertEqual(ll.length_recursive(), len(expected))
+    if expected:
+        testcase.assertEqual(ll.head.data, expected[0])
+        testcase.assertEqual(ll.tail.data, expected[-1])
+    else:
+        testcase.assertIsNone(ll.head)
+        testcase.assertIsNone(ll.tail)
+
+
+class CompactLinkedListMixin:
+    """Shared behaviour checks, run once per storage mode."""
+
+    typecode = None
+
+    def make(self, values=(), **kwargs):
+        return CompactLinkedList(values, typecode=self.typecode, **kwargs)
+
+    def test_push_front_and_back(self):
+        ll = self.make()
+        ll.push_back(2)
+        ll.push_front(1)
+        ll.push_back_recursive(3)
+        assert_contents(self, ll, [1, 2, 3])
+
+    def test_pop_front(self):
+        ll = self.make([1, 2])
+        self.assertEqual(ll.pop_front(), 1)
+        self.assertEqual(ll.pop_front(), 2)
+        assert_contents(self, ll, [])
+        with self.assertRaises(IndexError):
+            ll.pop_front()
+
+    def test_delete_head_middle_tail(self):
+        for method in ("delete", "delete_recursive"):
+            ll = self.make([1, 2, 3, 4])
+            delete = getattr(ll, method)
+            self.assertTrue(delete(1))
+            self.assertTrue(delete(3))
+            self.assertTrue(delete(4))
+            self.assertFalse(delete(999))
+            assert_contents(self, ll, [2])
+            ll.push_back(5)
+            assert_contents(self, ll, [2, 5])
+
+    def test_find(self):
+        ll = self.make([1, 2, 2, 3])
+        for method in ("find", "find_recursive"):
+            ref = getattr(ll, method)(2)
+            self.assertEqual(ref.data, 2)
+            self.assertEqual(ref.next.data, 2)
+            self.assertEqual(ref.next.next.data, 3)
+            self.assertIsNone(getattr(ll, method)(999))
+        self.assertEqual(ll.find(2), ll.find_recursive(2))
+
+    def test_reverse(self):
+        ll = self.make([1, 2, 3])
+        ll.reverse()
+        assert_contents(self, ll, [3, 2, 1])
+        ll.reverse_recursive()
+        assert_contents(self, ll, [1, 2, 3])
+
+    def test_apply(self):
+        ll = self.make([1, 2, 3])
+        ll.apply(lambda x: x * 2)
+        assert_contents(self, ll, [2, 4, 6])
+        ll.apply_recursive(lambda x: -x)
+        assert_contents(self, ll, [-2, -4, -6])
+
+    def test_free_slots_are_recycled(self):
+        ll = self.make(range(4))
+        ll.pop_front()
+        ll.delete(2)
+        self.assertEqual(ll.capacity(), 4)
+
+        ll.push_back(10)
+        ll.push_front(11)
+        self.assertEqual(ll.capacity(), 4)
+        assert_contents(self, ll, [11, 1, 3, 10])
+
+        ll.push_back(12)
+        self.assertEqual(ll.capacity(), 5)
+
+    def test_compact(self):
+        ll = self.make(range(5))
+        ll.delete(0)
+        ll.delete(3)
+        ll.reverse()
+        ll.compact()
+        self.assertEqual(ll.capacity(), 3)
+        assert_contents(self, ll, [4, 2, 1])
+        ll.push_back(7)
+        assert_contents(self, ll, [4, 2, 1, 7])
+
+    def test_extend_after_mutation(self):
+        ll = self.make([1, 2])
+        ll.reverse()
+        ll.extend([3, 4])
+        assert_contents(self, ll, [2, 1, 3, 4])
+        ll.pop_front()
+        ll.extend([])
+        ll.extend([5])
+        assert_contents(self, ll, [1, 3, 4, 5])
+
+    def test_stack_safe_deep(self):
+        n = 5000
+        ll = self.make(range(n), stack_safe=True)
+        self.assertEqual(ll.length_recursive(), n)
+        self.assertEqual(ll.find_recursive(n - 1), ll.tail)
+        ll.push_back_recursive(n)
+        self.assertTrue(ll.delete_recursive(n))
+        ll.apply_recursive(lambda x: x + 1)
+        ll.reverse_recursive()
+        self.assertEqual(ll.head.data, n)
+        self.assertEqual(ll.tail.data, 1)
+        self.assertEqual(len(ll), n)
+
+
+class TestCompactLinkedListObjects(CompactLinkedListMixin, unittest.TestCase):
+    def test_mixed_types(self):
+        ll = self.make([1, "string", [1, 2]])
+        self.assertTrue(ll.delete("string"))
+        assert_contents(self, ll, [1, [1, 2]])
+
+    def test_released_slots_drop_references(self):
+        ll = self.make([object(), object()])
+        ll.pop_front()
+        self.assertIsNone(ll._values[0])
+
+    def test_repr(self):
+        self.assertEqual(repr(self.make([1, 2])), "CompactLinkedList([1, 2])")
+
+
+class TestCompactLinkedListTyped(CompactLinkedListMixin, unittest.TestCase):
+    typecode = "q"
+
+    def test_rejects_non_numeric_and_keeps_buffers_parallel(self):
+        ll = self.make([1, 2])
+        with self.assertRaises(TypeError):
+            ll.extend([3, "x"])
+        assert_contents(self, ll, [1, 2])
+        ll.push_back(3)
+        assert_contents(self, ll, [1, 2, 3])
+
+    def test_rejected_value_keeps_free_slot(self):
+        ll = self.make([1, 2])
+        ll.pop_front()
+        for push in (ll.push_back, ll.push_front, ll.push_back_recursive):
+            with self.assertRaises(TypeError):
+                push("x")
+        ll.push_back(3)
+        self.assertEqual(ll.capacity(), 2)  # the freed slot was reused
+        assert_contents(self, ll, [2, 3])
+
+    def test_from_sequence(self):
+        ll = CompactLinkedList.from_sequence([1.5, 2.5], typecode="d")
+        assert_contents(self, ll, [1.5, 2.5])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unittest suite for ConcurrentLinkedList, including multi-threaded
+producer / consumer stress tests.
+"""
+
+import pickle
+import sys
+import threading
+import unittest
+from collections import defaultdict
+from typing import List
+
+from concurrentlinkedlist import ConcurrentLinkedList
+
+
+def assert_contents(testcase: unittest.TestCase, ll: ConcurrentLinkedList, expected: List):
+    """Assert `ll` holds `expected` and its cached tail and size agree."""
+    testcase.assertEqual(list(ll), expected)
+    testcase.assertEqual(len(ll), len(expected))
+    last, cur = None, ll.head
+    while cur:
+        last, cur = cur, cur.next
+    testcase.assertIs(ll.tail, last)
+
+
+class TestConcurrentLinkedListBasics(unittest.TestCase):
+    def test_same_api_as_linkedlist(self):
+        ll = ConcurrentLinkedList([3, 1])
+        ll.push_back(2)
+        ll.push_front(0)
+        ll.push_back_recursive(5)
+        assert_contents(self, ll, [0, 3, 1, 2, 5])
+
+        self.assertEqual(ll.pop_front(), 0)
+        self.assertTrue(ll.delete(1))
+        self.assertFalse(ll.delete_recursive(42))
+        self.assertIs(ll.find(2), ll.find_recursive(2))
+        self.assertIn(5, ll)
+        self.assertEqual(ll.length_recursive(), 3)
+
+        ll.sort()
+        assert_contents(self, ll, [2, 3, 5])
+        ll.reverse()
+        ll.apply(lambda x: x * 10)
+        assert_contents(self, ll, [50, 30, 20])
+        self.assertEqual(list(ll.view().take(2)), [50, 30])
+        self.assertEqual(repr(ll), "ConcurrentLinkedList([50, 30, 20])")
+
+    def test_pop_to_empty_and_refill(self):
+        ll = ConcurrentLinkedList()
+        with self.assertRaises(IndexError):
+            ll.pop_front()
+        ll.push_back(1)
+        self.assertEqual(ll.pop_front(), 1)
+        assert_contents(self, ll, [])
+        ll.push_back(2)
+        ll.push_back(3)
+        assert_contents(self, ll, [2, 3])
+
+    def test_merge(self):
+        a = ConcurrentLinkedList([1, 4])
+        b = ConcurrentLinkedList([2, 3])
+        b.push_back(5)
+        a.merge(b)
+        assert_contents(self, a, [1, 2, 3, 4, 5])
+        assert_contents(self, b, [])
+
+    def test_structure_methods_see_lock_free_pushes(self):
+        ll = ConcurrentLinkedList([0, 1], checked=True)
+        for v in range(2, 6):
+            ll.push_back(v)  # counted in _pushed until a locked call folds it in
+        ll.pop_front()
+        self.assertEqual(ll.middle().data, 3)
+        self.assertIs(ll.kth_from_end(1), ll.tail)
+        ll.validate()
+        rest = ll.split_half()
+        self.assertIsInstance(rest, ConcurrentLinkedList)
+        self.assertTrue(rest.checked)
+        rest.push_back(6)
+        assert_contents(self, ll, [1, 2, 3])
+        assert_contents(self, rest, [4, 5, 6])
+
+    def test_no_index(self):
+        with self.assertRaises(ValueError):
+            ConcurrentLinkedList(indexed=True)
+        with self.assertRaises(ValueError):
+            ConcurrentLinkedList().enable_index()
+
+    def test_pickle(self):
+        ll = ConcurrentLinkedList([1, 2])
+        ll.push_back(3)
+        copy = pickle.loads(pickle.dumps(ll))
+        self.assertIsInstance(copy, ConcurrentLinkedList)
+        assert_contents(self, copy, [1, 2, 3])
+        copy.push_back(4)
+        self.assertEqual(copy.pop_front(), 1)
+
+
+class TestConcurrentLinkedListStress(unittest.TestCase):
+    PRODUCERS = 4
+    CONSUMERS = 4
+    PER_PRODUCER = 5_000
+
+    def setUp(self):
+        # Switch threads as often as possible to shake out races.
+        self._interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self._interval)
+
+    def run_threads(self, targets):
+        threads = [threading.Thread(target=t) for t in targets]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=60)
+            self.assertFalse(t.is_alive(), "worker thread hung")
+
+    def test_producers_and_consumers_lose_nothing(self):
+        ll = ConcurrentLinkedList()
+        total = self.PRODUCERS * self.PER_PRODUCER
+        popped = [[] for _ in range(self.CONSUMERS)]
+        remaining = [total]
+        count_lock = threading.Lock()
+
+        def producer(p):
+            for i in range(self.PER_PRODUCER):
+                ll.push_back((p, i))
+
+        def consumer(out):
+            while True:
+                with count_lock:
+                    if remaining[0] == 0:
+                        return
+                try:
+                    item = ll.pop_front()
+                except IndexError:
+                    continue
+                out.append(item)
+                with count_lock:
+                    remaining[0] -= 1
+
+        self.run_threads(
+            [lambda p=p: producer(p) for p in range(self.PRODUCERS)]
+            + [lambda out=out: consumer(out) for out in popped]
+        )
+
+        items = [item for out in popped for item in out]
+        self.assertEqual(len(items), total)
+        expected = {(p, i) for p in range(self.PRODUCERS) for i in range(self.PER_PRODUCER)}
+        self.assertEqual(set(items), expected)
+        # FIFO: each consumer sees each producer's items in push order.
+        for out in popped:
+            seen = defaultdict(lambda: -1)
+            for p, i in out:
+                self.assertGreater(i, seen[p])
+                seen[p] = i
+        assert_contents(self, ll, [])
+
+    def test_mixed_operations_keep_invariants(self):
+        ll = ConcurrentLinkedList(range(100))
+        n = 2_000
+
+        def pusher():
+            for i in range(n):
+                ll.push_back(i)
+
+        def popper():
+            for _ in range(n):
+                try:
+                    ll.pop_front()
+                except IndexError:
+                    pass
+
+        def fiddler():
+            for i in range(n // 10):
+                ll.push_front(-i)
+                ll.delete(-i)
+                ll.reverse()
+                len(ll)
+
+        self.run_threads([pusher, popper, fiddler, pusher])
+        values = list(ll)
+        assert_contents(self, ll, values)
+        # Every push_back lands; at most n pops succeed, and a pop may steal
+        # a pushed-front value before its delete runs.
+        self.assertGreaterEqual(len(values), 100 + n)
+        self.assertLessEqual(len(values), 100 + 2 * n + n // 10)
+
+    def test_crossed_merges_do_not_deadlock(self):
+        a = ConcurrentLinkedList()
+        b = ConcurrentLinkedList()
+
+        def merge_into(dst, src):
+            for _ in range(500):
+                src.push_back(1)
+                dst.merge(src)
+
+        self.run_threads([lambda: merge_into(a, b), lambda: merge_into(b, a)])
+        self.assertEqual(len(a) + len(b), 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unittest suite for DoublyLinkedList.
+"""
+
+import unittest
+from typing import List
+
+from doublylinkedlist import DoublyLinkedList
+
+
+def assert_contents(testcase: unittest.TestCase, dll: DoublyLinkedList, expected: List):
+    """Assert `dll` holds `expected`, checking both link directions and the size."""
+    testcase.assertEqual(list(dll), expected)
+    testcase.assertEqual(list(reversed(dll)), expected[::-1])
+    testcase.assertEqual(len(dll), len(expected))
+    if expected:
+        testcase.assertIsNone(dll.head.prev)
+        testcase.assertIsNone(dll.tail.next)
+    else:
+        testcase.assertIsNone(dll.head)
+        testcase.assertIsNone(dll.tail)
+
+
+class TestDoublyLinkedListBasics(unittest.TestCase):
+    def test_push_and_pop_both_ends(self):
+        dll = DoublyLinkedList()
+        dll.push_back(2)
+        dll.push_front(1)
+        dll.push_back_recursive(3)
+        assert_contents(self, dll, [1, 2, 3])
+
+        self.assertEqual(dll.pop_back(), 3)
+        self.assertEqual(dll.pop_front(), 1)
+        self.assertEqual(dll.pop_back(), 2)
+        assert_contents(self, dll, [])
+
+    def test_pop_empty(self):
+        dll = DoublyLinkedList()
+        with self.assertRaises(IndexError):
+            dll.pop_front()
+        with self.assertRaises(IndexError):
+            dll.pop_back()
+
+    def test_find_first_occurrence(self):
+        dll = DoublyLinkedList([1, 2, 2, 3])
+        for method in (dll.find, dll.find_recursive):
+            node = method(2)
+            self.assertIs(node, dll.head.next)
+            self.assertIsNone(method(999))
+
+    def test_delete(self):
+        for method in ("delete", "delete_recursive"):
+            dll = DoublyLinkedList([1, 2, 3, 4])
+            delete = getattr(dll, method)
+            self.assertTrue(delete(1))
+            self.assertTrue(delete(3))
+            self.assertTrue(delete(4))
+            self.assertFalse(delete(999))
+            assert_contents(self, dll, [2])
+
+    def test_length_recursive(self):
+        self.assertEqual(DoublyLinkedList().length_recursive(), 0)
+        self.assertEqual(DoublyLinkedList(range(5)).length_recursive(), 5)
+
+    def test_reverse(self):
+        dll = DoublyLinkedList([1, 2, 3])
+        dll.reverse()
+        assert_contents(self, dll, [3, 2, 1])
+        dll.reverse_recursive()
+        assert_contents(self, dll, [1, 2, 3])
+
+    def test_apply(self):
+        dll = DoublyLinkedList([1, 2, 3])
+        dll.apply(lambda x: x * 2)
+        dll.apply_recursive(lambda x: -x)
+        assert_contents(self, dll, [-2, -4, -6])
+
+    def test_repr(self):
+        self.assertEqual(repr(DoublyLinkedList([1, "a"])), "DoublyLinkedList([1, 'a'])")
+        self.assertEqual(repr(DoublyLinkedList([1]).head), "DNode(1)")
+
+
+class TestDoublyLinkedListNodeOps(unittest.TestCase):
+    def setUp(self):
+        self.dll = DoublyLinkedList()
+        self.nodes = [self.dll.push_back(v) for v in (1, 2, 3)]
+
+    def test_remove_node(self):
+        self.assertEqual(self.dll.remove_node(self.nodes[1]), 2)
+        assert_contents(self, self.dll, [1, 3])
+        self.dll.remove_node(self.nodes[2])
+        self.dll.remove_node(self.nodes[0])
+        assert_contents(self, self.dll, [])
+
+    def test_insert_after_and_before(self):
+        self.dll.insert_after(self.nodes[2], 4)
+        self.dll.insert_before(self.nodes[0], 0)
+        self.dll.insert_after(self.nodes[0], 1.5)
+        self.dll.insert_before(self.nodes[2], 2.5)
+        assert_contents(self, self.dll, [0, 1, 1.5, 2, 2.5, 3, 4])
+
+    def test_move_to_front(self):
+        self.dll.move_to_front(self.nodes[2])
+        assert_contents(self, self.dll, [3, 1, 2])
+        self.dll.move_to_front(self.nodes[1])
+        assert_contents(self, self.dll, [2, 3, 1])
+        self.dll.move_to_front(self.nodes[1])
+        assert_contents(self, self.dll, [2, 3, 1])
+
+    def test_move_to_back(self):
+        self.dll.move_to_back(self.nodes[0])
+        assert_contents(self, self.dll, [2, 3, 1])
+        self.dll.move_to_back(self.nodes[2])
+        assert_contents(self, self.dll, [2, 1, 3])
+        self.dll.move_to_back(self.nodes[2])
+        assert_contents(self, self.dll, [2, 1, 3])
+
+    def test_lru_pattern(self):
+        # Touch moves to front, eviction pops the back.
+        self.dll.move_to_front(self.nodes[0])
+        self.dll.move_to_front(self.nodes[2])
+        self.assertEqual(self.dll.pop_back(), 2)
+        assert_contents(self, self.dll, [3, 1])
+
+
+class TestDoublyLinkedListStackSafe(unittest.TestCase):
+    N = 20000
+
+    def test_recursive_variants_deep(self):
+        dll = DoublyLinkedList(range(self.N), stack_safe=True)
+        self.assertEqual(dll.length_recursive(), self.N)
+        self.assertIs(dll.find_recursive(self.N - 1), dll.tail)
+        dll.push_back_recursive(self.N)
+        self.assertTrue(dll.delete_recursive(0))
+        dll.apply_recursive(lambda x: x - 1)
+        dll.reverse_recursive()
+        self.assertEqual(dll.head.data, self.N - 1)
+        self.assertEqual(dll.tail.data, 0)
+        self.assertEqual(list(reversed(dll))[:3], [0, 1, 2])
+        self.assertEqual(len(dll), self.N)
+
+
+if __name__ == "__main__":
+    unittest.main()
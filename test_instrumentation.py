@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unittest suite for the opt-in LinkedList instrumentation.
+"""
+
+import cProfile
+import inspect
+import sys
+import unittest
+
+from concurrentlinkedlist import ConcurrentLinkedList
+from instrumentation import Metrics, instrument, instrumented, uninstrument
+from linkedlist import LinkedList
+from unrolledlinkedlist import UnrolledLinkedList
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_plain_list_is_untouched(self):
+        ll = LinkedList(range(5))
+        metrics = instrument(ll)
+        self.assertIsInstance(metrics, Metrics)
+        self.assertIsInstance(ll, LinkedList)
+        self.assertIs(instrument(ll), metrics)
+
+        uninstrument(ll)
+        self.assertIs(type(ll), LinkedList)
+        self.assertFalse(hasattr(ll, "_metrics"))
+        ll.find(3)
+        self.assertEqual(list(ll), [0, 1, 2, 3, 4])
+
+    def test_counts_calls_and_time(self):
+        ll = LinkedList()
+        metrics = instrument(ll)
+        for v in range(10):
+            ll.push_back(v)
+        ll.pop_front()
+        snap = metrics.snapshot()
+        self.assertEqual(snap["push_back"]["calls"], 10)
+        self.assertEqual(snap["pop_front"]["calls"], 1)
+        self.assertEqual(snap["push_back"]["nodes_visited"], 0)
+        self.assertGreater(snap["push_back"]["seconds"], 0)
+        self.assertEqual(list(ll), list(range(1, 10)))
+
+    def test_nodes_visited_follow_traversal(self):
+        ll = LinkedList(range(100))
+        metrics = instrument(ll)
+        ll.find(10)
+        near = metrics.snapshot()["find"]["nodes_visited"]
+        ll.find(90)
+        far = metrics.snapshot()["find"]["nodes_visited"] - near
+        self.assertTrue(9 <= near <= 11, near)
+        self.assertTrue(89 <= far <= 91, far)
+
+        ll.apply(abs)
+        self.assertTrue(99 <= metrics.snapshot()["apply"]["nodes_visited"] <= 101)
+
+    def test_nested_calls_are_credited_once(self):
+        ll = LinkedList(range(20))
+        metrics = instrument(ll)
+        self.assertIn(15, ll)
+        snap = metrics.snapshot()
+        self.assertNotIn("find", snap)
+        self.assertTrue(14 <= snap["__contains__"]["nodes_visited"] <= 16)
+
+    def test_recursion_depth(self):
+        n = 200
+        native = LinkedList(range(n))
+        safe = LinkedList(range(n), stack_safe=True)
+        m_native, m_safe = instrument(native), instrument(safe)
+        for ll in (native, safe):
+            ll.find_recursive(n - 1)
+            ll.length_recursive()
+
+        # find is a tail call: under the trampoline one frame stays alive
+        self.assertGreaterEqual(m_native.snapshot()["find_recursive"]["max_recursion_depth"], n)
+        self.assertEqual(m_safe.snapshot()["find_recursive"]["max_recursion_depth"], 1)
+        for metrics in (m_native, m_safe):
+            self.assertGreaterEqual(metrics.snapshot()["length_recursive"]["max_recursion_depth"], n)
+            self.assertGreaterEqual(metrics.snapshot()["length_recursive"]["nodes_visited"], n)
+
+    def test_pause_and_reset(self):
+        ll = LinkedList(range(5))
+        metrics = instrument(ll)
+        metrics.enabled = False
+        ll.find(4)
+        self.assertEqual(metrics.snapshot(), {})
+        metrics.enabled = True
+        ll.find(4)
+        self.assertEqual(metrics.snapshot()["find"]["calls"], 1)
+        metrics.reset()
+        self.assertEqual(metrics.snapshot(), {})
+
+    def test_exceptions_are_recorded(self):
+        ll = LinkedList()
+        metrics = instrument(ll)
+        with self.assertRaises(IndexError):
+            ll.pop_front()
+        self.assertEqual(metrics.snapshot()["pop_front"]["calls"], 1)
+        ll.push_back(1)
+        self.assertEqual(metrics.snapshot()["push_back"]["calls"], 1)
+
+    def test_built_instrumented(self):
+        cls = instrumented(LinkedList)
+        self.assertIs(instrumented(LinkedList), cls)
+        ll = cls(range(3))
+        ll.find(2)  # not instrumented yet: nothing to record into
+        metrics = instrument(ll)
+        self.assertIs(type(ll), cls)
+        ll.find(2)
+        self.assertEqual(metrics.snapshot()["find"]["calls"], 1)
+
+    def test_wrappers_keep_signature(self):
+        cls = instrumented(LinkedList)
+        self.assertEqual(inspect.signature(cls.sort), inspect.signature(LinkedList.sort))
+        ll = cls([3, 1, 2])
+        metrics = instrument(ll)
+        ll.sort(reverse=True)
+        ll.merge(cls([0]), None, True)
+        self.assertEqual(list(ll), [3, 2, 1, 0])
+        with self.assertRaises(TypeError):
+            ll.push_back()
+        self.assertEqual(metrics.snapshot()["sort"]["calls"], 1)
+
+    def test_selected_ops_and_other_list_types(self):
+        for ll in (ConcurrentLinkedList(range(10)), UnrolledLinkedList(range(10), block_size=4)):
+            metrics = instrument(ll, ops=("find",))
+            ll.find(7)
+            ll.push_back(10)
+            self.assertEqual(list(metrics.snapshot()), ["find"])
+            self.assertEqual(ll.find(10).data, 10)
+            uninstrument(ll)
+
+    def test_standard_profiler_still_works(self):
+        ll = LinkedList(range(10))
+        metrics = instrument(ll)
+        ll.find(5)
+        self.assertIsNone(sys.monitoring.get_tool(sys.monitoring.PROFILER_ID))
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            ll.find(7)  # both tools active at once
+        finally:
+            profiler.disable()
+        self.assertEqual(metrics.snapshot()["find"]["calls"], 2)
+        self.assertIsNone(sys.monitoring.get_tool(3))
+
+    def test_to_prometheus(self):
+        ll = LinkedList(range(3))
+        metrics = instrument(ll)
+        ll.find(2)
+        ll.push_back(3)
+        text = metrics.to_prometheus(labels={"list": 'q"1'})
+        self.assertIn("# TYPE linkedlist_calls_total counter\n", text)
+        self.assertIn('linkedlist_calls_total{op="find",list="q\\"1"} 1\n', text)
+        self.assertIn('linkedlist_nodes_visited_total{op="push_back",list="q\\"1"} 0\n', text)
+        self.assertIn("# TYPE linkedlist_recursion_depth_max gauge\n", text)
+        self.assertTrue(metrics.to_prometheus(prefix="q").startswith("# HELP q_calls_total"))
+
+
+if __name__ == "__main__":
+    unittest.main()
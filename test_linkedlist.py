@@ -9,13 +9,29 @@ Place the implementation (Node + LinkedList) in a file called
 `linkedlist.py` in the same directory as this test file.
 """
 
+import os
+import pickle
+import random
+import sys
+import tempfile
 import unittest
 from typing import List
 
+try:
+    import numpy as np
+except ImportError:  # optional
+    np = None
+
 # ----------------------------------------------------------------------
 # Import the implementation
 # ----------------------------------------------------------------------
-from linkedlist import LinkedList  # <-- your skeleton file
+from linkedlist import (  # <-- your skeleton file
+    CorruptedListError,
+    LinkedList,
+    LinkedListView,
+    MappedLinkedList,
+    NodePool,
+)
 
 
 # ----------------------------------------------------------------------
@@ -31,6 +47,19 @@ def assert_contents(testcase: unittest.TestCase, ll: LinkedList, expected: List)
     testcase.assertEqual(as_list(ll), expected)
 
 
+def assert_invariants(testcase: unittest.TestCase, ll: LinkedList):
+    """Cross-check the cached `tail` and size against a full traversal."""
+    count = 0
+    last = None
+    cur = ll.head
+    while cur:
+        last = cur
+        count += 1
+        cur = cur.next
+    testcase.assertIs(ll.tail, last)
+    testcase.assertEqual(len(ll), count)
+
+
 # ----------------------------------------------------------------------
 # Helper to wrap a call that may raise NotImplementedError
 # ----------------------------------------------------------------------
@@ -460,5 +489,926 @@ class TestLinkedListComprehensive(unittest.TestCase):
         except NotImplementedError:
             pass
 
+
+# ----------------------------------------------------------------------
+# Cached tail / size invariants
+# ----------------------------------------------------------------------
+class TestLinkedListInvariants(unittest.TestCase):
+    def setUp(self):
+        self.ll = LinkedList()
+
+    def fill(self, values):
+        for v in values:
+            safe_call(self, self.ll.push_back, v)
+            assert_invariants(self, self.ll)
+
+    def test_empty(self):
+        assert_invariants(self, self.ll)
+        self.assertIsNone(self.ll.tail)
+
+    def test_push_front(self):
+        for v in (3, 2, 1):
+            safe_call(self, self.ll.push_front, v)
+            assert_invariants(self, self.ll)
+        self.assertEqual(self.ll.tail.data, 3)
+
+    def test_push_back(self):
+        self.fill([1, 2, 3])
+        self.assertEqual(self.ll.tail.data, 3)
+
+    def test_push_back_recursive(self):
+        for v in (1, 2, 3):
+            safe_call(self, self.ll.push_back_recursive, v)
+            assert_invariants(self, self.ll)
+        self.assertEqual(self.ll.tail.data, 3)
+
+    def test_pop_front_until_empty(self):
+        self.fill([1, 2, 3])
+        while len(self.ll):
+            safe_call(self, self.ll.pop_front)
+            assert_invariants(self, self.ll)
+        self.assertIsNone(self.ll.tail)
+
+    def test_delete_head_middle_tail(self):
+        self.fill([1, 2, 3, 4])
+        for v in (4, 1, 3, 999, 2):
+            safe_call(self, self.ll.delete, v)
+            assert_invariants(self, self.ll)
+        assert_contents(self, self.ll, [])
+
+    def test_delete_recursive_head_middle_tail(self):
+        self.fill([1, 2, 3, 4])
+        for v in (4, 1, 3, 999, 2):
+            safe_call(self, self.ll.delete_recursive, v)
+            assert_invariants(self, self.ll)
+        assert_contents(self, self.ll, [])
+
+    def test_reverse(self):
+        self.fill([1, 2, 3])
+        safe_call(self, self.ll.reverse)
+        assert_invariants(self, self.ll)
+        self.assertEqual(self.ll.tail.data, 1)
+
+    def test_reverse_recursive(self):
+        self.fill([1, 2, 3])
+        safe_call(self, self.ll.reverse_recursive)
+        assert_invariants(self, self.ll)
+        self.assertEqual(self.ll.tail.data, 1)
+
+    def test_push_back_after_reverse_and_delete(self):
+        self.fill([1, 2, 3])
+        safe_call(self, self.ll.reverse)
+        safe_call(self, self.ll.delete, 1)
+        safe_call(self, self.ll.push_back, 9)
+        assert_invariants(self, self.ll)
+        assert_contents(self, self.ll, [3, 2, 9])
+
+    def test_mixed_sequence(self):
+        ops = [
+            (self.ll.push_back, 1),
+            (self.ll.push_front, 0),
+            (self.ll.push_back_recursive, 2),
+            (self.ll.delete, 2),
+            (self.ll.push_back, 5),
+            (self.ll.reverse_recursive,),
+            (self.ll.delete_recursive, 0),
+            (self.ll.pop_front,),
+            (self.ll.reverse,),
+            (self.ll.pop_front,),
+            (self.ll.push_back, 7),
+        ]
+        for func, *args in ops:
+            safe_call(self, func, *args)
+            assert_invariants(self, self.ll)
+        assert_contents(self, self.ll, [7])
+
+
+# ----------------------------------------------------------------------
+# Bulk construction / extend
+# ----------------------------------------------------------------------
+class TestLinkedListBulk(unittest.TestCase):
+    def test_init_from_iterable(self):
+        ll = LinkedList(range(5))
+        assert_contents(self, ll, [0, 1, 2, 3, 4])
+        assert_invariants(self, ll)
+
+    def test_init_from_generator(self):
+        ll = LinkedList(c for c in "abc")
+        assert_contents(self, ll, ["a", "b", "c"])
+        assert_invariants(self, ll)
+
+    def test_init_from_empty(self):
+        ll = LinkedList([])
+        assert_contents(self, ll, [])
+        assert_invariants(self, ll)
+
+    def test_from_sequence(self):
+        ll = LinkedList.from_sequence([1, 2, 3])
+        assert_contents(self, ll, [1, 2, 3])
+        assert_invariants(self, ll)
+
+        empty = LinkedList.from_sequence(())
+        assert_contents(self, empty, [])
+        assert_invariants(self, empty)
+
+    def test_extend_empty_and_non_empty(self):
+        ll = LinkedList()
+        ll.extend([1, 2])
+        assert_invariants(self, ll)
+        ll.extend([])
+        assert_invariants(self, ll)
+        ll.extend(iter([3, 4]))
+        assert_contents(self, ll, [1, 2, 3, 4])
+        assert_invariants(self, ll)
+
+    def test_extend_with_self(self):
+        ll = LinkedList([1, 2])
+        ll.extend(ll)
+        assert_contents(self, ll, [1, 2, 1, 2])
+        assert_invariants(self, ll)
+
+    def test_mutators_after_bulk_build(self):
+        ll = LinkedList.from_sequence([1, 2, 3])
+        ll.push_back(4)
+        ll.delete(4)
+        ll.push_back_recursive(5)
+        assert_contents(self, ll, [1, 2, 3, 5])
+        assert_invariants(self, ll)
+
+
+# ----------------------------------------------------------------------
+# Stack-safe recursive mode
+# ----------------------------------------------------------------------
+class TestLinkedListStackSafe(unittest.TestCase):
+    # Well past the default recursion limit of 1000
+    N = 20000
+
+    def build(self, values, stack_safe=True):
+        return LinkedList(values, stack_safe=stack_safe)
+
+    def test_matches_native_recursion_on_small_lists(self):
+        for values in ([], [1], [1, 2, 2, 3]):
+            native = self.build(values, stack_safe=False)
+            safe = self.build(values)
+
+            self.assertEqual(safe.length_recursive(), native.length_recursive())
+            self.assertEqual(
+                getattr(safe.find_recursive(2), "data", None),
+                getattr(native.find_recursive(2), "data", None),
+            )
+            self.assertEqual(safe.delete_recursive(2), native.delete_recursive(2))
+            assert_contents(self, safe, as_list(native))
+
+            safe.push_back_recursive(9)
+            native.push_back_recursive(9)
+            safe.reverse_recursive()
+            native.reverse_recursive()
+            safe.apply_recursive(lambda x: x * 3)
+            native.apply_recursive(lambda x: x * 3)
+            assert_contents(self, safe, as_list(native))
+            assert_invariants(self, safe)
+
+    def test_length_recursive_deep(self):
+        ll = self.build(range(self.N))
+        self.assertEqual(ll.length_recursive(), self.N)
+
+    def test_find_recursive_deep(self):
+        ll = self.build(range(self.N))
+        self.assertIs(ll.find_recursive(self.N - 1), ll.tail)
+        self.assertIsNone(ll.find_recursive(-1))
+
+    def test_push_back_recursive_deep(self):
+        ll = self.build(range(self.N))
+        ll.push_back_recursive("end")
+        self.assertEqual(ll.tail.data, "end")
+        assert_invariants(self, ll)
+
+    def test_delete_recursive_deep(self):
+        ll = self.build(range(self.N))
+        self.assertTrue(ll.delete_recursive(self.N - 1))
+        self.assertFalse(ll.delete_recursive(-1))
+        self.assertEqual(ll.tail.data, self.N - 2)
+        assert_invariants(self, ll)
+
+    def test_reverse_recursive_deep(self):
+        ll = self.build(range(self.N))
+        ll.reverse_recursive()
+        self.assertEqual(ll.head.data, self.N - 1)
+        self.assertEqual(ll.tail.data, 0)
+        assert_invariants(self, ll)
+
+    def test_apply_recursive_deep(self):
+        ll = self.build(range(self.N))
+        ll.apply_recursive(lambda x: x + 1)
+        self.assertEqual(ll.head.data, 1)
+        self.assertEqual(ll.tail.data, self.N)
+
+    def test_default_mode_still_native(self):
+        ll = self.build(range(self.N), stack_safe=False)
+        with self.assertRaises(RecursionError):
+            ll.length_recursive()
+
+    def test_mode_can_be_toggled(self):
+        ll = self.build(range(self.N), stack_safe=False)
+        ll.stack_safe = True
+        self.assertEqual(ll.length_recursive(), self.N)
+
+
+# ----------------------------------------------------------------------
+# Hash-indexed find / delete
+# ----------------------------------------------------------------------
+def linear_find(ll: LinkedList, value):
+    cur = ll.head
+    while cur:
+        if cur.data == value:
+            return cur
+        cur = cur.next
+    return None
+
+
+class TestLinkedListIndex(unittest.TestCase):
+    VALUES = range(-1, 8)
+
+    def assert_index_consistent(self, ll: LinkedList):
+        assert_invariants(self, ll)
+        for v in self.VALUES:
+            self.assertIs(ll.find(v), linear_find(ll, v), f"stale entry for {v}")
+            self.assertEqual(v in ll, linear_find(ll, v) is not None)
+
+    def test_find_and_contains(self):
+        ll = LinkedList([1, 2, 2, 3], indexed=True)
+        self.assertTrue(ll.indexed)
+        self.assertIs(ll.find(2), ll.head.next)
+        self.assertIn(3, ll)
+        self.assertNotIn(999, ll)
+        self.assertIsNone(ll.find([1, 2]))  # unhashable probe
+        self.assertFalse(ll.delete([1, 2]))
+
+    def test_delete_duplicates_moves_entry_forward(self):
+        ll = LinkedList([2, 1, 2, 3, 2], indexed=True)
+        self.assertTrue(ll.delete(2))
+        self.assertIs(ll.find(2), ll.head.next)
+        self.assertTrue(ll.delete(2))
+        self.assertIs(ll.find(2), ll.tail)
+        self.assertTrue(ll.delete(2))
+        self.assertFalse(ll.delete(2))
+        assert_contents(self, ll, [1, 3])
+        self.assert_index_consistent(ll)
+
+    def test_each_mutator_keeps_index_fresh(self):
+        ops = [
+            lambda ll: ll.push_front(3),
+            lambda ll: ll.push_back(3),
+            lambda ll: ll.push_back_recursive(0),
+            lambda ll: ll.pop_front(),
+            lambda ll: ll.delete(3),
+            lambda ll: ll.delete_recursive(1),
+            lambda ll: ll.reverse(),
+            lambda ll: ll.reverse_recursive(),
+            lambda ll: ll.apply(lambda x: (x + 1) % 7),
+            lambda ll: ll.apply_recursive(lambda x: (x * 3) % 7),
+            lambda ll: ll.extend([4, 4, 5]),
+        ]
+        for op in ops:
+            ll = LinkedList([1, 3, 2, 3, 1], indexed=True)
+            op(ll)
+            self.assert_index_consistent(ll)
+
+    def test_randomised_against_linear_scan(self):
+        rng = random.Random(6)
+        ll = LinkedList(indexed=True)
+        for _ in range(600):
+            v = rng.choice(self.VALUES)
+            op = rng.randrange(8)
+            if op == 0:
+                ll.push_front(v)
+            elif op == 1:
+                ll.push_back(v)
+            elif op == 2 and len(ll):
+                ll.pop_front()
+            elif op in (3, 4):
+                expected = linear_find(ll, v) is not None
+                self.assertEqual(ll.delete(v), expected)
+            elif op == 5:
+                ll.reverse()
+            elif op == 6:
+                ll.delete_recursive(v)
+            else:
+                ll.push_back_recursive(v)
+            self.assert_index_consistent(ll)
+
+    def test_unhashable_insert_leaves_list_untouched(self):
+        ll = LinkedList([1, 2], indexed=True)
+        for op in (ll.push_front, ll.push_back, ll.push_back_recursive):
+            with self.assertRaises(TypeError):
+                op([3])
+        with self.assertRaises(TypeError):
+            ll.extend([3, [4]])
+        assert_contents(self, ll, [1, 2])
+        self.assert_index_consistent(ll)
+
+    def test_failing_apply_keeps_index_fresh(self):
+        for method in ("apply", "apply_recursive"):
+            ll = LinkedList([1, 2, 3], indexed=True)
+            with self.assertRaises(ZeroDivisionError):
+                getattr(ll, method)(lambda v: 1 / 0 if v == 3 else v * 10)
+            assert_contents(self, ll, [10, 20, 3])
+            self.assertIs(ll.find(10), ll.head)
+            self.assertIsNone(ll.find(1))
+            self.assertEqual(ll.pop_front(), 10)
+            self.assertTrue(ll.delete(3))
+
+    def test_recursion_error_leaves_no_index_entry(self):
+        ll = LinkedList(range(sys.getrecursionlimit() + 100), indexed=True)
+        with self.assertRaises(RecursionError):
+            ll.push_back_recursive("x")
+        self.assertNotIn("x", ll)
+        self.assertFalse(ll.delete("x"))
+        self.assertEqual(len(ll), sys.getrecursionlimit() + 100)
+        self.assertIs(ll.find(5), linear_find(ll, 5))
+
+    def test_enable_and_disable(self):
+        ll = LinkedList([1, 2, 3])
+        self.assertFalse(ll.indexed)
+        ll.enable_index()
+        self.assertIs(ll.find(3), ll.tail)
+        ll.disable_index()
+        self.assertFalse(ll.indexed)
+        self.assertTrue(ll.delete(3))
+        self.assertIsNone(ll.find(3))
+
+        with self.assertRaises(TypeError):
+            LinkedList([[1]]).enable_index()
+
+
+# ----------------------------------------------------------------------
+# Sorting / merging
+# ----------------------------------------------------------------------
+def node_ids(ll: LinkedList) -> set:
+    ids = set()
+    cur = ll.head
+    while cur:
+        ids.add(id(cur))
+        cur = cur.next
+    return ids
+
+
+class TestLinkedListSort(unittest.TestCase):
+    def test_matches_sorted_for_many_sizes(self):
+        rng = random.Random(13)
+        for n in list(range(10)) + [31, 64, 100, 257]:
+            values = [rng.randrange(n // 2 + 1) for _ in range(n)]
+            for reverse in (False, True):
+                ll = LinkedList(values)
+                ll.sort(reverse=reverse)
+                assert_contents(self, ll, sorted(values, reverse=reverse))
+                assert_invariants(self, ll)
+
+    def test_stable_with_key(self):
+        pairs = [(k, i) for i, k in enumerate([3, 1, 2, 1, 3, 2, 1, 0, 3])]
+        for reverse in (False, True):
+            ll = LinkedList(pairs)
+            ll.sort(key=lambda p: p[0], reverse=reverse)
+            assert_contents(self, ll, sorted(pairs, key=lambda p: p[0], reverse=reverse))
+
+    def test_relinks_existing_nodes(self):
+        ll = LinkedList([5, 3, 9, 1])
+        before = node_ids(ll)
+        ll.sort()
+        self.assertEqual(node_ids(ll), before)
+
+    def test_push_back_after_sort(self):
+        ll = LinkedList([3, 1, 2])
+        ll.sort()
+        ll.push_back(0)
+        assert_contents(self, ll, [1, 2, 3, 0])
+        assert_invariants(self, ll)
+
+    def test_sort_keeps_index_fresh(self):
+        ll = LinkedList([3, 1, 3, 2], indexed=True)
+        ll.sort()
+        self.assertIs(ll.find(3), ll.head.next.next)
+        self.assertTrue(ll.delete(3))
+        assert_contents(self, ll, [1, 2, 3])
+
+    def test_merge(self):
+        a = LinkedList([1, 3, 5, 7])
+        b = LinkedList([2, 3, 4, 8, 9])
+        ids = node_ids(a) | node_ids(b)
+        a.merge(b)
+        assert_contents(self, a, [1, 2, 3, 3, 4, 5, 7, 8, 9])
+        assert_invariants(self, a)
+        assert_contents(self, b, [])
+        assert_invariants(self, b)
+        self.assertEqual(node_ids(a), ids)
+
+    def test_merge_ties_prefer_self_and_reverse(self):
+        a = LinkedList([(3, "a"), (1, "a")])
+        b = LinkedList([(3, "b"), (2, "b"), (1, "b")])
+        a.merge(b, key=lambda p: p[0], reverse=True)
+        assert_contents(self, a, [(3, "a"), (3, "b"), (2, "b"), (1, "a"), (1, "b")])
+
+    def test_merge_with_empty(self):
+        a, b = LinkedList(), LinkedList([1, 2])
+        a.merge(b)
+        assert_contents(self, a, [1, 2])
+        assert_invariants(self, a)
+        a.merge(LinkedList())
+        assert_contents(self, a, [1, 2])
+        with self.assertRaises(ValueError):
+            a.merge(a)
+
+    def test_failed_sort_keeps_every_element(self):
+        def key(v):
+            if v == 3:
+                raise KeyError(v)
+            return v
+
+        cases = [
+            (lambda ll: ll.sort(), [3, 1, "a", 2, 5, 4, 0], TypeError),
+            (lambda ll: ll.sort(key=key), list(range(10, 0, -1)), KeyError),
+            (lambda ll: ll.sort(key=key, reverse=True), list(range(1, 11)), KeyError),
+        ]
+        for sort, values, error in cases:
+            for indexed in (False, True):
+                ll = LinkedList(values, indexed=indexed)
+                with self.assertRaises(error):
+                    sort(ll)
+                assert_invariants(self, ll)
+                self.assertCountEqual(as_list(ll), values)
+                self.assertIs(ll.find(values[0]), linear_find(ll, values[0]))
+
+    def test_failed_merge_leaves_both_lists(self):
+        a = LinkedList([1, 3, 5])
+        b = LinkedList([2, "x", 6])
+        with self.assertRaises(TypeError):
+            a.merge(b)
+        assert_contents(self, a, [1, 3, 5])
+        assert_contents(self, b, [2, "x", 6])
+        assert_invariants(self, a)
+        assert_invariants(self, b)
+        with self.assertRaises(ZeroDivisionError):
+            a.merge(LinkedList([2, 4]), key=lambda v: 1 / (v - 4))
+        assert_contents(self, a, [1, 3, 5])
+
+
+# ----------------------------------------------------------------------
+# Lazy views
+# ----------------------------------------------------------------------
+class TestLinkedListView(unittest.TestCase):
+    def test_pipeline_matches_eager(self):
+        ll = LinkedList(range(20))
+        view = ll.view().map(lambda x: x * 3).filter(lambda x: x % 2).take(4)
+        self.assertIsInstance(view, LinkedListView)
+        self.assertEqual(list(view), [3, 9, 15, 21])
+        # stages do not mutate the source
+        assert_contents(self, ll, list(range(20)))
+
+    def test_lazy_until_iterated(self):
+        calls = []
+        view = LinkedList([1, 2, 3]).view().map(calls.append)
+        self.assertEqual(calls, [])
+        list(view)
+        self.assertEqual(calls, [1, 2, 3])
+
+    def test_take_stops_traversal(self):
+        seen = []
+
+        def record(x):
+            seen.append(x)
+            return x
+
+        ll = LinkedList(range(100_000))
+        self.assertEqual(list(ll.view().map(record).take(10)), list(range(10)))
+        self.assertEqual(len(seen), 10)
+
+        self.assertEqual(list(ll.view().take(0)), [])
+        with self.assertRaises(ValueError):
+            ll.view().take(-1)
+
+    def test_view_is_reusable_and_live(self):
+        ll = LinkedList([1, 2])
+        view = ll.view().map(str)
+        self.assertEqual(list(view), ["1", "2"])
+        ll.push_back(3)
+        self.assertEqual(list(view), ["1", "2", "3"])
+
+    def test_collect_into(self):
+        ll = LinkedList(range(6))
+        out = ll.view().filter(lambda x: x % 2 == 0).collect_into()
+        self.assertIsInstance(out, LinkedList)
+        assert_contents(self, out, [0, 2, 4])
+        assert_invariants(self, out)
+
+        target = LinkedList(["x"], indexed=True)
+        self.assertIs(ll.view().take(2).collect_into(target), target)
+        assert_contents(self, target, ["x", 0, 1])
+        assert_invariants(self, target)
+        self.assertIs(target.find(1), target.tail)
+
+    def test_collect_into_source(self):
+        ll = LinkedList([1, 2, 3])
+        ll.view().map(lambda x: -x).collect_into(ll)
+        assert_contents(self, ll, [1, 2, 3, -1, -2, -3])
+        assert_invariants(self, ll)
+
+
+# ----------------------------------------------------------------------
+# Batched / parallel apply
+# ----------------------------------------------------------------------
+def square(x):
+    return x * x
+
+
+class TestLinkedListApplyBatched(unittest.TestCase):
+    def test_batched_matches_apply(self):
+        for n in (0, 1, 7, 8, 9, 50):
+            for batch_size in (1, 3, 8, 100):
+                ll = LinkedList(range(n))
+                ll.apply_batched(lambda xs: [x * x for x in xs], batch_size)
+                assert_contents(self, ll, [x * x for x in range(n)])
+                assert_invariants(self, ll)
+
+    def test_batch_sizes_seen(self):
+        sizes = []
+
+        def record(xs):
+            sizes.append(len(xs))
+            return xs
+
+        LinkedList(range(10)).apply_batched(record, 4)
+        self.assertEqual(sizes, [4, 4, 2])
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_batched_numpy_ufunc(self):
+        ll = LinkedList([1.0, 4.0, 9.0, 16.0, 25.0])
+        ll.apply_batched(np.sqrt, 2)
+        assert_contents(self, ll, [1.0, 2.0, 3.0, 4.0, 5.0])
+        self.assertIs(type(ll.head.data), float)
+
+    def test_batched_length_mismatch(self):
+        ll = LinkedList(range(5))
+        with self.assertRaises(ValueError):
+            ll.apply_batched(lambda xs: xs[:-1], 2)
+        with self.assertRaises(ValueError):
+            ll.apply_batched(square, 0)
+
+    def test_batched_keeps_index_fresh(self):
+        ll = LinkedList([1, 2, 3], indexed=True)
+        ll.apply_batched(lambda xs: [-x for x in xs], 2)
+        self.assertIs(ll.find(-3), ll.tail)
+        self.assertIsNone(ll.find(3))
+
+    def test_parallel_matches_apply(self):
+        values = list(range(-50, 50))
+        for pool in ("thread", "process"):
+            ll = LinkedList(values, indexed=True)
+            ll.apply_parallel(square, workers=2, batch_size=7, pool=pool)
+            assert_contents(self, ll, [square(v) for v in values])
+            assert_invariants(self, ll)
+            self.assertIs(ll.find(50 * 50), ll.head)
+
+    def test_parallel_inline_paths(self):
+        # a lambda can't be pickled, so these must not reach a process pool
+        ll = LinkedList(range(5))
+        ll.apply_parallel(lambda x: x + 1, workers=1, batch_size=2)
+        ll.apply_parallel(lambda x: x + 1, workers=4)
+        assert_contents(self, ll, [2, 3, 4, 5, 6])
+
+    def test_parallel_bad_arguments(self):
+        ll = LinkedList(range(5))
+        with self.assertRaises(ValueError):
+            ll.apply_parallel(square, pool="fiber")
+        with self.assertRaises(ValueError):
+            ll.apply_parallel(square, batch_size=0)
+
+
+# ----------------------------------------------------------------------
+# Binary dump / load
+# ----------------------------------------------------------------------
+class TestLinkedListDump(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".llst")
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def roundtrip(self, values, typecode=None):
+        LinkedList(values).dump(self.path, typecode)
+        with LinkedList.load(self.path) as view:
+            self.assertIsInstance(view, MappedLinkedList)
+            self.assertEqual(len(view), len(values))
+            self.assertEqual(list(view), values)
+        ll = LinkedList.load(self.path, mmap=False)
+        self.assertIsInstance(ll, LinkedList)
+        assert_contents(self, ll, values)
+        assert_invariants(self, ll)
+        return ll
+
+    def test_roundtrip_default_typecodes(self):
+        self.roundtrip([3, -1, 2**62, 0])
+        self.roundtrip([0.5, -2.25, 1e300])
+        self.roundtrip([b"abc", b"\x00\x01\x02", b"xyz"])
+        self.roundtrip([])
+
+    def test_roundtrip_explicit_typecodes(self):
+        self.roundtrip([1, 2, 255], "B")
+        self.roundtrip([-7, 7], "i")
+        self.roundtrip([1.5, 2.5], "f")
+
+    def test_mapped_view_is_read_only_and_indexable(self):
+        LinkedList(range(100)).dump(self.path)
+        view = LinkedList.load(self.path)
+        self.assertEqual(view[0], 0)
+        self.assertEqual(view[-1], 99)
+        with self.assertRaises(IndexError):
+            view[100]
+        self.assertIn(42, view)
+        self.assertNotIn(100, view)
+        with self.assertRaises(TypeError):
+            view[0] = 1
+        self.assertFalse(hasattr(view, "push_back"))
+        view.close()
+
+    def test_mapped_bytes_indexing(self):
+        LinkedList([b"aa", b"bb", b"cc"]).dump(self.path)
+        with LinkedList.load(self.path) as view:
+            self.assertEqual(view[1], b"bb")
+            self.assertEqual(view[-1], b"cc")
+
+    def test_roundtrip_empty_bytes(self):
+        self.roundtrip([b"", b""])
+        self.roundtrip([], typecode="s")
+        with LinkedList.load(self.path) as view:
+            self.assertNotIn(b"", view)
+
+    def test_rejects_unsupported_payloads(self):
+        with self.assertRaises(ValueError):
+            LinkedList([b"aa", b"b"]).dump(self.path)
+        with self.assertRaises(ValueError):
+            LinkedList([1]).dump(self.path, "u")
+        with self.assertRaises(OverflowError):
+            LinkedList([1000]).dump(self.path, "b")
+        with self.assertRaises(TypeError):
+            LinkedList([1, "x"]).dump(self.path)
+
+    def test_rejects_bad_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a dump at all, really not one")
+        with self.assertRaises(ValueError):
+            LinkedList.load(self.path)
+
+        LinkedList(range(10)).dump(self.path)
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 1)
+        with self.assertRaises(ValueError):
+            LinkedList.load(self.path)
+
+    def test_pickle_long_list(self):
+        n = 20_000  # deeper than the default recursion limit
+        ll = LinkedList(range(n), stack_safe=True, indexed=True)
+        copy = pickle.loads(pickle.dumps(ll))
+        self.assertEqual(list(copy), list(range(n)))
+        assert_invariants(self, copy)
+        self.assertTrue(copy.stack_safe)
+        self.assertIs(copy.find(n - 1), copy.tail)
+
+
+# ----------------------------------------------------------------------
+# Cycles, positions and splitting
+# ----------------------------------------------------------------------
+def make_cycle(n: int, entry: int) -> tuple:
+    """Return a checked list of n nodes whose tail links back to node `entry`."""
+    ll = LinkedList(range(n), checked=True)
+    target = ll.head
+    for _ in range(entry):
+        target = target.next
+    ll.tail.next = target
+    return ll, target
+
+
+class TestLinkedListStructure(unittest.TestCase):
+    def test_find_cycle(self):
+        for algorithm in ("brent", "floyd"):
+            self.assertIsNone(LinkedList().find_cycle(algorithm))
+            self.assertIsNone(LinkedList(range(10)).find_cycle(algorithm))
+            for n, entry in [(1, 0), (2, 1), (10, 0), (10, 9), (37, 12)]:
+                ll, target = make_cycle(n, entry)
+                self.assertIs(ll.find_cycle(algorithm), target, (algorithm, n, entry))
+        with self.assertRaises(ValueError):
+            LinkedList().find_cycle("hare")
+
+    def test_validate(self):
+        LinkedList().validate()
+        ll = LinkedList(range(5))
+        ll.validate()
+
+        ll.tail.next = ll.head.next
+        with self.assertRaisesRegex(CorruptedListError, "cycle of 4 nodes"):
+            ll.validate()
+
+        ll = LinkedList(range(5))
+        ll.head.next.next = None  # nodes unlinked behind the list's back
+        with self.assertRaisesRegex(CorruptedListError, "2 nodes"):
+            ll.validate()
+
+        ll = LinkedList(range(5))
+        ll.tail.next = LinkedList([9]).head  # linked on, tail not updated
+        with self.assertRaises(CorruptedListError):
+            ll.validate()
+
+    def test_checked_mode_raises_instead_of_hanging(self):
+        ll, _ = make_cycle(50, 20)
+        with self.assertRaises(CorruptedListError):
+            list(ll)
+        with self.assertRaises(CorruptedListError):
+            repr(ll)
+        for call in (
+            lambda: ll.find(-1),
+            lambda: -1 in ll,
+            lambda: ll.delete(-1),
+            lambda: ll.find_recursive(-1),
+            lambda: ll.length_recursive(),
+            lambda: ll.reverse(),
+            lambda: ll.apply(abs),
+            lambda: ll.sort(),
+            lambda: ll.split_half(),
+        ):
+            with self.assertRaises(CorruptedListError):
+                call()
+
+        short = LinkedList(range(5), checked=True)
+        short.head.next = None
+        with self.assertRaisesRegex(CorruptedListError, "ends after 1 of 5"):
+            list(short)
+
+    def test_checked_mode_behaves_normally(self):
+        ll = LinkedList(range(10), checked=True)
+        ll.push_back(10)
+        ll.push_front(-1)
+        self.assertTrue(ll.delete(5))
+        ll.reverse()
+        ll.sort()
+        self.assertEqual(ll.find(7).data, 7)
+        self.assertEqual(ll.length_recursive(), 11)
+        assert_contents(self, ll, [-1, 0, 1, 2, 3, 4, 6, 7, 8, 9, 10])
+        self.assertTrue(pickle.loads(pickle.dumps(ll)).checked)
+        self.assertFalse(LinkedList().checked)
+
+    def test_middle(self):
+        self.assertIsNone(LinkedList().middle())
+        for n in range(1, 9):
+            self.assertEqual(LinkedList(range(n)).middle().data, n // 2)
+
+    def test_kth_from_end(self):
+        ll = LinkedList(range(10))
+        self.assertIs(ll.kth_from_end(1), ll.tail)
+        self.assertIs(ll.kth_from_end(10), ll.head)
+        self.assertEqual(ll.kth_from_end(3).data, 7)
+        for k in (0, 11, -1):
+            with self.assertRaises(IndexError):
+                ll.kth_from_end(k)
+
+    def test_split_at(self):
+        for index in range(-12, 13):
+            ll = LinkedList(range(10), stack_safe=True)
+            ids = node_ids(ll)
+            rest = ll.split_at(index)
+            expected = list(range(10))
+            assert_contents(self, ll, expected[:index])
+            assert_contents(self, rest, expected[index:])
+            assert_invariants(self, ll)
+            assert_invariants(self, rest)
+            self.assertEqual(node_ids(ll) | node_ids(rest), ids)  # moved, not copied
+            self.assertTrue(rest.stack_safe)
+            ll.push_back("x")
+            rest.push_back("y")
+            self.assertEqual(list(ll)[-1], "x")
+            self.assertEqual(list(rest)[-1], "y")
+
+    def test_split_half(self):
+        for n in range(6):
+            ll = LinkedList(range(n))
+            rest = ll.split_half()
+            assert_contents(self, ll, list(range((n + 1) // 2)))
+            assert_contents(self, rest, list(range((n + 1) // 2, n)))
+
+    def test_split_indexed(self):
+        ll = LinkedList([1, 2, 3, 1, 2], indexed=True)
+        rest = ll.split_at(3)
+        self.assertTrue(rest.indexed)
+        self.assertIs(ll.find(1), ll.head)
+        self.assertIs(rest.find(1), rest.head)
+        self.assertTrue(rest.delete(2))
+        self.assertFalse(ll.delete(99))
+        assert_contents(self, ll, [1, 2, 3])
+        assert_contents(self, rest, [1])
+
+
+# ----------------------------------------------------------------------
+# Node pool
+# ----------------------------------------------------------------------
+class TestLinkedListPool(unittest.TestCase):
+    def test_pop_front_recycles_nodes(self):
+        pool = NodePool()
+        ll = LinkedList(pool=pool)
+        self.assertIs(ll.pool, pool)
+        self.assertIsNone(LinkedList().pool)
+        ll.push_back(1)
+        first = ll.head
+        self.assertEqual(ll.pop_front(), 1)
+        self.assertEqual(len(pool), 1)
+        self.assertIsNone(first.data)  # the value is not kept alive by the pool
+        ll.push_front(2)
+        self.assertIs(ll.head, first)
+        self.assertEqual(pool.stats(), {
+            "hits": 1, "misses": 1, "recycled": 1, "dropped": 0,
+            "free": 0, "cap": 1024, "hit_rate": 0.5,
+        })
+        assert_invariants(self, ll)
+
+    def test_cap_and_clear(self):
+        pool = NodePool(cap=2)
+        ll = LinkedList(range(5), pool=pool)
+        self.assertEqual(pool.misses, 5)
+        while len(ll):
+            ll.pop_front()
+        self.assertEqual((len(pool), pool.recycled, pool.dropped), (2, 2, 3))
+        pool.clear()
+        self.assertEqual(len(pool), 0)
+        self.assertEqual(pool.recycled, 2)
+        self.assertEqual(NodePool(cap=0).stats()["hit_rate"], 0.0)
+        with self.assertRaises(ValueError):
+            NodePool(cap=-1)
+
+    def test_delete_recycles_nodes(self):
+        for indexed in (False, True):
+            pool = NodePool()
+            ll = LinkedList([1, 2, 3, 2], indexed=indexed, pool=pool)
+            self.assertTrue(ll.delete(2))
+            self.assertTrue(ll.delete(2))
+            self.assertFalse(ll.delete(9))
+            self.assertEqual(pool.recycled, 2)
+            ll.extend([4, 5])
+            ll.push_back_recursive(6)
+            self.assertEqual(pool.hits, 2)
+            assert_contents(self, ll, [1, 3, 4, 5, 6])
+            assert_invariants(self, ll)
+            for v in (1, 3, 4, 5, 6):
+                self.assertIs(ll.find(v), linear_find(ll, v))
+
+    def test_churn_matches_plain_list(self):
+        rng = random.Random(7)
+        pool = NodePool(cap=8)
+        plain = LinkedList(stack_safe=True)
+        pooled = LinkedList(stack_safe=True, pool=pool)
+        other = LinkedList(pool=pool)  # pools may be shared
+        for _ in range(3_000):
+            op = rng.randrange(6)
+            v = rng.randrange(10)
+            for ll in (plain, pooled):
+                if op == 0:
+                    ll.push_front(v)
+                elif op == 1:
+                    ll.push_back(v)
+                elif op == 2:
+                    ll.push_back_recursive(v)
+                elif op == 3 and len(ll):
+                    ll.pop_front()
+                elif op == 4:
+                    ll.delete(v)
+            if op == 5:
+                other.push_back(v)
+                if len(other) > 3:
+                    other.pop_front()
+        assert_contents(self, pooled, as_list(plain))
+        assert_invariants(self, pooled)
+        self.assertGreater(pool.hits, 0)
+        self.assertLessEqual(len(pool), 8)
+
+    def test_unhashable_insert_returns_nodes(self):
+        pool = NodePool()
+        ll = LinkedList([1, 2], indexed=True, pool=pool)
+        for op in (ll.push_front, ll.push_back, ll.push_back_recursive):
+            with self.assertRaises(TypeError):
+                op([3])
+        with self.assertRaises(TypeError):
+            ll.extend([3, [4], 5])
+        # every node handed out went back, except the list's own two
+        self.assertEqual(pool.hits + pool.misses - pool.recycled - pool.dropped, 2)
+        self.assertEqual(len(pool), 3)
+        assert_contents(self, ll, [1, 2])
+        assert_invariants(self, ll)
+
+    def test_split_shares_pool(self):
+        pool = NodePool()
+        ll = LinkedList(range(4), pool=pool)
+        rest = ll.split_half()
+        self.assertIs(rest.pool, pool)
+        rest.pop_front()
+        self.assertEqual(len(pool), 1)
+
+
 if __name__ == "__main__":
     unittest.main()
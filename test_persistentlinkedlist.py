@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unittest suite for PersistentLinkedList (immutable, structurally shared).
+"""
+
+import pickle
+import random
+import threading
+import unittest
+
+from persistentlinkedlist import PersistentLinkedList
+
+
+def nodes(pl: PersistentLinkedList) -> list:
+    out, cur = [], pl.head
+    while cur:
+        out.append(cur)
+        cur = cur.next
+    return out
+
+
+class TestPersistentLinkedList(unittest.TestCase):
+    def test_construction(self):
+        self.assertEqual(list(PersistentLinkedList()), [])
+        pl = PersistentLinkedList(range(5))
+        self.assertEqual(list(pl), [0, 1, 2, 3, 4])
+        self.assertEqual(len(pl), 5)
+        self.assertEqual(repr(PersistentLinkedList([1, "a"])), "PersistentLinkedList([1, 'a'])")
+
+    def test_push_front_shares_everything(self):
+        base = PersistentLinkedList([1, 2, 3])
+        new = base.push_front(0)
+        self.assertEqual(list(new), [0, 1, 2, 3])
+        self.assertEqual(list(base), [1, 2, 3])
+        self.assertIs(new.head.next, base.head)
+        self.assertEqual(list(base.cons(9)), [9, 1, 2, 3])
+
+    def test_pop_front_shares_rest(self):
+        base = PersistentLinkedList([1, 2, 3])
+        value, rest = base.pop_front()
+        self.assertEqual(value, 1)
+        self.assertEqual(list(rest), [2, 3])
+        self.assertIs(rest.head, base.head.next)
+        self.assertEqual(list(base), [1, 2, 3])
+        with self.assertRaises(IndexError):
+            PersistentLinkedList().pop_front()
+
+    def test_insert_copies_only_prefix(self):
+        base = PersistentLinkedList(range(6))
+        new = base.insert(2, "x")
+        self.assertEqual(list(new), [0, 1, "x", 2, 3, 4, 5])
+        self.assertEqual(list(base), list(range(6)))
+        self.assertIs(nodes(new)[3], nodes(base)[2])
+        for index in (0, -2, 6, 100, -100):
+            expected = list(range(6))
+            expected.insert(index, "y")
+            self.assertEqual(list(base.insert(index, "y")), expected)
+
+    def test_set_copies_only_prefix(self):
+        base = PersistentLinkedList(range(6))
+        new = base.set(3, "x")
+        self.assertEqual(list(new), [0, 1, 2, "x", 4, 5])
+        self.assertEqual(list(base), list(range(6)))
+        self.assertIs(nodes(new)[4], nodes(base)[4])
+        self.assertEqual(list(base.set(-1, "z")), [0, 1, 2, 3, 4, "z"])
+        for index in (6, -7):
+            with self.assertRaises(IndexError):
+                base.set(index, 0)
+
+    def test_delete(self):
+        base = PersistentLinkedList([1, 2, 3, 2, 4])
+        new = base.delete(2)
+        self.assertEqual(list(new), [1, 3, 2, 4])
+        self.assertEqual(len(new), 4)
+        self.assertIs(nodes(new)[1], nodes(base)[2])
+        self.assertIs(base.delete(99), base)
+        self.assertEqual(list(base.delete(1)), [2, 3, 2, 4])
+        self.assertIs(base.delete(1).head, base.head.next)
+
+    def test_full_copies(self):
+        base = PersistentLinkedList([1, 2, 3])
+        self.assertEqual(list(base.push_back(4)), [1, 2, 3, 4])
+        self.assertEqual(list(base.extend([4, 5])), [1, 2, 3, 4, 5])
+        self.assertIs(base.extend([]), base)
+        self.assertEqual(list(PersistentLinkedList().push_back(1)), [1])
+        self.assertEqual(list(base.reverse()), [3, 2, 1])
+        self.assertEqual(list(base.apply(lambda x: x * 10)), [10, 20, 30])
+        self.assertEqual(list(base), [1, 2, 3])
+
+    def test_find_and_contains(self):
+        pl = PersistentLinkedList([5, 6, 7])
+        self.assertEqual(pl.find(6).data, 6)
+        self.assertIsNone(pl.find(8))
+        self.assertIn(7, pl)
+        self.assertNotIn(8, pl)
+
+    def test_equality_and_hash(self):
+        a = PersistentLinkedList(range(100))
+        b = a.set(50, "x").set(50, 50)
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertNotEqual(a, a.set(99, -1))
+        self.assertNotEqual(a, a.push_back(1))
+        self.assertEqual(PersistentLinkedList(), PersistentLinkedList())
+        self.assertEqual(len({a, b, a.pop_front()[1]}), 2)
+        self.assertNotEqual(a, list(range(100)))
+
+    def test_pickle_long_list(self):
+        pl = PersistentLinkedList(range(50_000))
+        self.assertEqual(pickle.loads(pickle.dumps(pl)), pl)
+
+    def test_versions_are_independent(self):
+        rng = random.Random(3)
+        version = PersistentLinkedList()
+        history = [(version, [])]
+        for _ in range(500):
+            values = list(history[-1][1])
+            op = rng.randrange(5)
+            if op == 0:
+                v = rng.randrange(20)
+                version, values = version.push_front(v), [v] + values
+            elif op == 1 and values:
+                value, version = version.pop_front()
+                self.assertEqual(value, values.pop(0))
+            elif op == 2:
+                i, v = rng.randrange(len(values) + 1), rng.randrange(20)
+                version = version.insert(i, v)
+                values.insert(i, v)
+            elif op == 3 and values:
+                i = rng.randrange(len(values))
+                version = version.set(i, -i)
+                values[i] = -i
+            else:
+                v = rng.randrange(20)
+                version = version.delete(v)
+                if v in values:
+                    values.remove(v)
+            history.append((version, values))
+
+        for version, values in history:
+            self.assertEqual(list(version), values)
+            self.assertEqual(len(version), len(values))
+
+    def test_concurrent_readers(self):
+        snapshot = PersistentLinkedList(range(1_000))
+        errors = []
+
+        def reader():
+            for _ in range(50):
+                if sum(snapshot) != sum(range(1_000)):
+                    errors.append("torn read")
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        for t in threads:
+            t.start()
+        version = snapshot
+        for i in range(1_000):
+            version = version.set(i % 1_000, -i).push_front(i).pop_front()[1]
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(list(snapshot), list(range(1_000)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unittest suite for SortedLinkedList (skip-list lanes over a Node chain).
+"""
+
+import bisect
+import random
+import unittest
+from typing import List
+
+from sortedlinkedlist import SortedLinkedList
+
+
+def lane_values(sentinel) -> List:
+    """Values on one express lane, in order."""
+    values, lane = [], sentinel.next
+    while lane:
+        values.append(lane.node.data)
+        lane = lane.next
+    return values
+
+
+def assert_consistent(testcase: unittest.TestCase, sll: SortedLinkedList, expected: List):
+    """Check contents, size, tail and that every lane is sorted and points down correctly."""
+    testcase.assertEqual(list(sll), expected)
+    testcase.assertEqual(len(sll), len(expected))
+
+    last, cur, chain = None, sll.head, []
+    while cur:
+        chain.append(cur)
+        last, cur = cur, cur.next
+    testcase.assertIs(sll.tail, last)
+
+    below = {id(n) for n in chain}
+    for sentinel in sll._lanes:
+        entries, lane = [], sentinel.next
+        while lane:
+            testcase.assertIn(id(lane.node), below)
+            if lane.down is not None:
+                testcase.assertIs(lane.down.node, lane.node)
+            entries.append(lane)
+            lane = lane.next
+        testcase.assertTrue(entries, "empty lanes are dropped")
+        keys = [e.node.data for e in entries]
+        testcase.assertEqual(keys, sorted(keys))
+        below = {id(e.node) for e in entries}
+
+
+class TestSortedLinkedList(unittest.TestCase):
+    def test_build_sorts(self):
+        sll = SortedLinkedList([5, 1, 4, 1, 3], seed=1)
+        assert_consistent(self, sll, [1, 1, 3, 4, 5])
+        self.assertEqual(repr(sll), "SortedLinkedList([1, 1, 3, 4, 5])")
+        assert_consistent(self, SortedLinkedList(), [])
+
+    def test_insert_keeps_order(self):
+        rng = random.Random(7)
+        sll = SortedLinkedList(seed=7)
+        expected = []
+        for _ in range(500):
+            v = rng.randrange(100)
+            node = sll.insert(v)
+            self.assertEqual(node.data, v)
+            bisect.insort(expected, v)
+        assert_consistent(self, sll, expected)
+        self.assertGreater(sll.height, 1)
+
+    def test_equal_values_keep_insertion_order(self):
+        sll = SortedLinkedList(seed=3)
+        items = [(2, "x"), (1, "a"), (1, "b"), (0, "z"), (1, "c")]
+
+        class Key:
+            def __init__(self, k, tag):
+                self.k, self.tag = k, tag
+
+            def __lt__(self, other):
+                return self.k < other.k
+
+            def __eq__(self, other):
+                return self.k == other.k
+
+        for k, tag in items:
+            sll.insert(Key(k, tag))
+        self.assertEqual([x.tag for x in sll], ["z", "a", "b", "c", "x"])
+        # find / delete hit the first of the equal values
+        self.assertEqual(sll.find(Key(1, "?")).data.tag, "a")
+        self.assertTrue(sll.delete(Key(1, "?")))
+        self.assertEqual([x.tag for x in sll], ["z", "b", "c", "x"])
+
+    def test_find_and_contains(self):
+        sll = SortedLinkedList(range(0, 1000, 3), seed=5)
+        for v in range(1000):
+            node = sll.find(v)
+            if v % 3 == 0:
+                self.assertEqual(node.data, v)
+                self.assertIn(v, sll)
+            else:
+                self.assertIsNone(node)
+                self.assertNotIn(v, sll)
+        self.assertIsNone(SortedLinkedList().find(1))
+
+    def test_delete(self):
+        rng = random.Random(11)
+        values = [rng.randrange(50) for _ in range(300)]
+        sll = SortedLinkedList(values, seed=11)
+        expected = sorted(values)
+        for v in values[::2] + [1000, -1]:
+            removed = sll.delete(v)
+            self.assertEqual(removed, v in expected)
+            if removed:
+                expected.remove(v)
+        assert_consistent(self, sll, expected)
+
+        for v in list(expected):
+            self.assertTrue(sll.delete(v))
+        assert_consistent(self, sll, [])
+        self.assertEqual(sll.height, 0)
+        sll.insert(4)
+        assert_consistent(self, sll, [4])
+
+    def test_delete_tail(self):
+        sll = SortedLinkedList([1, 2, 3], seed=0)
+        self.assertTrue(sll.delete(3))
+        assert_consistent(self, sll, [1, 2])
+        sll.insert(9)
+        assert_consistent(self, sll, [1, 2, 9])
+
+    def test_pop_front(self):
+        sll = SortedLinkedList([3, 1, 2], seed=0)
+        self.assertEqual([sll.pop_front() for _ in range(3)], [1, 2, 3])
+        with self.assertRaises(IndexError):
+            sll.pop_front()
+
+    def test_range(self):
+        sll = SortedLinkedList(range(0, 100, 2), seed=2)
+        self.assertEqual(list(sll.range(10, 20)), [10, 12, 14, 16, 18])
+        self.assertEqual(list(sll.range(11, 15)), [12, 14])
+        self.assertEqual(list(sll.range(None, 5)), [0, 2, 4])
+        self.assertEqual(list(sll.range(95)), [96, 98])
+        self.assertEqual(list(sll.range(50, 50)), [])
+        self.assertEqual(list(sll.range()), list(range(0, 100, 2)))
+
+    def test_seed_makes_lanes_deterministic(self):
+        def shape(sll):
+            return [lane_values(s) for s in sll._lanes]
+
+        a = SortedLinkedList(range(200), seed=42)
+        b = SortedLinkedList(range(200), seed=42)
+        self.assertEqual(shape(a), shape(b))
+        for v in (500, -3, 77):
+            a.insert(v)
+            b.insert(v)
+        self.assertEqual(shape(a), shape(b))
+
+    def test_lanes_thin_out_geometrically(self):
+        sll = SortedLinkedList(range(10_000), seed=9)
+        sizes = [len(lane_values(s)) for s in sll._lanes]
+        self.assertGreaterEqual(len(sizes), 5)
+        # each lane holds about a quarter of the one below
+        self.assertTrue(1_500 < sizes[0] < 3_500, sizes)
+        self.assertTrue(all(upper < lower for lower, upper in zip(sizes, sizes[1:])), sizes)
+
+
+if __name__ == "__main__":
+    unittest.main()
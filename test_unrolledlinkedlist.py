@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unittest suite for UnrolledLinkedList, run at several block sizes.
+"""
+
+import random
+import unittest
+from typing import List
+
+from unrolledlinkedlist import UnrolledLinkedList
+
+
+def assert_contents(testcase: unittest.TestCase, ll: UnrolledLinkedList, expected: List):
+    """Assert `ll` holds `expected` and its blocks are non-empty, within capacity and linked to the tail."""
+    testcase.assertEqual(list(ll), expected)
+    testcase.assertEqual(len(ll), len(expected))
+    testcase.assertEqual(ll.length_recursive(), len(expected))
+
+    last, block = None, ll._head
+    while block:
+        testcase.assertTrue(0 < len(block.values) <= ll.block_size)
+        last, block = block, block.next
+    testcase.assertIs(ll._tail, last)
+    if expected:
+        testcase.assertEqual(ll.head.data, expected[0])
+        testcase.assertEqual(ll.tail.data, expected[-1])
+    else:
+        testcase.assertIsNone(ll.head)
+        testcase.assertIsNone(ll.tail)
+
+
+class UnrolledLinkedListMixin:
+    """Shared behaviour checks, run once per block size."""
+
+    block_size = None
+
+    def make(self, values=(), **kwargs):
+        return UnrolledLinkedList(values, block_size=self.block_size, **kwargs)
+
+    def test_push_front_and_back(self):
+        ll = self.make()
+        ll.push_back(2)
+        ll.push_front(1)
+        ll.push_back_recursive(3)
+        for v in range(4, 20):
+            ll.push_back(v)
+        for v in range(0, -10, -1):
+            ll.push_front(v)
+        ll.push_back_recursive(20)
+        assert_contents(self, ll, list(range(-9, 21)))
+
+    def test_pop_front(self):
+        ll = self.make(range(10))
+        self.assertEqual([ll.pop_front() for _ in range(10)], list(range(10)))
+        assert_contents(self, ll, [])
+        with self.assertRaises(IndexError):
+            ll.pop_front()
+
+    def test_delete_head_middle_tail(self):
+        for method in ("delete", "delete_recursive"):
+            ll = self.make(range(1, 11))
+            delete = getattr(ll, method)
+            self.assertTrue(delete(1))
+            self.assertTrue(delete(5))
+            self.assertTrue(delete(10))
+            self.assertFalse(delete(999))
+            assert_contents(self, ll, [2, 3, 4, 6, 7, 8, 9])
+            ll.push_back(11)
+            assert_contents(self, ll, [2, 3, 4, 6, 7, 8, 9, 11])
+
+    def test_find(self):
+        ll = self.make([5, 6, 7, 6, 8])
+        for method in ("find", "find_recursive"):
+            ref = getattr(ll, method)(6)
+            self.assertEqual(ref.data, 6)
+            self.assertEqual(ref.next.data, 7)
+            self.assertIsNone(getattr(ll, method)(42))
+        self.assertIn(8, ll)
+        self.assertNotIn(9, ll)
+        ll.find(8).data = 80
+        assert_contents(self, ll, [5, 6, 7, 6, 80])
+
+    def test_insert_splits_blocks(self):
+        ll = self.make(range(10))
+        expected = list(range(10))
+        for index, value in [(0, "a"), (5, "b"), (len(expected) + 1, "c"), (3, "d"), (-1, "e"), (100, "f")]:
+            ll.insert(index, value)
+            expected.insert(index, value)
+            assert_contents(self, ll, expected)
+
+    def test_reverse(self):
+        for method in ("reverse", "reverse_recursive"):
+            ll = self.make(range(11))
+            getattr(ll, method)()
+            assert_contents(self, ll, list(range(10, -1, -1)))
+            ll.push_back(-1)
+            assert_contents(self, ll, list(range(10, -2, -1)))
+
+    def test_apply(self):
+        for method in ("apply", "apply_recursive"):
+            ll = self.make(range(9))
+            getattr(ll, method)(lambda x: x * x)
+            assert_contents(self, ll, [x * x for x in range(9)])
+
+    def test_extend_tops_up_tail(self):
+        ll = self.make([1])
+        ll.extend(range(2, 2 * self.block_size))
+        ll.extend([])
+        assert_contents(self, ll, list(range(1, 2 * self.block_size)))
+        self.assertEqual(ll.block_count(), 2)
+
+    def test_from_sequence(self):
+        ll = UnrolledLinkedList.from_sequence(list(range(25)), block_size=self.block_size)
+        assert_contents(self, ll, list(range(25)))
+        self.assertEqual(ll.block_count(), -(-25 // self.block_size))
+
+    def test_random_ops_match_list(self):
+        rng = random.Random(self.block_size)
+        ll, expected = self.make(), []
+        for _ in range(2_000):
+            op = rng.randrange(5)
+            v = rng.randrange(30)
+            if op == 0:
+                ll.push_back(v)
+                expected.append(v)
+            elif op == 1:
+                ll.push_front(v)
+                expected.insert(0, v)
+            elif op == 2:
+                i = rng.randrange(len(expected) + 1)
+                ll.insert(i, v)
+                expected.insert(i, v)
+            elif op == 3:
+                self.assertEqual(ll.delete(v), v in expected)
+                if v in expected:
+                    expected.remove(v)
+            elif expected:
+                self.assertEqual(ll.pop_front(), expected.pop(0))
+        assert_contents(self, ll, expected)
+
+    def test_deletes_keep_blocks_dense(self):
+        n = 50 * self.block_size
+        ll = self.make(range(n))
+        for v in range(0, n, 2):
+            ll.delete(v)
+        # merging / borrowing keeps the block count near n / (block_size / 2)
+        self.assertLessEqual(ll.block_count(), 2 * (n // 2) // self.block_size + 2)
+        assert_contents(self, ll, list(range(1, n, 2)))
+
+    def test_stack_safe_deep(self):
+        n = 20_000 * self.block_size // 2
+        ll = self.make(range(n), stack_safe=True)
+        self.assertEqual(ll.length_recursive(), n)
+        self.assertEqual(ll.find_recursive(n - 1).data, n - 1)
+        ll.push_back_recursive(n)
+        self.assertTrue(ll.delete_recursive(n))
+        ll.apply_recursive(lambda x: -x)
+        ll.reverse_recursive()
+        self.assertEqual(ll.head.data, -(n - 1))
+        self.assertEqual(ll.tail.data, 0)
+
+
+class TestUnrolledLinkedListTiny(UnrolledLinkedListMixin, unittest.TestCase):
+    block_size = 2
+
+
+class TestUnrolledLinkedListSmall(UnrolledLinkedListMixin, unittest.TestCase):
+    block_size = 5
+
+
+class TestUnrolledLinkedListDefault(UnrolledLinkedListMixin, unittest.TestCase):
+    block_size = 64
+
+    def test_repr_and_validation(self):
+        self.assertEqual(repr(self.make([1, "a"])), "UnrolledLinkedList([1, 'a'])")
+        with self.assertRaises(ValueError):
+            UnrolledLinkedList(block_size=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,504 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unrolled singly-linked list: each node holds a small list of values,
+so traversal follows one pointer per block instead of per element and
+searching a block runs in C.
+"""
+
+from __future__ import annotations
+
+from itertools import chain
+from typing import Any, Callable, Generator, Iterable, Iterator, Optional, Sequence
+
+from linkedlist import _trampoline
+
+DEFAULT_BLOCK_SIZE = 64
+
+
+class _Block:
+    """A chain node holding up to `block_size` values."""
+
+    __slots__ = ("values", "next")
+
+    def __init__(self, values: list, nxt: Optional[_Block] = None) -> None:
+        self.values: list = values
+        self.next: Optional[_Block] = nxt
+
+
+class ItemRef:
+    """A handle to one value, mirroring `Node`'s data/next.
+
+    Only valid until the list's next insertion or deletion, which may
+    move values between blocks.
+    """
+
+    __slots__ = ("_block", "index")
+
+    def __init__(self, block: _Block, index: int) -> None:
+        self._block = block
+        self.index = index
+
+    @property
+    def data(self) -> Any:
+        return self._block.values[self.index]
+
+    @data.setter
+    def data(self, value: Any) -> None:
+        self._block.values[self.index] = value
+
+    @property
+    def next(self) -> Optional[ItemRef]:
+        if self.index + 1 < len(self._block.values):
+            return ItemRef(self._block, self.index + 1)
+        return ItemRef(self._block.next, 0) if self._block.next else None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ItemRef):
+            return NotImplemented
+        return self._block is other._block and self.index == other.index
+
+    def __hash__(self) -> int:
+        return hash((id(self._block), self.index))
+
+    def __repr__(self) -> str:
+        return f"ItemRef({self.data!r})"
+
+
+class UnrolledLinkedList:
+    """
+    Singly-linked list with the same public API as `LinkedList`, storing
+    up to `block_size` values per chain node.
+
+    Appends fill the tail block before starting a new one. `insert` splits
+    a full block in half; deletions merge a block that drops below half
+    full into its successor, or refill it from there, so blocks stay at
+    least half full on average. `find`, `head` and `tail` return `ItemRef`
+    handles instead of nodes.
+    """
+
+    stack_safe: bool = False
+
+    # -----------------------------------------------------------------
+    # Construction / basic protocol
+    # -----------------------------------------------------------------
+    def __init__(
+        self,
+        iterable: Optional[Iterable[Any]] = None,
+        *,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        stack_safe: bool = False,
+    ) -> None:
+        """Create an empty list (or initialise from an iterable)."""
+        if block_size < 2:
+            raise ValueError("block_size must be at least 2")
+        self.block_size = block_size
+        self._head: Optional[_Block] = None
+        self._tail: Optional[_Block] = None
+        self._size = 0
+        if stack_safe:
+            self.stack_safe = True
+        if iterable is not None:
+            self.extend(iterable)
+
+    @classmethod
+    def from_sequence(
+        cls, seq: Sequence[Any], *, block_size: int = DEFAULT_BLOCK_SIZE
+    ) -> UnrolledLinkedList:
+        """Build a list from a sequence, slicing it straight into blocks."""
+        ll = cls(block_size=block_size)
+        ll._append_blocks([list(seq[i : i + block_size]) for i in range(0, len(seq), block_size)])
+        return ll
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """Append every value of `iterable`, topping up the tail block first."""
+        values = list(iterable)
+        if not values:
+            return
+
+        start = 0
+        if self._tail is not None:
+            start = self.block_size - len(self._tail.values)
+            self._tail.values.extend(values[:start])
+            self._size += min(start, len(values))
+        size = self.block_size
+        self._append_blocks([values[i : i + size] for i in range(start, len(values), size)])
+
+    @property
+    def head(self) -> Optional[ItemRef]:
+        return ItemRef(self._head, 0) if self._head else None
+
+    @property
+    def tail(self) -> Optional[ItemRef]:
+        return ItemRef(self._tail, len(self._tail.values) - 1) if self._tail else None
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the stored values (iterative traversal).
+
+        Python code runs once per block; `chain` steps through each
+        block's values in C.
+        """
+        return chain.from_iterable(self._blocks())
+
+    def __repr__(self) -> str:
+        values = ", ".join(repr(v) for v in self)
+        return f"UnrolledLinkedList([{values}])"
+
+    # -----------------------------------------------------------------
+    # Insertion
+    # -----------------------------------------------------------------
+    def push_front(self, value: Any) -> None:
+        """Insert `value` at the head (iterative)."""
+        head = self._head
+        if head is None or len(head.values) >= self.block_size:
+            self._head = _Block([value], head)
+            if head is None:
+                self._tail = self._head
+        else:
+            head.values.insert(0, value)
+        self._size += 1
+
+    def push_back(self, value: Any) -> None:
+        """Append `value` to the tail (iterative)."""
+        tail = self._tail
+        if tail is None or len(tail.values) >= self.block_size:
+            self._append_blocks([[value]])
+        else:
+            tail.values.append(value)
+            self._size += 1
+
+    def push_back_recursive(self, value: Any) -> None:
+        """Append `value` to the tail (recursive)."""
+
+        def _push_back_rec(block):
+            if not block:
+                self._tail = _Block([value])
+                return self._tail
+
+            if block.next is None and len(block.values) < self.block_size:
+                block.values.append(value)
+                return block
+
+            block.next = _push_back_rec(block.next)
+
+            return block
+
+        if self.stack_safe:
+            self._head = _trampoline(
+                self._push_back_rec(self._head, value), pause_gc=True
+            )
+        else:
+            self._head = _push_back_rec(self._head)
+        self._size += 1
+
+    def insert(self, index: int, value: Any) -> None:
+        """Insert `value` before position `index`, splitting a full block."""
+        if index < 0:
+            index = max(index + self._size, 0)
+        if index >= self._size:
+            self.push_back(value)
+            return
+
+        block = self._head
+        while index > len(block.values):
+            index -= len(block.values)
+            block = block.next
+
+        if len(block.values) >= self.block_size:
+            half = len(block.values) // 2
+            block.next = _Block(block.values[half:], block.next)
+            del block.values[half:]
+            if block is self._tail:
+                self._tail = block.next
+            if index > half:
+                block, index = block.next, index - half
+        block.values.insert(index, value)
+        self._size += 1
+
+    # -----------------------------------------------------------------
+    # Deletion
+    # -----------------------------------------------------------------
+    def pop_front(self) -> Any:
+        """Remove and return the head element (iterative)."""
+        if not self._head:
+            raise IndexError
+
+        value = self._head.values[0]
+        self._remove_at(None, self._head, 0)
+        return value
+
+    def delete(self, value: Any) -> bool:
+        """Delete first element equal to `value` (iterative). Return True if removed."""
+        prev = None
+        block = self._head
+        while block:
+            if value in block.values:
+                self._remove_at(prev, block, block.values.index(value))
+                return True
+            prev = block
+            block = block.next
+
+        return False
+
+    def delete_recursive(self, value: Any) -> bool:
+        """Delete first element equal to `value` (recursive). Return True if removed."""
+
+        def _delete_rec(prev, block):
+            if not block:
+                return False
+
+            if value in block.values:
+                self._remove_at(prev, block, block.values.index(value))
+                return True
+
+            return _delete_rec(block, block.next)
+
+        if self.stack_safe:
+            return _trampoline(self._delete_rec(None, self._head, value))
+        return _delete_rec(None, self._head)
+
+    # -----------------------------------------------------------------
+    # Search
+    # -----------------------------------------------------------------
+    def find(self, value: Any) -> Optional[ItemRef]:
+        """Return a handle to the first element equal to `value` (iterative)."""
+        block = self._head
+        while block:
+            if value in block.values:
+                return ItemRef(block, block.values.index(value))
+            block = block.next
+
+        return None
+
+    def find_recursive(self, value: Any) -> Optional[ItemRef]:
+        """Return a handle to the first element equal to `value` (recursive)."""
+
+        def _find_rec(block):
+            if not block:
+                return None
+
+            if value in block.values:
+                return ItemRef(block, block.values.index(value))
+
+            return _find_rec(block.next)
+
+        if self.stack_safe:
+            return _trampoline(self._find_rec(self._head, value))
+        return _find_rec(self._head)
+
+    def __contains__(self, value: Any) -> bool:
+        return self.find(value) is not None
+
+    # -----------------------------------------------------------------
+    # Size / Length
+    # -----------------------------------------------------------------
+    def __len__(self) -> int:
+        """Return the number of elements (O(1), cached)."""
+        return self._size
+
+    def length_recursive(self) -> int:
+        """Return the number of elements (recursive, one step per block)."""
+
+        def _len_rec(block):
+            if not block:
+                return 0
+
+            return len(block.values) + _len_rec(block.next)
+
+        if self.stack_safe:
+            return _trampoline(self._len_rec(self._head), pause_gc=True)
+        return _len_rec(self._head)
+
+    # -----------------------------------------------------------------
+    # Reverse
+    # -----------------------------------------------------------------
+    def reverse(self) -> None:
+        """Reverse the list in-place: relink the blocks, reverse each one (iterative)."""
+        block = self._head
+        prev = None
+        self._tail = block
+
+        while block:
+            block.values.reverse()
+            block_next = block.next
+            block.next = prev
+            prev = block
+            block = block_next
+
+        self._head = prev
+
+    def reverse_recursive(self) -> None:
+        """Reverse the list in-place (recursive)."""
+
+        def _reverse_rec(block, prev):
+            if not block:
+                return prev
+
+            block.values.reverse()
+            block_next = block.next
+            block.next = prev
+
+            return _reverse_rec(block_next, block)
+
+        self._tail = self._head
+        if self.stack_safe:
+            self._head = _trampoline(self._reverse_rec(self._head, None))
+        else:
+            self._head = _reverse_rec(self._head, None)
+
+    # -----------------------------------------------------------------
+    # Apply a function to each element
+    # -----------------------------------------------------------------
+    def apply(self, func: Callable[[Any], Any]) -> None:
+        """Apply `func` to every stored value (iterative)."""
+        block = self._head
+        while block:
+            block.values = [func(v) for v in block.values]
+            block = block.next
+
+    def apply_recursive(self, func: Callable[[Any], Any]) -> None:
+        """Apply `func` to every stored value (recursive)."""
+
+        def _apply_rec(block):
+            if not block:
+                return
+
+            block.values = [func(v) for v in block.values]
+
+            _apply_rec(block.next)
+
+        if self.stack_safe:
+            _trampoline(self._apply_rec(self._head, func))
+        else:
+            _apply_rec(self._head)
+
+    # -----------------------------------------------------------------
+    # Storage
+    # -----------------------------------------------------------------
+    def block_count(self) -> int:
+        """Return the number of blocks in the chain."""
+        count = 0
+        block = self._head
+        while block:
+            count += 1
+            block = block.next
+        return count
+
+    # -----------------------------------------------------------------
+    # Helper methods (private)
+    # -----------------------------------------------------------------
+    def _blocks(self) -> Iterator[list]:
+        block = self._head
+        while block:
+            yield block.values
+            block = block.next
+
+    def _append_blocks(self, chunks: list[list]) -> None:
+        """Link one new block per (non-empty) chunk onto the tail."""
+        for values in chunks:
+            block = _Block(values)
+            if self._tail is None:
+                self._head = block
+            else:
+                self._tail.next = block
+            self._tail = block
+            self._size += len(values)
+
+    def _remove_at(self, prev: Optional[_Block], block: _Block, index: int) -> None:
+        """Remove ``block.values[index]`` and restore the fill invariant.
+
+        `prev` is the block before `block` (None for the head). An emptied
+        block is unlinked; one under half full absorbs its successor if
+        both fit in one block, else borrows from it up to half full.
+        """
+        values = block.values
+        del values[index]
+        self._size -= 1
+
+        if not values:
+            if prev is None:
+                self._head = block.next
+            else:
+                prev.next = block.next
+            if block is self._tail:
+                self._tail = prev
+            block.next = None
+            return
+
+        half = self.block_size // 2
+        nxt = block.next
+        if len(values) >= half or nxt is None:
+            return
+
+        if len(values) + len(nxt.values) <= self.block_size:
+            values.extend(nxt.values)
+            block.next = nxt.next
+            if nxt is self._tail:
+                self._tail = block
+        else:
+            take = half - len(values)
+            values.extend(nxt.values[:take])
+            del nxt.values[:take]
+
+    # Generator forms of the recursive definitions, driven by
+    # `_trampoline` in stack-safe mode (see `LinkedList` for the protocol).
+    def _push_back_rec(self, block: Optional[_Block], value: Any) -> Generator:
+        if not block:
+            self._tail = _Block([value])
+            return self._tail
+
+        if block.next is None and len(block.values) < self.block_size:
+            block.values.append(value)
+            return block
+
+        block.next = yield self._push_back_rec(block.next, value)
+
+        return block
+
+    def _delete_rec(self, prev: Optional[_Block], block: Optional[_Block], value: Any) -> Generator:
+        if not block:
+            return False
+
+        if value in block.values:
+            self._remove_at(prev, block, block.values.index(value))
+            return True
+
+        return self._delete_rec(block, block.next, value)
+        yield
+
+    def _find_rec(self, block: Optional[_Block], value: Any) -> Generator:
+        if not block:
+            return None
+
+        if value in block.values:
+            return ItemRef(block, block.values.index(value))
+
+        return self._find_rec(block.next, value)
+        yield
+
+    def _len_rec(self, block: Optional[_Block]) -> Generator:
+        if not block:
+            return 0
+
+        return len(block.values) + (yield self._len_rec(block.next))
+
+    def _reverse_rec(self, block: Optional[_Block], prev: Optional[_Block]) -> Generator:
+        if not block:
+            return prev
+
+        block.values.reverse()
+        block_next = block.next
+        block.next = prev
+
+        return self._reverse_rec(block_next, block)
+        yield
+
+    def _apply_rec(self, block: Optional[_Block], func: Callable[[Any], Any]) -> Generator:
+        if not block:
+            return
+
+        block.values = [func(v) for v in block.values]
+
+        return self._apply_rec(block.next, func)
+        yield